@@ -0,0 +1,346 @@
+package handlers
+
+import (
+	"central-storage-system/database"
+	"central-storage-system/models"
+	"errors"
+	"fmt"
+	"net/http"
+	"strings"
+
+	"github.com/gin-gonic/gin"
+	"github.com/gin-gonic/gin/binding"
+	"gorm.io/gorm"
+)
+
+const (
+	// BulkMaxRows 单次批量请求允许的最大行数
+	BulkMaxRows = 5000
+	// bulkChunkSize 每个事务提交的行数（SQLite每次提交都要落盘，按块提交可大幅减少事务数）
+	bulkChunkSize = 500
+)
+
+// BulkRowError 批量操作中某一行的错误，Index为该行在请求数组中的下标
+type BulkRowError struct {
+	Index int    `json:"index"`
+	Error string `json:"error"`
+}
+
+// bulkStatus 全部成功返回successStatus，有失败行时返回207
+func bulkStatus(rowErrors []BulkRowError, successStatus int) int {
+	if len(rowErrors) > 0 {
+		return http.StatusMultiStatus
+	}
+	return successStatus
+}
+
+// validateBulkSize 校验批量请求的行数
+func validateBulkSize(c *gin.Context, count int) bool {
+	if count == 0 {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "No rows provided"})
+		return false
+	}
+	if count > BulkMaxRows {
+		c.JSON(http.StatusRequestEntityTooLarge, gin.H{
+			"error":    fmt.Sprintf("Too many rows: %d (max %d)", count, BulkMaxRows),
+			"max_rows": BulkMaxRows,
+		})
+		return false
+	}
+	return true
+}
+
+// existingIDs 查询给定ID中在表中存在的ID
+func existingIDs(model interface{}, ids []uint) (map[uint]bool, error) {
+	existing := make(map[uint]bool, len(ids))
+	// SQLite对单条语句的参数个数有限制，分块查询
+	for start := 0; start < len(ids); start += bulkChunkSize {
+		end := start + bulkChunkSize
+		if end > len(ids) {
+			end = len(ids)
+		}
+		var found []uint
+		if err := database.DB.Model(model).Where("id IN ?", ids[start:end]).Pluck("id", &found).Error; err != nil {
+			return nil, err
+		}
+		for _, id := range found {
+			existing[id] = true
+		}
+	}
+	return existing, nil
+}
+
+// uniqueIDs 去重
+func uniqueIDs(ids []uint) []uint {
+	seen := make(map[uint]bool, len(ids))
+	result := make([]uint, 0, len(ids))
+	for _, id := range ids {
+		if !seen[id] {
+			seen[id] = true
+			result = append(result, id)
+		}
+	}
+	return result
+}
+
+// inChunks 按块在事务中执行fn，每行使用保存点，单行失败只回滚该行
+// 某块事务失败时整块回滚，该块及其后尚未处理的行全部记为失败，之前已提交的块保持不变，
+// 因此返回的行错误与实际写入的数据一致，客户端只重试失败行不会产生重复数据
+func inChunks(indexes []int, fn func(tx *gorm.DB, index int) error) []BulkRowError {
+	var rowErrors []BulkRowError
+	for start := 0; start < len(indexes); start += bulkChunkSize {
+		end := start + bulkChunkSize
+		if end > len(indexes) {
+			end = len(indexes)
+		}
+		var chunkErrors []BulkRowError
+		err := database.DB.Transaction(func(tx *gorm.DB) error {
+			for _, index := range indexes[start:end] {
+				if err := tx.SavePoint("bulk_row").Error; err != nil {
+					return err
+				}
+				if err := fn(tx, index); err != nil {
+					if err := tx.RollbackTo("bulk_row").Error; err != nil {
+						return err
+					}
+					chunkErrors = append(chunkErrors, BulkRowError{Index: index, Error: err.Error()})
+				}
+				// 每行结束后释放保存点，避免保存点在事务中堆积
+				if err := tx.Exec("RELEASE SAVEPOINT bulk_row").Error; err != nil {
+					return err
+				}
+			}
+			return nil
+		})
+		if err != nil {
+			for _, index := range indexes[start:] {
+				rowErrors = append(rowErrors, BulkRowError{Index: index, Error: "Transaction failed, row not saved"})
+			}
+			return rowErrors
+		}
+		rowErrors = append(rowErrors, chunkErrors...)
+	}
+	return rowErrors
+}
+
+// BulkCreateItems 批量创建物品
+// 请求: {"items": [...]}，响应中items与请求一一对应，失败行为null并在errors中给出原因
+func BulkCreateItems(c *gin.Context) {
+	var request struct {
+		Items []models.Item `json:"items"`
+	}
+	if err := c.ShouldBindJSON(&request); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+	if !validateBulkSize(c, len(request.Items)) {
+		return
+	}
+
+	// 一次查询验证所有分区是否存在
+	sectionIDs := make([]uint, len(request.Items))
+	for i, item := range request.Items {
+		sectionIDs[i] = item.SectionID
+	}
+	sections, err := existingIDs(&models.Section{}, uniqueIDs(sectionIDs))
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": "Failed to validate sections"})
+		return
+	}
+
+	rowErrors := []BulkRowError{}
+	var valid []int
+	for i, item := range request.Items {
+		// 数组元素不会被ShouldBindJSON校验，逐行执行与单条创建相同的binding校验
+		if err := binding.Validator.ValidateStruct(&request.Items[i]); err != nil {
+			rowErrors = append(rowErrors, BulkRowError{Index: i, Error: err.Error()})
+			continue
+		}
+		if !sections[item.SectionID] {
+			rowErrors = append(rowErrors, BulkRowError{Index: i, Error: "Section not found"})
+			continue
+		}
+		valid = append(valid, i)
+	}
+
+	userID, _ := c.Get("user_id")
+	created := make([]*models.Item, len(request.Items))
+	insertErrors := inChunks(valid, func(tx *gorm.DB, index int) error {
+		item := &request.Items[index]
+		if err := tx.Create(item).Error; err != nil {
+			if strings.Contains(err.Error(), "UNIQUE constraint failed: items.code") {
+				return errors.New("物品编号已存在，请使用不同的编号")
+			}
+			return errors.New("Failed to create item")
+		}
+
+		// 记录物品移动记录（入库），与CreateItem一致
+		movement := models.Movement{
+			ItemID:       item.ID,
+			MovementType: "入库",
+			FromLocation: "",
+			ToLocation:   fmt.Sprintf("分区ID:%d", item.SectionID),
+			Quantity:     item.Quantity,
+			Reason:       "新增物品",
+			Notes:        "Initial stock (bulk)",
+			UserID:       userID.(uint),
+		}
+		if err := tx.Create(&movement).Error; err != nil {
+			return errors.New("Failed to create movement record")
+		}
+		created[index] = item
+		return nil
+	})
+	for _, rowError := range insertErrors {
+		created[rowError.Index] = nil
+	}
+	rowErrors = append(rowErrors, insertErrors...)
+
+	c.JSON(bulkStatus(rowErrors, http.StatusCreated), gin.H{
+		"items":   created,
+		"created": len(request.Items) - len(rowErrors),
+		"errors":  rowErrors,
+	})
+}
+
+// BulkCreateSections 批量创建分区
+// 请求: {"sections": [...]}，响应格式同BulkCreateItems
+func BulkCreateSections(c *gin.Context) {
+	var request struct {
+		Sections []models.Section `json:"sections"`
+	}
+	if err := c.ShouldBindJSON(&request); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+	if !validateBulkSize(c, len(request.Sections)) {
+		return
+	}
+
+	// 一次查询验证所有存储装置是否存在
+	storageIDs := make([]uint, len(request.Sections))
+	for i, section := range request.Sections {
+		storageIDs[i] = section.StorageID
+	}
+	storages, err := existingIDs(&models.Storage{}, uniqueIDs(storageIDs))
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": "Failed to validate storages"})
+		return
+	}
+
+	rowErrors := []BulkRowError{}
+	var valid []int
+	for i, section := range request.Sections {
+		if err := binding.Validator.ValidateStruct(&request.Sections[i]); err != nil {
+			rowErrors = append(rowErrors, BulkRowError{Index: i, Error: err.Error()})
+			continue
+		}
+		if !storages[section.StorageID] {
+			rowErrors = append(rowErrors, BulkRowError{Index: i, Error: "Storage not found"})
+			continue
+		}
+		valid = append(valid, i)
+	}
+
+	created := make([]*models.Section, len(request.Sections))
+	insertErrors := inChunks(valid, func(tx *gorm.DB, index int) error {
+		section := &request.Sections[index]
+		if err := tx.Create(section).Error; err != nil {
+			return errors.New("Failed to create section")
+		}
+		created[index] = section
+		return nil
+	})
+	for _, rowError := range insertErrors {
+		created[rowError.Index] = nil
+	}
+	rowErrors = append(rowErrors, insertErrors...)
+
+	c.JSON(bulkStatus(rowErrors, http.StatusCreated), gin.H{
+		"sections": created,
+		"created":  len(request.Sections) - len(rowErrors),
+		"errors":   rowErrors,
+	})
+}
+
+// BulkUpdateItemQuantities 批量更新物品库存
+// 请求: {"updates": [{"item_id": 1, "quantity": 10}, ...]}
+// 响应中items与请求一一对应（数量未变化的行也返回物品），失败行为null
+func BulkUpdateItemQuantities(c *gin.Context) {
+	var request struct {
+		Updates []struct {
+			ItemID   uint `json:"item_id"`
+			Quantity int  `json:"quantity"`
+		} `json:"updates"`
+	}
+	if err := c.ShouldBindJSON(&request); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid request data: " + err.Error()})
+		return
+	}
+	if !validateBulkSize(c, len(request.Updates)) {
+		return
+	}
+
+	rowErrors := []BulkRowError{}
+	var valid []int
+	for i, update := range request.Updates {
+		if update.Quantity < 0 {
+			rowErrors = append(rowErrors, BulkRowError{Index: i, Error: "Quantity must be >= 0"})
+			continue
+		}
+		valid = append(valid, i)
+	}
+
+	userID, _ := c.Get("user_id")
+	updated := make([]*models.Item, len(request.Updates))
+	updateErrors := inChunks(valid, func(tx *gorm.DB, index int) error {
+		update := request.Updates[index]
+		var item models.Item
+		if err := tx.First(&item, update.ItemID).Error; err != nil {
+			return errors.New("Item not found")
+		}
+
+		oldQuantity := item.Quantity
+		quantityChange := update.Quantity - oldQuantity
+		if quantityChange == 0 {
+			updated[index] = &item
+			return nil
+		}
+		if err := tx.Model(&item).Update("quantity", update.Quantity).Error; err != nil {
+			return errors.New("Failed to update quantity")
+		}
+
+		// 记录移动记录，与UpdateItemQuantity一致
+		movementType := "入库"
+		reason := fmt.Sprintf("库存增加 %d", quantityChange)
+		if quantityChange < 0 {
+			movementType = "出库"
+			reason = fmt.Sprintf("库存减少 %d", -quantityChange)
+		}
+		movement := models.Movement{
+			ItemID:       item.ID,
+			MovementType: movementType,
+			FromLocation: fmt.Sprintf("库存: %d %s", oldQuantity, item.Unit),
+			ToLocation:   fmt.Sprintf("库存: %d %s", update.Quantity, item.Unit),
+			Quantity:     quantityChange,
+			Reason:       reason,
+			Notes:        "批量库存调整",
+			UserID:       userID.(uint),
+		}
+		if err := tx.Create(&movement).Error; err != nil {
+			return errors.New("Failed to create movement record")
+		}
+		updated[index] = &item
+		return nil
+	})
+	for _, rowError := range updateErrors {
+		updated[rowError.Index] = nil
+	}
+	rowErrors = append(rowErrors, updateErrors...)
+
+	c.JSON(bulkStatus(rowErrors, http.StatusOK), gin.H{
+		"items":   updated,
+		"updated": len(request.Updates) - len(rowErrors),
+		"errors":  rowErrors,
+	})
+}
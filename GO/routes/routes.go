@@ -54,6 +54,8 @@ func SetupRoutes() *gin.Engine {
 		auth.GET("/items", handlers.GetItems)
 		auth.GET("/items/:id", handlers.GetItem)
 		auth.POST("/items", handlers.CreateItem)
+		auth.POST("/items/bulk", handlers.BulkCreateItems)
+		auth.PUT("/items/quantities", handlers.BulkUpdateItemQuantities)
 		auth.PUT("/items/:id", handlers.UpdateItem)
 		auth.DELETE("/items/:id", handlers.DeleteItem)
 		auth.PUT("/items/:id/quantity", handlers.UpdateItemQuantity)
@@ -91,6 +93,7 @@ func SetupRoutes() *gin.Engine {
 		
 		// 分区管理 - 仅管理员
 		admin.POST("/sections", handlers.CreateSection)
+		admin.POST("/sections/bulk", handlers.BulkCreateSections)
 		admin.PUT("/sections/:id", handlers.UpdateSection)
 		admin.DELETE("/sections/:id", handlers.DeleteSection)
 		
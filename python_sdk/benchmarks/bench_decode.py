@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: decode cost of 10k /items rows
+
+Compares the previous Item(**row) construction against the compiled decoders
+in central_storage_sdk.models. Rows mirror the Go GetItems payload, including
+the preloaded section -> storage -> laboratory chain.
+
+Usage:
+    python benchmarks/bench_decode.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from central_storage_sdk.models import Item, decode_models
+
+
+def make_rows(count: int, sections: int = 500):
+    """Build rows the way the server sends them: every row carries its own copy
+    of the preloaded section chain, items spread over `sections` sections"""
+    def timestamp(i: int) -> str:
+        return f"2024-03-01T09:{i // 60 % 60:02d}:{i % 60:02d}.{i:09d}+08:00"
+
+    def section(section_id: int):
+        lab_id = section_id // 50 + 1
+        storage_id = section_id // 5 + 1
+        laboratory = {
+            "id": lab_id, "code": f"LAB{lab_id:04d}", "name": f"化学实验室{lab_id:02d}",
+            "location": "A楼3F-301", "description": "", "security_level": 2, "storages": None,
+            "created_at": timestamp(lab_id), "updated_at": timestamp(lab_id),
+        }
+        storage = {
+            "id": storage_id, "code": f"STG{storage_id:04d}", "name": "试剂柜-A1", "type": "试剂柜",
+            "location": "位置A1", "description": "", "status": "运行中", "capacity": 100,
+            "security_level": 1, "properties": {"material": "不锈钢"}, "lab_id": lab_id,
+            "laboratory": laboratory, "sections": None,
+            "created_at": timestamp(storage_id), "updated_at": timestamp(storage_id),
+        }
+        return {
+            "id": section_id, "code": f"SEC{section_id:04d}", "name": "分区A01", "position": "第1行第1列",
+            "description": "", "status": "可用", "security_level": 1, "capacity": 100, "used_capacity": 0,
+            "properties": {"size": "中"}, "storage_id": storage_id, "storage": storage, "items": None,
+            "created_at": timestamp(section_id), "updated_at": timestamp(section_id),
+        }
+
+    return [{
+        "id": i, "code": f"ITM{i:06d}", "name": f"化学试剂样品{i:03d}", "description": "标准化学试剂",
+        "category": "化学试剂", "properties": {"purity": "99.5%"}, "price": 12.5, "quantity": 10,
+        "min_quantity": 2, "unit": "瓶", "supplier": "化学试剂供应商",
+        "purchase_date": "2024-01-01", "expiry_date": "2026-01-01",
+        "section_id": i % sections + 1, "section": section(i % sections + 1),
+        "created_at": timestamp(i), "updated_at": timestamp(i),
+    } for i in range(count)]
+
+
+def timeit(func, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    cases = [
+        ("Item(**row) (nested left as dicts)", lambda rs: [Item(**row) for row in rs]),
+        ("compiled decoder (nested decoded)", lambda rs: decode_models(Item, rs)),
+        ("compiled decoder + parse_dates", lambda rs: decode_models(Item, rs, parse_dates=True)),
+    ]
+
+    print(f"Decoding {args.rows} items (best of {args.repeat})")
+    baseline = None
+    for name, func in cases:
+        elapsed = timeit(func, rows, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  {name:<40} {elapsed * 1000:8.1f} ms  "
+              f"{elapsed / args.rows * 1e6:6.2f} us/item  x{elapsed / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: retained bytes per decoded Item
+
+Decodes a JSON payload of flat /items rows and measures the memory still held
+by the resulting models once the raw JSON has been released. Compares a plain
+dataclass with a per-instance __dict__ (the previous Item definition) built
+with Item(**row) against the slotted Item built by the interning decoder.
+
+Usage:
+    python benchmarks/bench_memory.py [--rows 100000]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from central_storage_sdk.models import Item, decode_models
+
+# Same fields and defaults as Item, but without __slots__
+DictItem = make_dataclass(
+    "DictItem",
+    [(f.name, f.type, f) for f in fields(Item)],
+)
+
+
+def make_payload(count: int) -> str:
+    rng = random.Random(42)
+    categories = ["化学试剂", "电子元件", "实验器材", "耗材", "标准样品"]
+    units = ["个", "瓶", "包", "盒", "套", "ml", "g", "kg"]
+    suppliers = ["科学仪器公司", "化学试剂供应商", "实验设备厂", "标准物质中心"]
+    rows = [{
+        "id": i, "code": f"ITM{i:08d}", "name": f"样品{i:06d}", "description": "",
+        "category": rng.choice(categories), "properties": None, "price": round(rng.uniform(10, 1000), 2),
+        "quantity": rng.randint(1, 50), "min_quantity": 5, "unit": rng.choice(units),
+        "supplier": rng.choice(suppliers), "purchase_date": "2024-01-01", "expiry_date": "2026-01-01",
+        "section_id": rng.randint(1, 500),
+        "created_at": "2024-03-01T09:30:00+08:00", "updated_at": "2024-03-01T09:30:00+08:00",
+    } for i in range(count)]
+    return json.dumps(rows, ensure_ascii=False)
+
+
+def retained_bytes(payload: str, decode) -> int:
+    gc.collect()
+    tracemalloc.start()
+    models = decode(json.loads(payload))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(models) > 0
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.rows)
+    cases = [
+        ("dataclass with __dict__, Item(**row)", lambda rows: [DictItem(**row) for row in rows]),
+        ("slotted Item, interning decoder", lambda rows: decode_models(Item, rows)),
+    ]
+
+    print(f"Retained memory for {args.rows} decoded items")
+    for name, decode in cases:
+        total = retained_bytes(payload, decode)
+        print(f"  {name:<40} {total / 2**20:8.1f} MiB  {total / args.rows:7.0f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: filtered /items queries over HTTP vs the in-process ItemQueryEngine
+
+An in-process HTTP stand-in serves GET /api/items for a synthetic item set
+(default 100k items) with the same filter/sort/pagination semantics, and the
+same queries are then answered locally by ItemQueryEngine. The HTTP numbers
+exclude the server's database time, so they are a lower bound for a real
+deployment; pass --base-url to run the HTTP side against a real server.
+
+Usage:
+    python benchmarks/bench_query.py [--items 100000] [--repeat 20]
+    python benchmarks/bench_query.py --base-url http://localhost:8080 --token TOKEN
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.models import Item, PaginationParams, decode_models
+from central_storage_sdk.query import ItemQueryEngine
+
+CATEGORIES = ["化学试剂", "生物试剂", "实验耗材", "玻璃器皿", "仪器配件", "安全防护", "标准品", "其他"]
+
+
+def make_rows(count: int, sections: int = 500, seed: int = 42):
+    """Flat item rows with varied categories, stock levels and expiry dates"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, count + 1):
+        expires = rng.random() < 0.6
+        rows.append({
+            "id": i, "code": f"ITM{i:06d}", "name": f"样品{i:06d}", "description": "标准化学试剂",
+            "category": rng.choice(CATEGORIES), "properties": {}, "price": round(rng.uniform(1, 500), 2),
+            "quantity": rng.randint(0, 200), "min_quantity": rng.randint(0, 20), "unit": "瓶",
+            "supplier": "供应商A", "purchase_date": "2024-01-01",
+            "expiry_date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if expires else None,
+            "section_id": rng.randint(1, sections),
+            "created_at": f"2024-03-01T09:{i // 60 % 60:02d}:{i % 60:02d}.{i:09d}+08:00",
+            "updated_at": f"2024-03-01T09:{i // 60 % 60:02d}:{i % 60:02d}.{i:09d}+08:00",
+        })
+    return rows
+
+
+def start_stand_in(rows):
+    """Serve GET /api/items from an ItemQueryEngine; returns (server, base_url)"""
+    engine = ItemQueryEngine(decode_models(Item, rows))
+    raw = {row["id"]: row for row in rows}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = dict(parse_qsl(url.query))
+            params = PaginationParams(
+                page=int(query.pop("page", 1)), page_size=int(query.pop("page_size", 20)),
+                search=query.pop("search", ""), sort_by=query.pop("sort_by", ""),
+                sort_desc=query.pop("sort_desc", "false").lower() == "true",
+            )
+            page = engine.get_items(params, **query)
+            body = json.dumps({
+                "data": [{"item": raw[item.id], "section": {}, "location": {}} for item in page.data],
+                "total": page.total, "page": page.page, "page_size": page.page_size,
+                "total_pages": page.total_pages, "has_next": page.has_next, "has_prev": page.has_prev,
+            }, ensure_ascii=False).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def mean_ms(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--base-url", help="Benchmark a real server instead of the stand-in")
+    parser.add_argument("--token")
+    args = parser.parse_args()
+
+    server = None
+    if args.base_url:
+        base_url = args.base_url
+    else:
+        server, base_url = start_stand_in(make_rows(args.items))
+    client = CentralStorageClient(base_url, token=args.token, coalesce_gets=False)
+
+    start = time.perf_counter()
+    items = client.fetch_all("items")
+    fetched = time.perf_counter()
+    engine = ItemQueryEngine(items)
+    print(f"Fetched {len(items)} items over HTTP in {fetched - start:.2f} s, "
+          f"built indexes in {time.perf_counter() - fetched:.2f} s")
+
+    queries = [
+        ("first page (created_at DESC)", PaginationParams(), {}),
+        ("search", PaginationParams(search="样品0123"), {}),
+        ("category + low_stock", PaginationParams(), {"category": "化学试剂", "low_stock": "true"}),
+        ("expiring in 90 days", PaginationParams(), {"expiring": "true", "expiring_days": 90}),
+        ("section_id", PaginationParams(), {"section_id": 42}),
+        ("sort by price, page 50", PaginationParams(page=50, page_size=100, sort_by="price", sort_desc=True), {}),
+    ]
+
+    start = time.perf_counter()
+    for _, params, filters in queries:
+        engine.get_items(params, **filters)  # builds the sort orders used below
+    print(f"Built sort orders on first use in {time.perf_counter() - start:.2f} s")
+
+    print(f"\nMean latency per query (over {args.repeat} runs)")
+    print(f"  {'query':<32} {'HTTP':>10} {'local':>10} {'speedup':>9}")
+    for name, params, filters in queries:
+        http_ms = mean_ms(lambda: client.get_items(params, **filters), args.repeat)
+        local_ms = mean_ms(lambda: engine.get_items(params, **filters), args.repeat)
+        print(f"  {name:<32} {http_ms:8.2f}ms {local_ms:8.3f}ms {http_ms / local_ms:8.0f}x")
+
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: CentralStorageClient and BatchOperations against the stand-in
+
+Starts the in-process /api stand-in (benchmarks/stand_in.py) with optional
+injected latency, seeds it, and runs listing, decoding, batch creation and
+export scenarios. Each scenario reports requests/sec, rows/sec, p50/p95/p99
+request latency (time to response headers, as seen by requests) and the
+Python heap peak measured in a second, tracemalloc-instrumented run. The
+stand-in shares the process (and the GIL) with the client, so absolute numbers
+are pessimistic; compare runs made with the same settings.
+
+Usage:
+    python benchmarks/bench_suite.py [--items 20000] [--latency 0.002] [--output results.json]
+    python benchmarks/bench_suite.py --scenario list_items --scenario export_movements
+    python benchmarks/bench_suite.py --output new.json --compare old.json
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import central_storage_sdk
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.datagen import TestDataGenerator
+from central_storage_sdk.models import Item, PaginationParams, decode_models
+
+from stand_in import StandInAPI
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyRecorder:
+    """Records the latency of every response through a requests response hook"""
+
+    def __init__(self, client: CentralStorageClient):
+        self.samples = []
+        client.session.hooks["response"].append(self._record)
+
+    def _record(self, response, *args, **kwargs):
+        self.samples.append(response.elapsed.total_seconds())
+
+    def reset(self):
+        self.samples = []
+
+
+# Scenarios: (client, api, args) -> number of rows processed
+def scenario_list_items(client, api, args) -> int:
+    """Walk every /items page sequentially (page_size=100)"""
+    rows = 0
+    for page in client.iter_pages(client.get_items, PaginationParams(page_size=100), prefetch=False):
+        rows += len(page.data)
+    return rows
+
+
+def scenario_fetch_all_items(client, api, args) -> int:
+    """fetch_all("items") with concurrent page requests"""
+    return len(client.fetch_all("items", concurrency=args.workers))
+
+
+def scenario_list_sections(client, api, args) -> int:
+    """Walk every /sections page (each row carries its storage, laboratory and items)"""
+    return sum(1 for _ in client.iter_sections(PaginationParams(page_size=100)))
+
+
+def scenario_decode_items(client, api, args) -> int:
+    """Decode one /items page payload per 100 rows without HTTP (json.loads + models)"""
+    _, page = api._list("items", {"page_size": "100"})
+    payload = json.dumps(page["data"], ensure_ascii=False)
+    rounds = max(1, args.items // 100)
+    for _ in range(rounds):
+        decode_models(Item, [row["item"] for row in json.loads(payload)])
+    return rounds * len(page["data"])
+
+
+def _target_sections(api, count: int):
+    section_ids = list(api.tables["sections"])
+    return [section_ids[i % len(section_ids)] for i in range(count)]
+
+
+def scenario_batch_create_bulk(client, api, args) -> int:
+    """create_items_batch through the bulk endpoint"""
+    generator = TestDataGenerator(args.seed + 1)
+    rows = list(generator.items(_target_sections(api, args.create // 10), 10))
+    batch = BatchOperations(client, max_workers=args.workers)
+    return len(_quiet(batch.create_items_batch, rows))
+
+
+def scenario_batch_create_per_row(client, api, args) -> int:
+    """create_items_batch with one request per row"""
+    generator = TestDataGenerator(args.seed + 2)
+    rows = list(generator.items(_target_sections(api, args.create_per_row // 10), 10))
+    batch = BatchOperations(client, max_workers=args.workers, use_bulk=False)
+    return len(_quiet(batch.create_items_batch, rows))
+
+
+def scenario_bulk_update_quantities(client, api, args) -> int:
+    """bulk_update_item_quantities over the first --create items"""
+    updates = [{"item_id": item_id, "quantity": (item_id * 7) % 50}
+               for item_id in list(api.tables["items"])[:args.create]]
+    batch = BatchOperations(client, max_workers=args.workers)
+    return len(_quiet(batch.bulk_update_item_quantities, updates))
+
+
+def scenario_export_movements(client, api, args) -> int:
+    """Stream the movements CSV export into memory"""
+    buffer = io.BytesIO()
+    client.export_movements_csv_to(buffer)
+    return buffer.getvalue().count(b"\n") - 1
+
+
+SCENARIOS = {
+    "list_items": scenario_list_items,
+    "fetch_all_items": scenario_fetch_all_items,
+    "list_sections": scenario_list_sections,
+    "decode_items": scenario_decode_items,
+    "batch_create_bulk": scenario_batch_create_bulk,
+    "batch_create_per_row": scenario_batch_create_per_row,
+    "bulk_update_quantities": scenario_bulk_update_quantities,
+    "export_movements": scenario_export_movements,
+}
+
+
+def _quiet(func, *args, **kwargs):
+    """Run a BatchOperations method without its progress output"""
+    stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        sys.stdout = stdout
+
+
+def run_scenario(name, client, api, recorder, args):
+    func = SCENARIOS[name]
+    gc.collect()
+    recorder.reset()
+    requests_before = api.request_count
+    start = time.perf_counter()
+    rows = func(client, api, args)
+    seconds = time.perf_counter() - start
+    requests = api.request_count - requests_before
+    latencies = sorted(recorder.samples)
+
+    result = {
+        "rows": rows,
+        "requests": requests,
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / seconds, 1) if seconds else 0.0,
+        "requests_per_sec": round(requests / seconds, 1) if seconds else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        },
+    }
+
+    if args.memory:
+        gc.collect()
+        tracemalloc.start()
+        func(client, api, args)
+        result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline):
+    """Print relative changes against a previous results file"""
+    print(f"\nChange vs baseline ({baseline['meta'].get('sdk_version')}, {baseline['meta'].get('timestamp')})")
+    print(f"  {'scenario':<24} {'rows/s':>10} {'p95 ms':>10} {'peak mem':>10}")
+    for name, result in results["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            continue
+
+        def ratio(new_value, old_value):
+            return f"{(new_value / old_value - 1) * 100:+9.1f}%" if old_value else f"{'n/a':>10}"
+
+        print(f"  {name:<24} {ratio(result['rows_per_sec'], old['rows_per_sec'])} "
+              f"{ratio(result['latency_ms']['p95'], old['latency_ms']['p95'])} "
+              f"{ratio(result.get('peak_memory_bytes', 0), old.get('peak_memory_bytes', 0))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000, help="Items seeded before the run")
+    parser.add_argument("--movements-per-item", type=int, default=2)
+    parser.add_argument("--create", type=int, default=10000, help="Rows for the bulk scenarios")
+    parser.add_argument("--create-per-row", type=int, default=1000, help="Rows for batch_create_per_row")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds per request")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Run only these scenarios (repeatable)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="Skip the tracemalloc pass")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    sections = max(1, args.items // 20)
+    with StandInAPI(latency=args.latency, jitter=args.jitter, seed=args.seed) as api:
+        start = time.perf_counter()
+        api.seed_data(labs=max(1, sections // 50), storages_per_lab=5, sections_per_storage=10,
+                      items_per_section=20, movements_per_item=args.movements_per_item)
+        print(f"Seeded {len(api.tables['items'])} items, {len(api.tables['movements'])} movements "
+              f"in {time.perf_counter() - start:.1f} s (latency {args.latency * 1000:g} ms "
+              f"+ up to {args.jitter * 1000:g} ms)")
+
+        client = CentralStorageClient(api.base_url, coalesce_gets=False)
+        client.login("admin", "admin123")
+        recorder = LatencyRecorder(client)
+
+        results = {
+            "meta": {
+                "sdk_version": central_storage_sdk.__version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "settings": {key: value for key, value in vars(args).items()
+                             if key not in ("output", "compare", "scenario")},
+            },
+            "scenarios": {},
+        }
+
+        print(f"\n  {'scenario':<24} {'rows':>8} {'req':>6} {'rows/s':>10} {'req/s':>8} "
+              f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak mem':>10}")
+        for name in args.scenario or SCENARIOS:
+            result = run_scenario(name, client, api, recorder, args)
+            results["scenarios"][name] = result
+            latency = result["latency_ms"]
+            memory = result.get("peak_memory_bytes")
+            print(f"  {name:<24} {result['rows']:>8} {result['requests']:>6} {result['rows_per_sec']:>10.0f} "
+                  f"{result['requests_per_sec']:>8.0f} {latency['p50']:>8.2f} {latency['p95']:>8.2f} "
+                  f"{latency['p99']:>8.2f} {f'{memory / 1e6:.1f}MB' if memory else '-':>10}")
+        client.session.close()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,628 @@
+"""
+In-process stand-in for the Go /api server, used by the benchmarks
+
+Implements the routes the SDK calls (login, profile, CRUD and listings for
+laboratories/storages/sections/items, the bulk endpoints, movements and the
+CSV export) over in-memory tables, with the same pagination envelope, page
+size cap, default ordering, filters, preloads and status codes as the Go
+handlers. Relations the Go handlers do not preload are sent as null instead
+of zero-valued structs. Every request can be delayed by a fixed latency plus
+random jitter to model network and database time.
+
+Usage:
+    with StandInAPI(latency=0.002) as api:
+        api.seed_data(labs=10, storages_per_lab=5, sections_per_storage=10, items_per_section=20)
+        client = CentralStorageClient(api.base_url)
+        client.login("admin", "admin123")
+"""
+
+import csv
+import io
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from central_storage_sdk.datagen import TestDataGenerator
+
+PAGE_SIZE_DEFAULT = 20
+PAGE_SIZE_MAX = 100
+BULK_MAX_ROWS = 5000
+
+_TZ = timezone(timedelta(hours=8))
+
+# Relation keys per table; the stand-in stores flat rows and attaches these on output
+_RELATIONS = {
+    "laboratories": ("storages",),
+    "storages": ("laboratory", "sections"),
+    "sections": ("storage", "items"),
+    "items": ("section",),
+    "movements": ("item", "user"),
+}
+_PARENT = {"storages": ("lab_id", "laboratories"), "sections": ("storage_id", "storages"),
+           "items": ("section_id", "sections")}
+_CHILD_TABLE = {"laboratories": "storages", "storages": "sections", "sections": "items"}
+_SEARCH_FIELDS = {
+    "laboratories": ("name", "code", "location", "description"),
+    "storages": ("name", "code", "type", "location", "description"),
+    "sections": ("name", "code", "position", "description"),
+    "items": ("name", "code", "description", "category"),
+}
+_SORTS = {
+    "laboratories": {"name", "code", "location", "security_level", "created_at", "updated_at"},
+    "storages": {"name", "code", "type", "status", "capacity", "security_level", "created_at", "updated_at"},
+    "sections": {"name", "code", "position", "status", "capacity", "used_capacity", "security_level",
+                 "created_at", "updated_at"},
+    "items": {"name", "code", "category", "quantity", "price", "created_at", "updated_at"},
+}
+_DELETE_BLOCKED = {
+    "laboratories": "Cannot delete laboratory with existing storages",
+    "storages": "Cannot delete storage with existing sections",
+    "sections": "Cannot delete section with existing items",
+}
+_NOT_FOUND = {"laboratories": "Laboratory not found", "storages": "Storage not found",
+              "sections": "Section not found", "items": "Item not found", "movements": "Movement not found"}
+_ENVELOPE = {"laboratories": "laboratory", "storages": "storage", "sections": "section", "items": "item"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _now() -> str:
+    return datetime.now(_TZ).isoformat(timespec="microseconds")
+
+
+def _like(term: str):
+    """Matcher for SQLite's LIKE '%term%': % and _ are wildcards, ASCII letters fold case"""
+    pattern = "".join(".*" if char == "%" else "." if char == "_" else re.escape(char) for char in term)
+    return re.compile(pattern, re.ASCII | re.IGNORECASE | re.DOTALL).search
+
+
+def _row_id(table: str, value: str) -> int:
+    # gin routes /items/:id match any segment; the handlers reject non-numeric IDs with 400
+    if not value.isdigit():
+        raise HTTPError(400, f"Invalid {_ENVELOPE[table]} ID")
+    return int(value)
+
+
+class StandInAPI:
+    """Threaded HTTP server answering /api requests from in-memory tables"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0, bulk: bool = True):
+        """
+        Initialize the stand-in (call start() or use it as a context manager)
+
+        Args:
+            latency: Seconds every request is delayed by
+            jitter: Extra random delay of up to this many seconds
+            seed: Seed for the jitter and for seed_data()
+            bulk: Serve the bulk endpoints; without them the stand-in answers like
+                a server predating them (PUT /items/quantities hits PUT /items/:id)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.bulk = bulk
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self.tables: Dict[str, Dict[int, Dict[str, Any]]] = {name: {} for name in _RELATIONS}
+        self._children: Dict[str, Dict[int, set]] = {name: {} for name in _PARENT}
+        self._item_codes = set()
+        self._next_id = {name: 1 for name in _RELATIONS}
+        self.user = {
+            "id": 1, "username": "admin", "email": "admin@example.com", "role": "admin", "active": True,
+            "real_name": "管理员", "phone": "", "department": "", "bio": "",
+            "last_login": _now(), "created_at": _now(), "updated_at": _now(),
+        }
+        self.request_count = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._routes = self._build_routes()
+
+    # Server lifecycle
+    def start(self) -> str:
+        """Start serving on a free localhost port; returns the base URL"""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment; separate small writes on a
+            # keep-alive connection stall on delayed ACKs (~40 ms per request)
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, payload, content_type = stand_in.handle(self.command, self.path, body,
+                                                                self.headers.get("Authorization"))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInAPI":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Data
+    def _insert(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            row = {key: value for key, value in row.items() if key not in _RELATIONS[table]}
+            row["id"] = self._next_id[table]
+            self._next_id[table] += 1
+            row["created_at"] = row["updated_at"] = _now()
+            self.tables[table][row["id"]] = row
+            if table in _PARENT:
+                parent_key = _PARENT[table][0]
+                self._children[table].setdefault(row.get(parent_key), set()).add(row["id"])
+            if table == "items":
+                self._item_codes.add(row.get("code"))
+            return row
+
+    def seed_data(self, labs: int = 5, storages_per_lab: int = 3, sections_per_storage: int = 5,
+                  items_per_section: int = 10, movements_per_item: int = 0):
+        """Fill the tables directly (no HTTP), reproducibly for a given seed"""
+        generator = TestDataGenerator(self.seed, today=date(2026, 1, 1))
+        for lab in generator.laboratories(labs):
+            lab = self._insert("laboratories", lab)
+            for storage in generator.storages([lab["id"]], storages_per_lab):
+                storage = self._insert("storages", storage)
+                for section in generator.sections([storage["id"]], sections_per_storage):
+                    section = self._insert("sections", section)
+                    for item in generator.items([section["id"]], items_per_section):
+                        item = self._insert("items", item)
+                        for _ in range(movements_per_item):
+                            self._insert("movements", self._movement(item, "入库", item["quantity"], "新增物品"))
+
+    def _movement(self, item, movement_type: str, quantity: int, reason: str, notes: str = "",
+                  from_location: str = "", to_location: str = "") -> Dict[str, Any]:
+        return {
+            "item_id": item["id"], "movement_type": movement_type, "from_location": from_location,
+            "to_location": to_location or f"分区ID:{item['section_id']}", "quantity": quantity,
+            "reason": reason, "notes": notes, "user_id": self.user["id"],
+        }
+
+    # Serialization with the Go handlers' preloads
+    def _flat(self, table: str, row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        out = dict(row)
+        for relation in _RELATIONS[table]:
+            out[relation] = None
+        return out
+
+    def _children_of(self, table: str, row_id: int):
+        child_table = _CHILD_TABLE[table]
+        rows = self.tables[child_table]
+        return [rows[child_id] for child_id in sorted(self._children[child_table].get(row_id, ()))]
+
+    def _parent_of(self, table: str, row: Dict[str, Any]):
+        key, parent_table = _PARENT[table]
+        return self.tables[parent_table].get(row.get(key))
+
+    def _section_chain(self, section: Optional[Dict[str, Any]]):
+        """Section.Storage.Laboratory"""
+        if section is None:
+            return None
+        out = self._flat("sections", section)
+        storage = self._parent_of("sections", section)
+        if storage is not None:
+            out["storage"] = self._flat("storages", storage)
+            out["storage"]["laboratory"] = self._flat("laboratories", self._parent_of("storages", storage))
+        return out
+
+    def _item_entry(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """GetItems row: item with its section chain, the section and the location path"""
+        section = self._section_chain(self._parent_of("items", item))
+        out = self._flat("items", item)
+        out["section"] = section
+        location = {key: "" for key in ("lab_code", "lab_name", "storage_code", "storage_name",
+                                        "section_code", "section_name", "full_path")}
+        if section and section["storage"] and section["storage"]["laboratory"]:
+            storage, lab = section["storage"], section["storage"]["laboratory"]
+            location = {
+                "lab_code": lab["code"], "lab_name": lab["name"],
+                "storage_code": storage["code"], "storage_name": storage["name"],
+                "section_code": section["code"], "section_name": section["name"],
+                "full_path": f"{lab['name']} > {storage['name']} > {section['name']}",
+            }
+        return {"item": out, "section": section, "location": location}
+
+    def _serialize(self, table: str, row: Dict[str, Any], listing: bool = True) -> Dict[str, Any]:
+        out = self._flat(table, row)
+        if table == "laboratories":
+            out["storages"] = [self._flat("storages", storage) for storage in self._children_of(table, row["id"])]
+            if not listing:
+                for storage in out["storages"]:
+                    storage["sections"] = [dict(self._flat("sections", section), items=[
+                        self._flat("items", item) for item in self._children_of("sections", section["id"])
+                    ]) for section in self._children_of("storages", storage["id"])]
+        elif table == "storages":
+            out["laboratory"] = self._flat("laboratories", self._parent_of(table, row))
+            out["sections"] = [self._flat("sections", section) for section in self._children_of(table, row["id"])]
+            if not listing:
+                for section in out["sections"]:
+                    section["items"] = [self._flat("items", item) for item in self._children_of("sections", section["id"])]
+        elif table == "sections":
+            out = self._section_chain(row)
+            out["items"] = [self._flat("items", item) for item in self._children_of(table, row["id"])]
+        elif table == "items":
+            out["section"] = self._section_chain(self._parent_of(table, row))
+        elif table == "movements":
+            out["item"] = self._flat("items", self.tables["items"].get(row["item_id"]))
+            out["user"] = self.user
+        return out
+
+    # Request handling
+    def handle(self, method: str, path: str, body: bytes, authorization: Optional[str]):
+        """Answer one request; returns (status, payload bytes, content type)"""
+        delay = self.latency + (self._rng.random() * self.jitter if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.request_count += 1
+        url = urlsplit(path)
+        query = dict(parse_qsl(url.query))
+        try:
+            for route_method, pattern, handler, public in self._routes:
+                if route_method != method:
+                    continue
+                match = pattern.fullmatch(url.path)
+                if match is None:
+                    continue
+                if not public and not (authorization or "").startswith("Bearer "):
+                    raise HTTPError(401, "Authorization header required")
+                data = json.loads(body) if body else {}
+                result = handler(query, data, *match.groups())
+                if isinstance(result, bytes):
+                    return 200, result, "text/csv; charset=utf-8"
+                status, payload = result
+                break
+            else:
+                status, payload = 404, {"error": "Not found"}
+        except HTTPError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (ValueError, TypeError, KeyError) as e:
+            status, payload = 400, {"error": str(e)}
+        return status, json.dumps(payload, ensure_ascii=False).encode(), "application/json; charset=utf-8"
+
+    def _build_routes(self):
+        routes = [
+            ("POST", r"/api/login", self._login, True),
+            ("GET", r"/api/health", lambda query, data: (200, {"status": "ok"}), True),
+            ("GET", r"/api/profile", lambda query, data: (200, {"user": self.user}), False),
+            ("GET", r"/api/labs/(\d+)/storages", self._storages_by_lab, False),
+            ("GET", r"/api/stores/(\d+)/sections", self._sections_by_storage, False),
+            ("GET", r"/api/items/check-code", self._check_code, False),
+            ("PUT", r"/api/items/(\d+)/quantity", self._update_quantity, False),
+            ("GET", r"/api/movements", self._list_movements, False),
+            ("GET", r"/api/movements/export", self._export_movements, False),
+            ("POST", r"/api/admin/movements", self._create_movement, False),
+        ]
+        if self.bulk:
+            routes += [
+                ("POST", r"/api/admin/sections/bulk", self._bulk_create_sections, False),
+                ("POST", r"/api/items/bulk", self._bulk_create_items, False),
+                ("PUT", r"/api/items/quantities", self._bulk_update_quantities, False),
+            ]
+        for table, admin in (("laboratories", True), ("storages", True), ("sections", True), ("items", False)):
+            prefix = "/api/admin" if admin else "/api"
+            routes += [
+                ("GET", rf"/api/{table}", lambda query, data, t=table: self._list(t, query), False),
+                ("GET", rf"/api/{table}/([^/]+)", lambda query, data, i, t=table: self._get(t, _row_id(t, i)), False),
+                ("POST", rf"{prefix}/{table}", lambda query, data, t=table: self._create(t, data), False),
+                ("PUT", rf"{prefix}/{table}/([^/]+)",
+                 lambda query, data, i, t=table: self._update(t, _row_id(t, i), data), False),
+                ("DELETE", rf"{prefix}/{table}/([^/]+)",
+                 lambda query, data, i, t=table: self._delete(t, _row_id(t, i)), False),
+            ]
+        return [(method, re.compile(pattern), handler, public) for method, pattern, handler, public in routes]
+
+    def _login(self, query, data):
+        if data.get("username") != "admin" or not data.get("password"):
+            raise HTTPError(401, "Invalid credentials")
+        user = {key: self.user[key] for key in ("id", "username", "email", "role")}
+        return 200, {"token": "stand-in-token", "user": user}
+
+    # Listings
+    @staticmethod
+    def _page_params(query):
+        page = max(int(query.get("page") or 1), 1)
+        page_size = int(query.get("page_size") or 0)
+        page_size = PAGE_SIZE_DEFAULT if page_size <= 0 else min(page_size, PAGE_SIZE_MAX)
+        return page, page_size
+
+    @staticmethod
+    def _envelope(data, total: int, page: int, page_size: int):
+        total_pages = (total + page_size - 1) // page_size
+        return {"data": data, "total": total, "page": page, "page_size": page_size,
+                "total_pages": total_pages, "has_next": page < total_pages, "has_prev": page > 1}
+
+    def _matching(self, table: str, query) -> list:
+        rows = self.tables[table].values()
+        search = query.get("search")
+        if search and table in _SEARCH_FIELDS:
+            fields = _SEARCH_FIELDS[table]
+            matches = _like(search)
+            rows = [row for row in rows if any(matches(str(row.get(field) or "")) for field in fields)]
+        if table == "laboratories" and query.get("security_level"):
+            rows = [row for row in rows if str(row.get("security_level")) == query["security_level"]]
+        if table == "storages" and query.get("lab_id"):
+            rows = [row for row in rows if str(row.get("lab_id")) == query["lab_id"]]
+        if table == "sections":
+            if query.get("storage_id"):
+                rows = [row for row in rows if str(row.get("storage_id")) == query["storage_id"]]
+            if query.get("laboratory_id"):
+                storage_ids = self._children["storages"].get(int(query["laboratory_id"]), set())
+                rows = [row for row in rows if row.get("storage_id") in storage_ids]
+        if table == "items":
+            if query.get("section_id"):
+                rows = [row for row in rows if str(row.get("section_id")) == query["section_id"]]
+            if query.get("category"):
+                rows = [row for row in rows if row.get("category") == query["category"]]
+            if query.get("low_stock") == "true":
+                rows = [row for row in rows if row.get("quantity", 0) <= row.get("min_quantity", 0)]
+            if query.get("expiring") == "true":
+                days = int(query.get("expiring_days") or 30)
+                limit = (date.today() + timedelta(days=days if days > 0 else 30)).isoformat()
+                rows = [row for row in rows if row.get("expiry_date") and row["expiry_date"] <= limit]
+        if table == "movements":
+            if query.get("user_id"):
+                rows = [row for row in rows if str(row.get("user_id")) == query["user_id"]]
+            if query.get("movement_type"):
+                rows = [row for row in rows if row.get("movement_type") == query["movement_type"]]
+            if query.get("start_date"):
+                rows = [row for row in rows if row["created_at"] >= query["start_date"]]
+            if query.get("end_date"):
+                rows = [row for row in rows if row["created_at"][:10] <= query["end_date"]]
+            if query.get("search"):
+                items = self.tables["items"]
+                matches = _like(query["search"])
+                rows = [row for row in rows if matches(items.get(row["item_id"], {}).get("name", ""))]
+        return list(rows)
+
+    def _ordered(self, table: str, rows: list, query) -> list:
+        sort_by = query.get("sort_by")
+        if table in _SORTS and sort_by in _SORTS[table]:
+            descending = query.get("sort_desc", "false").lower() == "true"
+            return sorted(rows, key=lambda row: (row.get(sort_by) is not None, row.get(sort_by) or 0),
+                          reverse=descending)
+        # created_at DESC; IDs grow with created_at in the stand-in
+        return rows[::-1]
+
+    def _list(self, table: str, query):
+        page, page_size = self._page_params(query)
+        with self._lock:
+            rows = self._ordered(table, self._matching(table, query), query)
+            window = rows[(page - 1) * page_size:page * page_size]
+            if table == "items":
+                data = [self._item_entry(row) for row in window]
+            else:
+                data = [self._serialize(table, row) for row in window]
+        return 200, self._envelope(data, len(rows), page, page_size)
+
+    def _list_movements(self, query, data):
+        return self._list("movements", query)
+
+    def _storages_by_lab(self, query, data, lab_id):
+        with self._lock:
+            storages = [dict(self._flat("storages", storage), sections=[
+                self._flat("sections", section) for section in self._children_of("storages", storage["id"])
+            ]) for storage in self._children_of("laboratories", int(lab_id))]
+        return 200, {"storages": storages}
+
+    def _sections_by_storage(self, query, data, storage_id):
+        with self._lock:
+            sections = [self._flat("sections", section) for section in self._children_of("storages", int(storage_id))]
+        return 200, {"sections": sections}
+
+    # CRUD
+    def _require(self, table: str, row_id: int) -> Dict[str, Any]:
+        row = self.tables[table].get(row_id)
+        if row is None:
+            raise HTTPError(404, _NOT_FOUND[table])
+        return row
+
+    def _get(self, table: str, row_id: int):
+        with self._lock:
+            row = self._require(table, row_id)
+            if table == "items":
+                return 200, self._item_entry(row)
+            return 200, {_ENVELOPE[table]: self._serialize(table, row, listing=False)}
+
+    def _validate_create(self, table: str, data: Dict[str, Any]) -> Optional[str]:
+        """Error message for a row the Go handler would reject, else None"""
+        if table in _PARENT:
+            key, parent_table = _PARENT[table]
+            if data.get(key) not in self.tables[parent_table]:
+                return _NOT_FOUND[parent_table]
+        if table == "items" and data.get("code") in self._item_codes:
+            return "物品编号已存在，请使用不同的编号"
+        return None
+
+    def _create_row(self, table: str, data: Dict[str, Any], notes: str = "Initial stock") -> Dict[str, Any]:
+        row = self._insert(table, {key: value for key, value in data.items()
+                                   if key not in ("id", "created_at", "updated_at")})
+        if table == "items":
+            self._insert("movements", self._movement(row, "入库", row.get("quantity", 0), "新增物品", notes))
+        return row
+
+    def _create(self, table: str, data: Dict[str, Any]):
+        with self._lock:
+            error = self._validate_create(table, data)
+            if error:
+                raise HTTPError(400, error)
+            row = self._create_row(table, data)
+            return 201, {_ENVELOPE[table]: self._serialize(table, row)}
+
+    def _update(self, table: str, row_id: int, data: Dict[str, Any]):
+        with self._lock:
+            row = self._require(table, row_id)
+            if table in _PARENT:
+                key, parent_table = _PARENT[table]
+                if key in data and data[key] != row.get(key):
+                    if data[key] not in self.tables[parent_table]:
+                        raise HTTPError(400, _NOT_FOUND[parent_table])
+                    self._children[table].get(row.get(key), set()).discard(row_id)
+                    self._children[table].setdefault(data[key], set()).add(row_id)
+            row.update({key: value for key, value in data.items()
+                        if key not in ("id", "created_at", "updated_at") and key not in _RELATIONS[table]})
+            row["updated_at"] = _now()
+            return 200, {_ENVELOPE[table]: self._serialize(table, row)}
+
+    def _delete(self, table: str, row_id: int):
+        with self._lock:
+            row = self._require(table, row_id)
+            if table in _CHILD_TABLE and self._children[_CHILD_TABLE[table]].get(row_id):
+                raise HTTPError(400, _DELETE_BLOCKED[table])
+            if table == "items":
+                self._insert("movements", self._movement(row, "出库", row.get("quantity", 0), "物品删除", "Item deleted",
+                                                         from_location=f"分区ID:{row['section_id']}"))
+                self._item_codes.discard(row.get("code"))
+            if table in _PARENT:
+                self._children[table].get(row.get(_PARENT[table][0]), set()).discard(row_id)
+            del self.tables[table][row_id]
+            message = {"laboratories": "Laboratory", "storages": "Storage", "sections": "Section",
+                       "items": "Item"}[table]
+            return 200, {"message": f"{message} deleted successfully"}
+
+    def _check_code(self, query, data):
+        if not query.get("code"):
+            raise HTTPError(400, "Code parameter is required")
+        return 200, {"exists": query["code"] in self._item_codes}
+
+    # Quantities and movements
+    def _set_quantity(self, item: Dict[str, Any], quantity: int, notes: str) -> int:
+        old_quantity = item.get("quantity", 0)
+        change = quantity - old_quantity
+        if change:
+            item["quantity"] = quantity
+            item["updated_at"] = _now()
+            movement_type, reason = ("入库", f"库存增加 {change}") if change > 0 else ("出库", f"库存减少 {-change}")
+            unit = item.get("unit", "")
+            self._insert("movements", self._movement(item, movement_type, change, reason, notes,
+                                                     from_location=f"库存: {old_quantity} {unit}",
+                                                     to_location=f"库存: {quantity} {unit}"))
+        return old_quantity
+
+    def _update_quantity(self, query, data, item_id):
+        quantity = data.get("quantity")
+        if not isinstance(quantity, int) or quantity < 0:
+            raise HTTPError(400, "Invalid request data: quantity must be >= 0")
+        with self._lock:
+            item = self._require("items", int(item_id))
+            old_quantity = self._set_quantity(item, quantity, "通过库存管理界面手动调整")
+        message = "Quantity updated successfully" if old_quantity != quantity else "Quantity unchanged"
+        return 200, {"message": message, "old_quantity": old_quantity, "new_quantity": quantity}
+
+    def _create_movement(self, query, data):
+        with self._lock:
+            item = self.tables["items"].get(data.get("item_id"))
+            if item is None:
+                raise HTTPError(400, "Item not found")
+            quantity = data.get("quantity", 0)
+            if quantity <= 0:
+                raise HTTPError(400, "Quantity must be greater than 0")
+            movement_type = data.get("movement_type", "")
+            if movement_type in ("出库", "报废", "损坏"):
+                if item["quantity"] < quantity:
+                    raise HTTPError(400, "Insufficient quantity")
+                item["quantity"] -= quantity
+            elif movement_type == "入库":
+                item["quantity"] += quantity
+            movement = self._insert("movements", dict(data, user_id=self.user["id"]))
+            return 201, {"message": "Movement created successfully",
+                         "movement": self._serialize("movements", movement)}
+
+    def _export_movements(self, query, data):
+        with self._lock:
+            rows = self._ordered("movements", self._matching("movements", query), {})
+            items = self.tables["items"]
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(["ID", "物品名称", "移动类型", "源位置", "目标位置", "数量", "原因", "备注", "操作人", "记录时间"])
+            for row in rows:
+                writer.writerow([
+                    row["id"], items.get(row["item_id"], {}).get("name", ""), row["movement_type"],
+                    row["from_location"], row["to_location"], row["quantity"], row["reason"], row["notes"],
+                    self.user["real_name"], row["created_at"][:19].replace("T", " "),
+                ])
+        return b"\xef\xbb\xbf" + buffer.getvalue().encode()
+
+    # Bulk endpoints
+    @staticmethod
+    def _bulk_rows(data, key: str) -> list:
+        rows = data.get(key) or []
+        if not rows:
+            raise HTTPError(400, "No rows provided")
+        if len(rows) > BULK_MAX_ROWS:
+            raise HTTPError(413, f"Too many rows: {len(rows)} (max {BULK_MAX_ROWS})")
+        return rows
+
+    def _bulk_create(self, table: str, rows: list, key: str):
+        created, errors = [], []
+        with self._lock:
+            for index, data in enumerate(rows):
+                error = self._validate_create(table, data)
+                if error:
+                    created.append(None)
+                    errors.append({"index": index, "error": error})
+                    continue
+                row = self._create_row(table, data, notes="Initial stock (bulk)")
+                created.append(self._flat(table, row))
+        status = 207 if errors else 201
+        return status, {key: created, "created": len(rows) - len(errors), "errors": errors}
+
+    def _bulk_create_items(self, query, data):
+        return self._bulk_create("items", self._bulk_rows(data, "items"), "items")
+
+    def _bulk_create_sections(self, query, data):
+        return self._bulk_create("sections", self._bulk_rows(data, "sections"), "sections")
+
+    def _bulk_update_quantities(self, query, data):
+        updates = self._bulk_rows(data, "updates")
+        updated, errors = [], []
+        with self._lock:
+            for index, update in enumerate(updates):
+                item = self.tables["items"].get(update.get("item_id"))
+                quantity = update.get("quantity", 0)
+                if quantity < 0 or item is None:
+                    updated.append(None)
+                    errors.append({"index": index, "error": "Quantity must be >= 0" if quantity < 0 else "Item not found"})
+                    continue
+                self._set_quantity(item, quantity, "批量库存调整")
+                updated.append(self._flat("items", item))
+        status = 207 if errors else 200
+        return status, {"items": updated, "updated": len(updates) - len(errors), "errors": errors}
@@ -5,18 +5,30 @@ A Python client library for interacting with the Central Storage System API.
 """
 
 from .client import CentralStorageClient
+from .async_client import AsyncCentralStorageClient
+from .transport import TransportConfig
+from .mirror import InventoryMirror
+from .query import ItemQueryEngine
+from .hierarchy import HierarchyIndex
 from .models import *
 from .exceptions import *
 
 __version__ = "1.0.0"
 __all__ = [
     "CentralStorageClient",
+    "AsyncCentralStorageClient",
+    "TransportConfig",
+    "InventoryMirror",
+    "ItemQueryEngine",
+    "HierarchyIndex",
     "Laboratory",
     "Storage", 
     "Section",
     "Item",
     "User",
     "Movement",
+    "LocationPath",
+    "ItemWithLocation",
     "APIError",
     "AuthenticationError",
     "PermissionError",
@@ -0,0 +1,516 @@
+"""
+Asyncio client for the Central Storage System API
+"""
+
+import asyncio
+import json
+from typing import List, Dict, Any, Optional, Union
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .models import *
+from .exceptions import *
+from .client import (
+    _raise_for_status,
+    _build_query_params,
+    _model_payload,
+    _pagination_response,
+    _bulk_result,
+)
+from .transport import TransportConfig
+from .ratelimit import RateLimiter
+
+
+def _encode_query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """aiohttp only accepts str/int/float query values, so encode booleans the way Go parses them"""
+    if not params:
+        return params
+    return {k: ("true" if v else "false") if isinstance(v, bool) else v for k, v in params.items()}
+
+
+class AsyncCentralStorageClient:
+    """Asyncio counterpart of CentralStorageClient running on a pooled aiohttp session
+
+    Every API method of the blocking client is available as a coroutine with the
+    same arguments, return models and exceptions.
+
+    Example:
+        async with AsyncCentralStorageClient("http://localhost:8080") as client:
+            await client.login("admin", "admin123")
+            items = await asyncio.gather(*(client.get_item(i) for i in ids))
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8080", token: str = None,
+                 max_connections: int = 100, max_connections_per_host: int = 0,
+                 timeout: Optional[float] = None, transport: Optional[TransportConfig] = None,
+                 parse_dates: bool = False, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the client
+
+        Args:
+            base_url: Base URL of the API server
+            token: Authentication token (JWT)
+            max_connections: Total size of the connection pool
+            max_connections_per_host: Per-host connection limit (0 means no extra limit)
+            timeout: Total timeout in seconds for a single request (None disables it)
+            transport: Connect/read timeouts and retry policy; pool sizing is taken
+                from max_connections instead of the pool_* fields
+            parse_dates: Decode created_at/updated_at/last_login into datetime objects
+                instead of keeping the server's strings
+            rate_limiter: Requests per second limits; requests over the limit are
+                delayed, not rejected (may be shared with other clients)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncCentralStorageClient requires aiohttp. "
+                "Install it with: pip install central-storage-sdk[async]"
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.api_base = f"{self.base_url}/api"
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.transport = transport or TransportConfig()
+        self.parse_dates = parse_dates
+        self.rate_limiter = rate_limiter
+        self.headers: Dict[str, str] = {}
+        self.session = None
+
+        if token:
+            self.set_token(token)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying connection pool"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def set_token(self, token: str):
+        """Set authentication token"""
+        self.headers['Authorization'] = f'Bearer {token}'
+        if self.session is not None:
+            self.session.headers.update(self.headers)
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Time requests spent waiting for the rate limiter (empty dict without one)"""
+        return self.rate_limiter.snapshot() if self.rate_limiter is not None else {}
+
+    def _get_session(self):
+        """Create the pooled session lazily so it binds to the running event loop"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout,
+                    sock_connect=self.transport.connect_timeout,
+                    sock_read=self.transport.read_timeout
+                )
+            )
+        return self.session
+
+    def _decode(self, cls, data: Optional[Dict[str, Any]]):
+        """Decode a server JSON object into a model, ignoring unknown fields"""
+        return decode_model(cls, data, self.parse_dates)
+
+    def _decode_list(self, cls, rows: Optional[List[Dict[str, Any]]]) -> List[Any]:
+        """Decode a list of server JSON objects into models, sharing repeated nested records"""
+        return decode_models(cls, rows, self.parse_dates)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with error handling"""
+        url = urljoin(self.api_base + '/', endpoint.lstrip('/'))
+        if 'params' in kwargs:
+            kwargs['params'] = _encode_query_params(kwargs['params'])
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(method, url)
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    if self.transport.should_retry(method, attempt, response.status):
+                        delay = self.transport.backoff(attempt, response.headers.get('Retry-After'))
+                    else:
+                        # Handle different HTTP status codes
+                        _raise_for_status(response.status, response)
+
+                        if response.status >= 400:
+                            raise APIError(f"Request failed: {response.status} {response.reason}",
+                                           response.status, response)
+
+                        body = await response.read()
+                        break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self.transport.should_retry(method, attempt):
+                    raise APIError(f"Request failed: {str(e)}")
+                delay = self.transport.backoff(attempt)
+            except aiohttp.ClientError as e:
+                raise APIError(f"Request failed: {str(e)}")
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        # Return JSON response or empty dict
+        try:
+            return json.loads(body)
+        except ValueError:
+            return {}
+
+    async def _get(self, endpoint: str, params: Dict = None) -> Dict[str, Any]:
+        """Make GET request"""
+        return await self._request('GET', endpoint, params=params)
+
+    async def _post(self, endpoint: str, data: Dict = None, json_data: Dict = None) -> Dict[str, Any]:
+        """Make POST request"""
+        return await self._request('POST', endpoint, data=data, json=json_data)
+
+    async def _put(self, endpoint: str, data: Dict = None, json_data: Dict = None) -> Dict[str, Any]:
+        """Make PUT request"""
+        return await self._request('PUT', endpoint, data=data, json=json_data)
+
+    async def _delete(self, endpoint: str) -> Dict[str, Any]:
+        """Make DELETE request"""
+        return await self._request('DELETE', endpoint)
+
+    # Authentication methods
+    async def login(self, username: str, password: str) -> Dict[str, Any]:
+        """Login and get authentication token"""
+        data = {"username": username, "password": password}
+        response = await self._post("/login", json_data=data)
+
+        if "token" in response:
+            self.set_token(response["token"])
+
+        return response
+
+    async def get_profile(self) -> User:
+        """Get current user profile"""
+        response = await self._get("/profile")
+        return self._decode(User, response.get("user"))
+
+    async def update_profile(self, user_data: Dict[str, Any]) -> User:
+        """Update user profile"""
+        response = await self._put("/profile", json_data=user_data)
+        return self._decode(User, response.get("user"))
+
+    # Laboratory methods
+    async def get_laboratories(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get laboratories with optional filtering and pagination"""
+        response = await self._get("/laboratories", params=_build_query_params(params, filters))
+        labs = self._decode_list(Laboratory, response.get("data", []))
+        return _pagination_response(response, labs)
+
+    async def get_laboratory(self, lab_id: int) -> Laboratory:
+        """Get laboratory by ID"""
+        response = await self._get(f"/laboratories/{lab_id}")
+        return self._decode(Laboratory, response.get("laboratory"))
+
+    async def create_laboratory(self, lab_data: Union[Laboratory, Dict[str, Any]]) -> Laboratory:
+        """Create new laboratory"""
+        if isinstance(lab_data, Laboratory):
+            data = _model_payload(lab_data, ['id', 'created_at', 'updated_at', 'storages'])
+        else:
+            data = lab_data
+
+        response = await self._post("/admin/laboratories", json_data=data)
+        return self._decode(Laboratory, response.get("laboratory"))
+
+    async def update_laboratory(self, lab_id: int, lab_data: Union[Laboratory, Dict[str, Any]]) -> Laboratory:
+        """Update laboratory"""
+        if isinstance(lab_data, Laboratory):
+            data = _model_payload(lab_data, ['id', 'created_at', 'updated_at', 'storages'])
+        else:
+            data = lab_data
+
+        response = await self._put(f"/admin/laboratories/{lab_id}", json_data=data)
+        return self._decode(Laboratory, response.get("laboratory"))
+
+    async def delete_laboratory(self, lab_id: int) -> bool:
+        """Delete laboratory"""
+        await self._delete(f"/admin/laboratories/{lab_id}")
+        return True
+
+    # Storage methods
+    async def get_storages(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get storage devices with optional filtering and pagination"""
+        response = await self._get("/storages", params=_build_query_params(params, filters))
+        storages = self._decode_list(Storage, response.get("data", []))
+        return _pagination_response(response, storages)
+
+    async def get_storage(self, storage_id: int) -> Storage:
+        """Get storage device by ID"""
+        response = await self._get(f"/storages/{storage_id}")
+        return self._decode(Storage, response.get("storage"))
+
+    async def create_storage(self, storage_data: Union[Storage, Dict[str, Any]]) -> Storage:
+        """Create new storage device"""
+        if isinstance(storage_data, Storage):
+            data = _model_payload(storage_data, ['id', 'created_at', 'updated_at', 'laboratory', 'sections'])
+        else:
+            data = storage_data
+
+        response = await self._post("/admin/storages", json_data=data)
+        return self._decode(Storage, response.get("storage"))
+
+    async def update_storage(self, storage_id: int, storage_data: Union[Storage, Dict[str, Any]]) -> Storage:
+        """Update storage device"""
+        if isinstance(storage_data, Storage):
+            data = _model_payload(storage_data, ['id', 'created_at', 'updated_at', 'laboratory', 'sections'])
+        else:
+            data = storage_data
+
+        response = await self._put(f"/admin/storages/{storage_id}", json_data=data)
+        return self._decode(Storage, response.get("storage"))
+
+    async def delete_storage(self, storage_id: int) -> bool:
+        """Delete storage device"""
+        await self._delete(f"/admin/storages/{storage_id}")
+        return True
+
+    async def get_storages_by_lab(self, lab_id: int, params: Optional[PaginationParams] = None) -> PaginationResponse:
+        """Get storage devices by laboratory ID"""
+        response = await self._get(f"/labs/{lab_id}/storages", params=_build_query_params(params))
+        storages = self._decode_list(Storage, response.get("data", []))
+        return _pagination_response(response, storages)
+
+    # Section methods
+    async def get_sections(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get sections with optional filtering and pagination"""
+        response = await self._get("/sections", params=_build_query_params(params, filters))
+        sections = self._decode_list(Section, response.get("data", []))
+        return _pagination_response(response, sections)
+
+    async def get_section(self, section_id: int) -> Section:
+        """Get section by ID"""
+        response = await self._get(f"/sections/{section_id}")
+        return self._decode(Section, response.get("section"))
+
+    async def create_section(self, section_data: Union[Section, Dict[str, Any]]) -> Section:
+        """Create new section"""
+        if isinstance(section_data, Section):
+            data = _model_payload(section_data, ['id', 'created_at', 'updated_at', 'storage', 'items'])
+        else:
+            data = section_data
+
+        response = await self._post("/admin/sections", json_data=data)
+        return self._decode(Section, response.get("section"))
+
+    async def create_sections_bulk(self, sections: List[Union[Section, Dict[str, Any]]]) -> BulkResult:
+        """Create many sections in one request (admin only, at most 5000 rows)"""
+        data = [_model_payload(section, ['id', 'created_at', 'updated_at', 'storage', 'items'])
+                if isinstance(section, Section) else section for section in sections]
+        response = await self._post("/admin/sections/bulk", json_data={"sections": data})
+        return _bulk_result(response, "sections", data, lambda rows: self._decode_list(Section, rows))
+
+    async def update_section(self, section_id: int, section_data: Union[Section, Dict[str, Any]]) -> Section:
+        """Update section"""
+        if isinstance(section_data, Section):
+            data = _model_payload(section_data, ['id', 'created_at', 'updated_at', 'storage', 'items'])
+        else:
+            data = section_data
+
+        response = await self._put(f"/admin/sections/{section_id}", json_data=data)
+        return self._decode(Section, response.get("section"))
+
+    async def delete_section(self, section_id: int) -> bool:
+        """Delete section"""
+        await self._delete(f"/admin/sections/{section_id}")
+        return True
+
+    async def get_sections_by_storage(self, storage_id: int, params: Optional[PaginationParams] = None) -> PaginationResponse:
+        """Get sections by storage ID"""
+        response = await self._get(f"/stores/{storage_id}/sections", params=_build_query_params(params))
+        sections = self._decode_list(Section, response.get("sections", []))
+        return _pagination_response(response, sections)
+
+    # Item methods
+    async def get_items(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get items with optional filtering and pagination"""
+        response = await self._get("/items", params=_build_query_params(params, filters))
+        items = self._decode_list(Item, [row["item"] for row in response.get("data", [])])
+        return _pagination_response(response, items)
+
+    async def get_items_with_location(self, params: Optional[PaginationParams] = None,
+                                      **filters) -> PaginationResponse:
+        """Get items together with the section and location path the server preloads"""
+        response = await self._get("/items", params=_build_query_params(params, filters))
+        rows = decode_items_with_location(response.get("data", []), self.parse_dates)
+        return _pagination_response(response, rows)
+
+    async def get_item(self, item_id: int) -> Item:
+        """Get item by ID"""
+        response = await self._get(f"/items/{item_id}")
+        return self._decode(Item, response.get("item"))
+
+    async def create_item(self, item_data: Union[Item, Dict[str, Any]]) -> Item:
+        """Create new item"""
+        if isinstance(item_data, Item):
+            data = _model_payload(item_data, ['id', 'created_at', 'updated_at', 'section'])
+        else:
+            data = item_data
+
+        response = await self._post("/items", json_data=data)
+        return self._decode(Item, response.get("item"))
+
+    async def create_items_bulk(self, items: List[Union[Item, Dict[str, Any]]]) -> BulkResult:
+        """Create many items in one request (at most 5000 rows)"""
+        data = [_model_payload(item, ['id', 'created_at', 'updated_at', 'section'])
+                if isinstance(item, Item) else item for item in items]
+        response = await self._post("/items/bulk", json_data={"items": data})
+        return _bulk_result(response, "items", data, lambda rows: self._decode_list(Item, rows))
+
+    async def update_item(self, item_id: int, item_data: Union[Item, Dict[str, Any]]) -> Item:
+        """Update item"""
+        if isinstance(item_data, Item):
+            data = _model_payload(item_data, ['id', 'created_at', 'updated_at', 'section'])
+        else:
+            data = item_data
+
+        response = await self._put(f"/items/{item_id}", json_data=data)
+        return self._decode(Item, response.get("item"))
+
+    async def delete_item(self, item_id: int) -> bool:
+        """Delete item"""
+        await self._delete(f"/items/{item_id}")
+        return True
+
+    async def update_item_quantity(self, item_id: int, quantity: int) -> Item:
+        """Update item quantity"""
+        data = {"quantity": quantity}
+        response = await self._put(f"/items/{item_id}/quantity", json_data=data)
+        return self._decode(Item, response.get("item"))
+
+    async def update_item_quantities(self, updates: List[Dict[str, int]]) -> BulkResult:
+        """Set the quantity of many items in one request (at most 5000 rows)"""
+        response = await self._put("/items/quantities", json_data={"updates": updates})
+        return _bulk_result(response, "items", updates, lambda rows: self._decode_list(Item, rows))
+
+    async def get_categories(self) -> List[str]:
+        """Get all item categories"""
+        response = await self._get("/items/categories")
+        return response.get("categories", [])
+
+    async def get_low_stock_items(self, params: Optional[PaginationParams] = None) -> PaginationResponse:
+        """Get low stock items"""
+        response = await self._get("/items/low-stock", params=_build_query_params(params))
+        items = self._decode_list(Item, response.get("data", []))
+        return _pagination_response(response, items)
+
+    async def get_expiring_items(self, params: Optional[PaginationParams] = None) -> PaginationResponse:
+        """Get expiring items"""
+        response = await self._get("/items/expiring", params=_build_query_params(params))
+        items = self._decode_list(Item, response.get("data", []))
+        return _pagination_response(response, items)
+
+    async def check_item_code_exists(self, code: str, exclude_id: int = None) -> bool:
+        """Check if item code already exists"""
+        params = {"code": code}
+        if exclude_id:
+            params["exclude_id"] = exclude_id
+
+        response = await self._get("/items/check-code", params=params)
+        return response.get("exists", False)
+
+    # Movement methods
+    async def get_movements(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get movement records with optional filtering and pagination"""
+        response = await self._get("/movements", params=_build_query_params(params, filters))
+        movements = self._decode_list(Movement, response.get("data", []))
+        return _pagination_response(response, movements)
+
+    async def create_movement(self, movement_data: Union[Movement, Dict[str, Any]]) -> Movement:
+        """Create new movement record (admin only)"""
+        if isinstance(movement_data, Movement):
+            data = _model_payload(movement_data, ['id', 'created_at', 'updated_at', 'item', 'user'])
+        else:
+            data = movement_data
+
+        response = await self._post("/admin/movements", json_data=data)
+        return self._decode(Movement, response.get("movement"))
+
+    async def delete_movement(self, movement_id: int) -> bool:
+        """Delete movement record (admin only)"""
+        await self._delete(f"/admin/movements/{movement_id}")
+        return True
+
+    async def export_movements_csv(self, **filters) -> bytes:
+        """Export movements to CSV"""
+        query_params = _encode_query_params({k: v for k, v in filters.items() if v})
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async('GET', f"{self.api_base}/movements/export")
+
+        try:
+            async with self._get_session().get(f"{self.api_base}/movements/export",
+                                               params=query_params) as response:
+                _raise_for_status(response.status, response)
+                response.raise_for_status()
+                return await response.read()
+        except aiohttp.ClientError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    # User management methods (admin only)
+    async def register_user(self, user_data: Union[User, Dict[str, Any]]) -> User:
+        """Register new user (admin only)"""
+        if isinstance(user_data, User):
+            data = _model_payload(user_data, ['id', 'created_at', 'updated_at', 'last_login'])
+        else:
+            data = user_data
+
+        response = await self._post("/admin/register", json_data=data)
+        return self._decode(User, response.get("user"))
+
+    async def get_users(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
+        """Get users (admin only)"""
+        response = await self._get("/admin/users", params=_build_query_params(params, filters))
+        users = self._decode_list(User, response.get("data", []))
+        return _pagination_response(response, users)
+
+    async def get_user(self, user_id: int) -> User:
+        """Get user by ID (admin only)"""
+        response = await self._get(f"/admin/users/{user_id}")
+        return self._decode(User, response.get("user"))
+
+    async def update_user(self, user_id: int, user_data: Union[User, Dict[str, Any]]) -> User:
+        """Update user (admin only)"""
+        if isinstance(user_data, User):
+            data = _model_payload(user_data, ['id', 'created_at', 'updated_at', 'last_login'])
+        else:
+            data = user_data
+
+        response = await self._put(f"/admin/users/{user_id}", json_data=data)
+        return self._decode(User, response.get("user"))
+
+    async def delete_user(self, user_id: int) -> bool:
+        """Delete user (admin only)"""
+        await self._delete(f"/admin/users/{user_id}")
+        return True
+
+    # Statistics methods
+    async def get_dashboard_stats(self) -> Dict[str, Any]:
+        """Get dashboard statistics"""
+        return await self._get("/stats/dashboard")
+
+    async def get_user_stats(self) -> Dict[str, Any]:
+        """Get user statistics"""
+        return await self._get("/stats/user")
+
+    # Health check
+    async def health_check(self) -> Dict[str, str]:
+        """Check API health"""
+        return await self._get("/health")
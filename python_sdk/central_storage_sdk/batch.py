@@ -2,144 +2,601 @@
 Batch operations for the Central Storage System SDK
 """
 
-from typing import List, Dict, Any, Optional, Callable
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, Iterable, Iterator
 from .client import CentralStorageClient
-from .models import Laboratory, Storage, Section, Item, PaginationParams
+from .codes import CodeAllocator
+from .concurrency import AdaptiveLimiter
+from .datagen import TestDataGenerator
+from .exceptions import APIError, NotFoundError
+from .models import Laboratory, Storage, Section, Item, BulkResult
 from .utils import (
-    generate_test_laboratories,
-    generate_test_storages, 
     generate_test_sections,
     generate_test_items,
-    batch_create_with_progress
+    batch_create_with_progress,
+    concurrent_map,
+    submit_in_context
 )
 
 
+# Error of the /:id routes an older server matches bulk paths against
+# (PUT /items/quantities is taken as PUT /items/:id with a bad ID)
+_INVALID_ID_ERROR = re.compile(r"Invalid \w+ ID")
+
+
+def _bulk_route_missing(error: APIError) -> bool:
+    """Whether a failed bulk request shows the server has no such route"""
+    if isinstance(error, NotFoundError) or error.status_code == 405:
+        return True
+    if error.status_code != 400 or error.response is None:
+        return False
+    try:
+        payload = error.response.json()
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and bool(_INVALID_ID_ERROR.fullmatch(str(payload.get("error", ""))))
+
+
+def _parent_id(record) -> Optional[int]:
+    """ID of the record one level up (section of an item, storage of a section, ...)"""
+    if isinstance(record, Item):
+        return record.section_id
+    if isinstance(record, Section):
+        return record.storage_id
+    if isinstance(record, Storage):
+        return record.lab_id
+    return None
+
+
+class _ChunkSizer:
+    """Sizes bulk requests so each one takes about target_seconds
+    
+    Starts small, then follows the measured rows/second (at most doubling per
+    request). A 413 from the server lowers the ceiling to half the rejected size.
+    """
+    
+    def __init__(self, initial: int = 200, minimum: int = 10, maximum: int = 5000, target_seconds: float = 1.0):
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self._lock = threading.Lock()
+    
+    def chunks(self, rows: Iterable[Any]) -> Iterator[List[Any]]:
+        """Split rows lazily into chunks of the current size"""
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def record(self, rows: int, seconds: float):
+        """Adjust the size after a request of `rows` rows took `seconds`"""
+        if seconds <= 0:
+            return
+        ideal = rows / seconds * self.target_seconds
+        with self._lock:
+            self.size = int(max(self.minimum, min(self.maximum, ideal, self.size * 2)))
+    
+    def shrink(self, rows: int):
+        """The server rejected a request of `rows` rows as too large"""
+        with self._lock:
+            self.maximum = max(self.minimum, rows // 2)
+            self.size = min(self.size, self.maximum)
+
+
+@dataclass
+class PurgeReport:
+    """Outcome of BatchOperations.delete_all_data"""
+    deleted: Dict[str, int] = field(default_factory=dict)   # level -> records deleted
+    skipped: Dict[str, int] = field(default_factory=dict)   # level -> parents left because children failed
+    failures: List[Tuple[str, int, Exception]] = field(default_factory=list)  # (level, id, error)
+    seconds: Dict[str, float] = field(default_factory=dict)  # level -> time spent deleting
+    collect_seconds: float = 0.0
+    total_seconds: float = 0.0
+    error: Optional[Exception] = None  # Listing the records failed; nothing was deleted
+    
+    @property
+    def total_deleted(self) -> int:
+        return sum(self.deleted.values())
+    
+    @property
+    def throughput(self) -> float:
+        """Deleted records per second of deletion time"""
+        elapsed = sum(self.seconds.values())
+        return self.total_deleted / elapsed if elapsed else 0.0
+    
+    def __bool__(self) -> bool:
+        # Truthy like the old True/False result: something ran and nothing failed
+        return (bool(self.deleted) and self.error is None and not self.failures
+                and not any(self.skipped.values()))
+    
+    def summary(self) -> str:
+        lines = [f"Deleted {self.total_deleted} records in {self.total_seconds:.1f}s "
+                 f"({self.throughput:.1f}/s, listing took {self.collect_seconds:.1f}s)"]
+        if self.error is not None:
+            lines.append(f"  Listing failed: {self.error}")
+        for level, deleted in self.deleted.items():
+            elapsed = self.seconds.get(level, 0.0)
+            rate = deleted / elapsed if elapsed else 0.0
+            line = f"  {level}: {deleted} deleted in {elapsed:.1f}s ({rate:.1f}/s)"
+            if self.skipped.get(level):
+                line += f", {self.skipped[level]} skipped"
+            lines.append(line)
+        if self.failures:
+            lines.append(f"  {len(self.failures)} failures:")
+            lines.extend(f"    {level} {record_id}: {error}" for level, record_id, error in self.failures[:20])
+            if len(self.failures) > 20:
+                lines.append(f"    ... and {len(self.failures) - 20} more")
+        return "\n".join(lines)
+
+
 class BatchOperations:
     """Batch operations for efficient data management"""
     
-    def __init__(self, client: CentralStorageClient):
+    def __init__(self, client: CentralStorageClient, max_workers: int = 1, use_bulk: bool = True,
+                 bulk_chunk_size: Optional[int] = None, limiter: Optional[AdaptiveLimiter] = None):
+        """
+        Initialize batch operations
+        
+        Args:
+            client: Authenticated API client
+            max_workers: Default number of concurrent requests for batch creation
+            use_bulk: Use the server's bulk endpoints for items, sections and quantity
+                updates; switched off automatically when the server lacks them
+            bulk_chunk_size: Fixed rows per bulk request (default: sized automatically)
+            limiter: Adapt the number of requests in flight to the server's health
+                instead of using a fixed max_workers; worker pools are then sized
+                to limiter.maximum and max_workers arguments are ignored
+        """
         self.client = client
+        self.max_workers = max_workers
+        self.use_bulk = use_bulk
+        self.bulk_chunk_size = bulk_chunk_size
+        self.limiter = limiter
+    
+    def _workers(self, max_workers: Optional[int]) -> int:
+        if self.limiter is not None:
+            return self.limiter.maximum
+        return max_workers or self.max_workers
+    
+    def _limited(self, func: Callable, units: Optional[Callable[[Any], int]] = None) -> Callable:
+        """func gated by the adaptive limiter, when there is one"""
+        return func if self.limiter is None else self.limiter.wrap(func, units)
+    
+    def _report_limiter(self):
+        if self.limiter is not None:
+            print(self.limiter.summary())
+    
+    def _chunk_sizer(self) -> _ChunkSizer:
+        if self.bulk_chunk_size:
+            return _ChunkSizer(self.bulk_chunk_size, self.bulk_chunk_size, self.bulk_chunk_size)
+        return _ChunkSizer()
+    
+    def _send_rows(self, single_func: Callable, chunk: List[Any]) -> Tuple[List[Any], List[Tuple[int, Exception]]]:
+        """Fallback: one request per row"""
+        results, errors = [], []
+        for index, row in enumerate(chunk):
+            try:
+                results.append(single_func(row))
+            except Exception as e:
+                results.append(None)
+                errors.append((index, e))
+        return results, errors
+    
+    def _send_chunk(self, bulk_func: Callable, single_func: Callable, chunk: List[Any],
+                    sizer: _ChunkSizer) -> Tuple[List[Any], List[Tuple[int, Exception]]]:
+        """Send one chunk; returns per-row results (None on failure) and (index, error) pairs"""
+        if not self.use_bulk:
+            return self._send_rows(single_func, chunk)
+        try:
+            result: BulkResult = bulk_func(chunk)
+        except APIError as e:
+            if _bulk_route_missing(e):
+                if self.use_bulk:
+                    print("Bulk endpoints not available on this server, falling back to one request per row")
+                self.use_bulk = False
+                return self._send_rows(single_func, chunk)
+            if e.status_code == 400:
+                # The server rejected the request as a whole; its rows fail, bulk stays on
+                return [None] * len(chunk), [(index, e) for index in range(len(chunk))]
+            if e.status_code != 413 or len(chunk) <= 1:
+                raise
+            sizer.shrink(len(chunk))
+            half = len(chunk) // 2
+            first, first_errors = self._send_chunk(bulk_func, single_func, chunk[:half], sizer)
+            second, second_errors = self._send_chunk(bulk_func, single_func, chunk[half:], sizer)
+            return first + second, first_errors + [(index + half, error) for index, error in second_errors]
+        return result.data, [(error.index, APIError(error.error)) for error in result.errors]
+    
+    def _run_bulk(self, bulk_func: Callable, single_func: Callable, rows: Iterable[Any], description: str,
+                  max_workers: Optional[int] = None,
+                  failures: Optional[List[Tuple[int, Any, Exception]]] = None) -> List[Any]:
+        """Send rows through a bulk endpoint in automatically sized chunks
+        
+        Chunks are built lazily from the input and sent with max_workers
+        concurrent requests. Rows the server rejected are reported individually
+        (row_number, data, error) like batch_create_with_progress does.
+        """
+        sizer = self._chunk_sizer()
+        total = len(rows) if hasattr(rows, '__len__') else None
+        print(f"{description} {total if total is not None else 'streamed'} rows in bulk...")
+        
+        def send(chunk):
+            start = time.perf_counter()
+            outcome = self._send_chunk(bulk_func, single_func, chunk, sizer)
+            sizer.record(len(chunk), time.perf_counter() - start)
+            return outcome
+        
+        succeeded = []
+        done = 0
+        send = self._limited(send, len)
+        for chunk, outcome, error in concurrent_map(send, sizer.chunks(rows), self._workers(max_workers)):
+            if error is not None:
+                outcome = ([None] * len(chunk), [(index, error) for index in range(len(chunk))])
+            results, errors = outcome
+            for index, row_error in errors:
+                print(f"Failed row {done + index + 1}: {row_error}")
+                if failures is not None:
+                    failures.append((done + index + 1, chunk[index], row_error))
+            succeeded.extend(result for result in results if result is not None)
+            done += len(chunk)
+            print(f"Progress: {done}/{total} ({done / total * 100:.1f}%)" if total else f"Progress: {done}")
+        
+        print(f"Successfully processed {len(succeeded)} out of {done} rows")
+        self._report_limiter()
+        return succeeded
     
-    def create_laboratories_batch(self, lab_data_list: List[Dict[str, Any]]) -> List[Laboratory]:
+    def create_laboratories_batch(self, lab_data_list: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                                  failures: Optional[List] = None) -> List[Laboratory]:
         """Batch create laboratories"""
-        return batch_create_with_progress(
+        created = batch_create_with_progress(
             self.client,
-            self.client.create_laboratory,
+            self._limited(self.client.create_laboratory),
             lab_data_list,
-            "Creating laboratories"
+            "Creating laboratories",
+            max_workers=self._workers(max_workers),
+            failures=failures
         )
+        self._report_limiter()
+        return created
     
-    def create_storages_batch(self, storage_data_list: List[Dict[str, Any]]) -> List[Storage]:
+    def create_storages_batch(self, storage_data_list: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                              failures: Optional[List] = None) -> List[Storage]:
         """Batch create storage devices"""
-        return batch_create_with_progress(
+        created = batch_create_with_progress(
             self.client,
-            self.client.create_storage,
+            self._limited(self.client.create_storage),
             storage_data_list,
-            "Creating storage devices"
+            "Creating storage devices",
+            max_workers=self._workers(max_workers),
+            failures=failures
         )
+        self._report_limiter()
+        return created
     
-    def create_sections_batch(self, section_data_list: List[Dict[str, Any]]) -> List[Section]:
-        """Batch create sections"""
-        return batch_create_with_progress(
+    def create_sections_batch(self, section_data_list: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                              failures: Optional[List] = None) -> List[Section]:
+        """Batch create sections (through the bulk endpoint unless use_bulk is off)"""
+        if self.use_bulk:
+            return self._run_bulk(self.client.create_sections_bulk, self.client.create_section,
+                                  section_data_list, "Creating sections", max_workers, failures)
+        created = batch_create_with_progress(
             self.client,
-            self.client.create_section,
+            self._limited(self.client.create_section),
             section_data_list,
-            "Creating sections"
+            "Creating sections",
+            max_workers=self._workers(max_workers),
+            failures=failures
         )
+        self._report_limiter()
+        return created
     
-    def create_items_batch(self, item_data_list: List[Dict[str, Any]]) -> List[Item]:
-        """Batch create items"""
-        return batch_create_with_progress(
+    def create_items_batch(self, item_data_list: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                           failures: Optional[List] = None) -> List[Item]:
+        """Batch create items (through the bulk endpoint unless use_bulk is off)"""
+        if self.use_bulk:
+            return self._run_bulk(self.client.create_items_bulk, self.client.create_item,
+                                  item_data_list, "Creating items", max_workers, failures)
+        created = batch_create_with_progress(
             self.client,
-            self.client.create_item,
+            self._limited(self.client.create_item),
             item_data_list,
-            "Creating items"
+            "Creating items",
+            max_workers=self._workers(max_workers),
+            failures=failures
         )
+        self._report_limiter()
+        return created
     
     def setup_test_environment(self, 
                              lab_count: int = 5,
                              storage_per_lab: int = 3,
                              section_per_storage: int = 5,
-                             item_per_section: int = 3) -> Dict[str, List]:
-        """Set up a complete test environment"""
-        print("Setting up test environment...")
-        
-        # Create laboratories
-        print(f"\n1. Creating {lab_count} laboratories...")
-        lab_data = generate_test_laboratories(lab_count)
-        laboratories = self.create_laboratories_batch(lab_data)
-        lab_ids = [lab.id for lab in laboratories if lab.id]
-        
-        # Create storage devices
-        print(f"\n2. Creating {len(lab_ids) * storage_per_lab} storage devices...")
-        storage_data = generate_test_storages(lab_ids, storage_per_lab)
-        storages = self.create_storages_batch(storage_data)
-        storage_ids = [storage.id for storage in storages if storage.id]
-        
-        # Create sections
-        print(f"\n3. Creating {len(storage_ids) * section_per_storage} sections...")
-        section_data = generate_test_sections(storage_ids, section_per_storage)
-        sections = self.create_sections_batch(section_data)
-        section_ids = [section.id for section in sections if section.id]
-        
-        # Create items
-        print(f"\n4. Creating {len(section_ids) * item_per_section} items...")
-        item_data = generate_test_items(section_ids, item_per_section)
-        items = self.create_items_batch(item_data)
-        
-        print("\n✅ Test environment setup complete!")
-        print(f"Created: {len(laboratories)} labs, {len(storages)} storages, {len(sections)} sections, {len(items)} items")
-        
-        return {
-            "laboratories": laboratories,
-            "storages": storages,
-            "sections": sections,
-            "items": items
+                             item_per_section: int = 3,
+                             max_workers: Optional[int] = None,
+                             failures: Optional[List] = None,
+                             seed: Optional[int] = None,
+                             allocator: Optional[CodeAllocator] = None) -> Dict[str, List]:
+        """Set up a complete test environment
+        
+        Creation is pipelined along the hierarchy instead of level by level: a
+        laboratory's storages are queued as soon as the laboratory exists, a
+        storage's sections as soon as the storage exists, and a section's items
+        as soon as the section exists, with at most max_workers requests in
+        flight. Sections and items are gathered across parents into bulk
+        chunks; a partial chunk is only sent when there is nothing else to do.
+        Each parent's children come from a TestDataGenerator fork keyed by the
+        parent's position, so a seed gives the same rows under the same parents
+        whatever order the requests complete in.
+        
+        Args:
+            lab_count: Laboratories to create
+            storage_per_lab: Storage devices per laboratory
+            section_per_storage: Sections per storage device
+            item_per_section: Items per section
+            max_workers: Concurrent requests (default: 8, or self.max_workers if higher;
+                with a limiter, its current limit)
+            failures: Optional list receiving (level, data, exception) for every failed row
+            seed: Seed for the generated rows (see TestDataGenerator)
+            allocator: CodeAllocator the generated codes are drawn from, so they
+                never collide with existing records
+        
+        Returns:
+            Created records per level, ordered by ID
+        """
+        workers = max_workers or max(self.max_workers, 8)
+        if self.limiter is not None:
+            workers = self.limiter.maximum
+        storage_count = lab_count * storage_per_lab
+        section_count = storage_count * section_per_storage
+        expected = {
+            "laboratories": lab_count,
+            "storages": storage_count,
+            "sections": section_count,
+            "items": section_count * item_per_section,
+        }
+        generator = TestDataGenerator(seed, allocator=allocator)
+        print(f"Setting up test environment with {workers} concurrent requests (seed {generator.seed})...")
+        
+        client = self.client
+        single_funcs = {
+            "laboratories": client.create_laboratory,
+            "storages": client.create_storage,
+            "sections": client.create_section,
+            "items": client.create_item,
         }
+        bulk_funcs = {"sections": client.create_sections_bulk, "items": client.create_items_bulk}
+        sizers = {level: self._chunk_sizer() for level in bulk_funcs}
+        
+        # Laboratories and storages have no bulk endpoint and go one per request;
+        # sections and items wait in per-level buffers until a chunk is full
+        # Rows are queued as (position, data); a row's position within its level
+        # keys the generator fork its children are drawn from
+        singles = deque(("laboratories", (index, data))
+                        for index, data in enumerate(generator.laboratories(lab_count)))
+        buffers = {level: deque() for level in bulk_funcs}
+        created: Dict[str, List] = {level: [] for level in expected}
+        failed = 0
+        
+        def queue_children(level, index, record):
+            if level == "laboratories":
+                first = index * storage_per_lab
+                fork = generator.fork(f"storages/{index}", {"STG": first})
+                rows = fork.storages([record.id], storage_per_lab)
+                singles.extend(("storages", (first + i, data)) for i, data in enumerate(rows))
+            elif level == "storages":
+                first = index * section_per_storage
+                fork = generator.fork(f"sections/{index}", {"SEC": first})
+                rows = fork.sections([record.id], section_per_storage)
+                buffers["sections"].extend((first + i, data) for i, data in enumerate(rows))
+            elif level == "sections":
+                first = index * item_per_section
+                fork = generator.fork(f"items/{index}", {"ITM": first, "BATCH": first})
+                rows = fork.items([record.id], item_per_section)
+                buffers["items"].extend((first + i, data) for i, data in enumerate(rows))
+        
+        def take(level, partial):
+            size = sizers[level].size if self.use_bulk else 1
+            buffer = buffers[level]
+            if len(buffer) < size and not (partial and buffer):
+                return None
+            return level, [buffer.popleft() for _ in range(min(size, len(buffer)))]
+        
+        def next_task():
+            # Deepest level first keeps the buffers short
+            for partial in (False, True):
+                for level in ("items", "sections"):
+                    task = take(level, partial)
+                    if task:
+                        return task
+                if singles and not partial:
+                    level, data = singles.popleft()
+                    return level, [data]
+            return None
+        
+        def run(task):
+            level, rows = task[0], [data for _, data in task[1]]
+            if level not in bulk_funcs:
+                return [single_funcs[level](rows[0])], []
+            start = time.perf_counter()
+            outcome = self._send_chunk(bulk_funcs[level], single_funcs[level], rows, sizers[level])
+            sizers[level].record(len(rows), time.perf_counter() - start)
+            return outcome
+        
+        run = self._limited(run, lambda task: len(task[1]))
+        
+        def capacity():
+            return self.limiter.limit if self.limiter is not None else workers
+        
+        start = time.perf_counter()
+        last_report = start
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                while len(in_flight) < capacity():
+                    task = next_task()
+                    if task is None:
+                        break
+                    in_flight[submit_in_context(executor, run, task)] = task
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    level, queued = in_flight.pop(future)
+                    indexes = [index for index, _ in queued]
+                    rows = [data for _, data in queued]
+                    try:
+                        results, errors = future.result()
+                    except Exception as e:
+                        results, errors = [None] * len(rows), [(index, e) for index in range(len(rows))]
+                    for index, error in errors:
+                        failed += 1
+                        print(f"Failed to create {level} row: {error}")
+                        if failures is not None:
+                            failures.append((level, rows[index], error))
+                    for index, record in zip(indexes, results):
+                        if record is not None:
+                            created[level].append(record)
+                            queue_children(level, index, record)
+                
+                if time.perf_counter() - last_report >= 1:
+                    last_report = time.perf_counter()
+                    print("Progress: " + ", ".join(f"{len(created[level])}/{expected[level]} {level}"
+                                                   for level in expected))
+        
+        for records in created.values():
+            records.sort(key=lambda record: record.id or 0)
+        
+        print(f"\n✅ Test environment setup complete in {time.perf_counter() - start:.1f}s!")
+        print(f"Created: {len(created['laboratories'])} labs, {len(created['storages'])} storages, "
+              f"{len(created['sections'])} sections, {len(created['items'])} items ({failed} failed rows)")
+        self._report_limiter()
+        
+        return created
     
-    def delete_all_data(self, confirm: bool = False) -> bool:
-        """Delete all data (USE WITH CAUTION!)"""
+    def delete_all_data(self, confirm: bool = False, lab_id: Optional[int] = None,
+                        storage_id: Optional[int] = None, max_workers: Optional[int] = None) -> "PurgeReport":
+        """Delete all data, or one laboratory/storage subtree (USE WITH CAUTION!)
+        
+        Every page of every level is collected first, then records are deleted
+        level by level (items -> sections -> storages -> laboratories) with
+        max_workers concurrent requests within a level. A parent whose children
+        failed to delete is skipped instead of being sent to the server, which
+        would refuse it. Records already gone (404) count as deleted.
+        
+        Args:
+            confirm: Must be True, otherwise nothing is deleted
+            lab_id: Only purge this laboratory and everything below it
+            storage_id: Only purge this storage device and everything below it
+            max_workers: Concurrent delete requests (default: 8, or self.max_workers if higher)
+        
+        Returns:
+            PurgeReport with per-level counts, failures and throughput; truthy
+            when nothing failed. If listing the records fails, nothing is deleted
+            and the report's error holds the exception
+        """
         if not confirm:
             print("This will delete ALL data! Call with confirm=True to proceed.")
-            return False
+            return PurgeReport()
+        if lab_id is not None and storage_id is not None:
+            raise ValueError("Pass either lab_id or storage_id, not both")
         
-        print("Deleting all data...")
+        workers = max_workers or max(self.max_workers, 8)
+        scope = (f"laboratory {lab_id}" if lab_id is not None else
+                 f"storage {storage_id}" if storage_id is not None else "all data")
+        print(f"Deleting {scope}...")
         
+        report = PurgeReport()
+        start = time.perf_counter()
         try:
-            # Delete items first (foreign key constraints)
-            print("Deleting items...")
-            items = self.client.get_items(PaginationParams(page_size=100))
-            for item in items.data:
-                if item.id:
-                    self.client.delete_item(item.id)
-            
-            # Delete sections
-            print("Deleting sections...")
-            sections = self.client.get_sections(PaginationParams(page_size=100))
-            for section in sections.data:
-                if section.id:
-                    self.client.delete_section(section.id)
-            
-            # Delete storages
-            print("Deleting storages...")
-            storages = self.client.get_storages(PaginationParams(page_size=100))
-            for storage in storages.data:
-                if storage.id:
-                    self.client.delete_storage(storage.id)
-            
-            # Delete laboratories
-            print("Deleting laboratories...")
-            labs = self.client.get_laboratories(PaginationParams(page_size=100))
-            for lab in labs.data:
-                if lab.id:
-                    self.client.delete_laboratory(lab.id)
-            
-            print("All data deleted successfully!")
-            return True
-            
+            levels = self._collect_purge_targets(lab_id, storage_id, workers)
         except Exception as e:
+            # Unknown lab_id/storage_id or a failed listing: nothing has been deleted yet
+            report.error = e
+            report.collect_seconds = report.total_seconds = time.perf_counter() - start
             print(f"Error during deletion: {e}")
-            return False
+            return report
+        report.collect_seconds = time.perf_counter() - start
+        
+        delete_funcs = {
+            "items": self.client.delete_item,
+            "sections": self.client.delete_section,
+            "storages": self.client.delete_storage,
+            "laboratories": self.client.delete_laboratory,
+        }
+        blocked: Set[int] = set()  # Parents (of the next level) with children left behind
+        for level, records in levels:
+            targets = [record for record in records if record.id not in blocked]
+            report.skipped[level] = len(records) - len(targets)
+            blocked = {_parent_id(record) for record in records if record.id in blocked}
+            
+            print(f"Deleting {len(targets)} {level}...")
+            level_start = time.perf_counter()
+            delete = delete_funcs[level]
+            deleted = 0
+            for record, _, error in concurrent_map(lambda record: delete(record.id), targets, workers):
+                if error is None or isinstance(error, NotFoundError):
+                    deleted += 1
+                    continue
+                report.failures.append((level, record.id, error))
+                blocked.add(_parent_id(record))
+            report.deleted[level] = deleted
+            report.seconds[level] = time.perf_counter() - level_start
+        
+        report.total_seconds = time.perf_counter() - start
+        print(report.summary())
+        return report
+    
+    def _collect_purge_targets(self, lab_id: Optional[int], storage_id: Optional[int],
+                               workers: int) -> List[Tuple[str, List[Any]]]:
+        """Records to delete per level, children first"""
+        client = self.client
+        if storage_id is not None:
+            labs = []
+            storages = [client.get_storage(storage_id)]
+            sections = client.fetch_all("sections", storage_id=storage_id, concurrency=workers)
+        elif lab_id is not None:
+            labs = [client.get_laboratory(lab_id)]
+            storages = client.fetch_all("storages", lab_id=lab_id, concurrency=workers)
+            # The laboratory_id filter joins storages, which leaves created_at/status
+            # ambiguous on the server; list each storage's sections instead
+            sections = []
+            storage_sections = concurrent_map(
+                lambda storage: client.fetch_all("sections", storage_id=storage.id, concurrency=1),
+                storages, workers)
+            for storage, found, error in storage_sections:
+                if error is not None:
+                    raise error
+                sections.extend(found)
+        else:
+            labs = client.fetch_all("laboratories", concurrency=workers)
+            storages = client.fetch_all("storages", concurrency=workers)
+            sections = client.fetch_all("sections", concurrency=workers)
+        
+        if lab_id is None and storage_id is None:
+            items = client.fetch_all("items", concurrency=workers)
+        else:
+            # Only the subtree's items: one paginated listing per section
+            items = []
+            section_items = concurrent_map(lambda section: list(client.iter_items(section_id=section.id,
+                                                                                 prefetch=False)),
+                                           sections, workers)
+            for section, found, error in section_items:
+                if error is not None:
+                    raise error
+                items.extend(found)
+        
+        return [("items", items), ("sections", sections), ("storages", storages), ("laboratories", labs)]
     
     def create_sections_for_storage(self, storage_id: int, count: int = 10) -> List[Section]:
         """Create multiple sections for a specific storage device"""
@@ -155,32 +612,32 @@ class BatchOperations:
         """Get complete inventory overview"""
         print("Retrieving full inventory...")
         
-        # Get all data
-        labs = self.client.get_laboratories(PaginationParams(page_size=100))
-        storages = self.client.get_storages(PaginationParams(page_size=100))
-        sections = self.client.get_sections(PaginationParams(page_size=100))
-        items = self.client.get_items(PaginationParams(page_size=100))
+        # Get all data, walking every page
+        labs = list(self.client.iter_laboratories())
+        storages = list(self.client.iter_storages())
+        sections = list(self.client.iter_sections())
+        items = list(self.client.iter_items())
         
         inventory = {
             "laboratories": {
-                "count": labs.total,
-                "data": labs.data
+                "count": len(labs),
+                "data": labs
             },
             "storages": {
-                "count": storages.total,
-                "data": storages.data
+                "count": len(storages),
+                "data": storages
             },
             "sections": {
-                "count": sections.total,
-                "data": sections.data
+                "count": len(sections),
+                "data": sections
             },
             "items": {
-                "count": items.total,
-                "data": items.data
+                "count": len(items),
+                "data": items
             }
         }
         
-        print(f"Inventory: {labs.total} labs, {storages.total} storages, {sections.total} sections, {items.total} items")
+        print(f"Inventory: {len(labs)} labs, {len(storages)} storages, {len(sections)} sections, {len(items)} items")
         return inventory
     
     def migrate_sections_to_storage(self, section_ids: List[int], target_storage_id: int) -> List[Section]:
@@ -198,20 +655,32 @@ class BatchOperations:
         
         return migrated_sections
     
-    def bulk_update_item_quantities(self, item_updates: List[Dict[str, int]]) -> List[Item]:
+    def bulk_update_item_quantities(self, item_updates: List[Dict[str, int]], max_workers: Optional[int] = None,
+                                    failures: Optional[List] = None) -> List[Item]:
         """Bulk update item quantities
         
         Args:
             item_updates: List of {"item_id": int, "quantity": int}
+            max_workers: Concurrent requests (default: self.max_workers)
+            failures: Optional list receiving (row_number, update, exception) for every failed row
         """
+        if self.use_bulk:
+            return self._run_bulk(
+                self.client.update_item_quantities,
+                lambda update: self.client.update_item_quantity(update["item_id"], update["quantity"]),
+                item_updates, "Updating quantities of", max_workers, failures
+            )
+        
         updated_items = []
         
-        for update in item_updates:
+        for row_number, update in enumerate(item_updates, 1):
             try:
                 item = self.client.update_item_quantity(update["item_id"], update["quantity"])
                 updated_items.append(item)
                 print(f"Updated item {item.name} quantity to {update['quantity']}")
             except Exception as e:
                 print(f"Failed to update item {update['item_id']}: {e}")
+                if failures is not None:
+                    failures.append((row_number, update, e))
         
         return updated_items
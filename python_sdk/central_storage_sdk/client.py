@@ -3,29 +3,161 @@ Main client for the Central Storage System API
 """
 
 import requests
+import codecs
+import csv
 import json
-from typing import List, Dict, Any, Optional, Union
+import threading
+import time
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
+from typing import List, Dict, Any, Optional, Union, Callable, Iterator, BinaryIO
 from urllib.parse import urljoin, urlencode
 
 from .models import *
 from .exceptions import *
+from .cache import TTLCache
+from .singleflight import SingleFlight
+from .metrics import ClientMetrics
+from .hooks import HOOK_EVENTS, RequestSpan
+from .transport import TransportConfig
+from .ratelimit import RateLimiter
+from .columnar import ItemColumns, MovementColumns
+from .utils import submit_in_context
+
+
+def _raise_for_status(status_code: int, response=None):
+    """Map HTTP error status codes onto SDK exceptions"""
+    if status_code == 401:
+        raise AuthenticationError("Authentication failed", status_code, response)
+    elif status_code == 403:
+        raise PermissionError("Permission denied", status_code, response)
+    elif status_code == 404:
+        raise NotFoundError("Resource not found", status_code, response)
+    elif status_code == 400:
+        raise ValidationError("Request validation failed", status_code, response)
+    elif status_code == 413:
+        raise APIError("Request too large", status_code, response)
+    elif status_code >= 500:
+        raise APIError("Server error", status_code, response)
+
+
+def _build_query_params(params: Optional[PaginationParams] = None, filters: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Merge pagination parameters and filters, dropping empty values"""
+    query_params = {}
+    
+    if params:
+        query_params.update({
+            'page': params.page,
+            'page_size': params.page_size,
+            'search': params.search,
+            'sort_by': params.sort_by,
+            'sort_desc': params.sort_desc
+        })
+    
+    if filters:
+        query_params.update(filters)
+    
+    # Remove empty parameters
+    return {k: v for k, v in query_params.items() if v}
+
+
+def _model_payload(model, exclude: List[str]) -> Dict[str, Any]:
+    """Convert a model dataclass to a request body, excluding None values and read-only fields"""
+    return {f.name: getattr(model, f.name) for f in fields(model)
+            if f.name not in exclude and getattr(model, f.name) is not None}
+
+
+def _bulk_result(response: Dict[str, Any], key: str, rows: List[Any], decode_list) -> BulkResult:
+    """Build a BulkResult from a bulk endpoint response (one entry per request row)"""
+    data = response.get(key) or [None] * len(rows)
+    decoded = decode_list([row for row in data if row is not None])
+    models = iter(decoded)
+    return BulkResult(
+        data=[next(models) if row is not None else None for row in data],
+        errors=[BulkRowError(index=error.get("index", 0), error=error.get("error", ""))
+                for error in response.get("errors") or []]
+    )
+
+
+def _iter_lines(chunks: Iterator[str]) -> Iterator[str]:
+    """Re-split a stream of text chunks into lines, keeping line endings for the csv module"""
+    pending = ""
+    for chunk in chunks:
+        lines = (pending + chunk).split('\n')
+        # The last piece is an incomplete line until the next newline arrives
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    if pending:
+        yield pending
+
+
+def _pagination_response(response: Dict[str, Any], data: List[Any]) -> PaginationResponse:
+    """Wrap parsed page data together with the server pagination envelope"""
+    return PaginationResponse(
+        data=data,
+        total=response.get("total", 0),
+        page=response.get("page", 1),
+        page_size=response.get("page_size", 20),
+        total_pages=response.get("total_pages", 0),
+        has_next=response.get("has_next", False),
+        has_prev=response.get("has_prev", False)
+    )
 
 
 class CentralStorageClient:
     """Main client for interacting with the Central Storage System API"""
     
-    def __init__(self, base_url: str = "http://localhost:8080", token: str = None):
+    def __init__(self, base_url: str = "http://localhost:8080", token: str = None,
+                 cache_ttl: Optional[float] = None, cache_maxsize: int = 1024,
+                 coalesce_gets: bool = True, transport: Optional[TransportConfig] = None,
+                 parse_dates: bool = False, metrics: bool = False,
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the client
         
         Args:
             base_url: Base URL of the API server
             token: Authentication token (JWT)
+            cache_ttl: Enable caching of get_laboratory/get_storage/get_section responses
+                for this many seconds (None disables the cache)
+            cache_maxsize: Maximum number of cached hierarchy responses
+            coalesce_gets: Share one in-flight request between threads issuing
+                identical GET requests at the same time
+            transport: Connection pool, timeout and retry settings
+            parse_dates: Decode created_at/updated_at/last_login into datetime objects
+                instead of keeping the server's strings
+            metrics: Record per-endpoint counts, errors, bytes and latency histograms
+                (see metrics_snapshot())
+            rate_limiter: Requests per second limits, overall and per endpoint class;
+                requests over the limit wait instead of failing (may be shared
+                between clients and threads)
         """
         self.base_url = base_url.rstrip('/')
         self.api_base = f"{self.base_url}/api"
+        self.transport = transport or TransportConfig()
+        self.parse_dates = parse_dates
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
         
+        adapter = HTTPAdapter(
+            pool_connections=self.transport.pool_connections,
+            pool_maxsize=self.transport.pool_maxsize,
+            pool_block=self.transport.pool_block
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl) if cache_ttl else None
+        self.singleflight = SingleFlight() if coalesce_gets else None
+        self.hooks: Dict[str, List[Callable[[RequestSpan], None]]] = {event: [] for event in HOOK_EVENTS}
+        self._observed = False
+        self._local = threading.local()
+        self.metrics: Optional[ClientMetrics] = None
+        if metrics:
+            self.enable_metrics()
+        
         if token:
             self.set_token(token)
     
@@ -33,24 +165,71 @@ class CentralStorageClient:
         """Set authentication token"""
         self.session.headers.update({'Authorization': f'Bearer {token}'})
     
-    def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request with error handling"""
+    def _request(self, method: str, endpoint: str, raw: bool = False, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with error handling
+        
+        Concurrent identical GET requests are coalesced into one HTTP call when
+        coalesce_gets is enabled; all callers receive the same parsed response.
+        
+        Args:
+            method: HTTP method
+            endpoint: Path below /api
+            raw: The caller uses the parsed JSON as is instead of passing it to
+                _decode/_decode_list, so hooks see after_decode right after parsing
+        """
         url = urljoin(self.api_base + '/', endpoint.lstrip('/'))
         
+        if method == 'GET' and self.singleflight is not None:
+            params = kwargs.get('params') or {}
+            key = (url, tuple(sorted((k, str(v)) for k, v in params.items())),
+                   self.session.headers.get('Authorization'))
+            return self.singleflight.do(key, lambda: self._send(method, url, raw, **kwargs))
+        
+        return self._send(method, url, raw, **kwargs)
+    
+    def _send(self, method: str, url: str, raw: bool = False, **kwargs) -> Dict[str, Any]:
+        """Send a single HTTP request and map errors onto SDK exceptions
+        
+        With hooks registered, the span of a successful request that is about to
+        be decoded stays pending on this thread until _decode/_decode_list
+        finish it and emit after_decode.
+        """
+        if not self._observed:
+            return self._send_checked(method, url, None, **kwargs)
+        self._flush_pending_span()
+        span = RequestSpan(method, url, kwargs.get('params'))
+        self._emit('before_send', span)
+        try:
+            data = self._send_checked(method, url, span, **kwargs)
+        except Exception as e:
+            span.finish(e)
+            self._emit('on_error', span)
+            raise
+        span.parsed()
+        if raw:
+            span.finish()
+            self._emit('after_decode', span)
+        else:
+            self._local.span = span
+        return data
+    
+    def _flush_pending_span(self):
+        """Emit after_decode for a span of this thread whose response was never decoded"""
+        span = getattr(self._local, 'span', None)
+        if span is not None:
+            self._local.span = None
+            span.finish()
+            self._emit('after_decode', span)
+    
+    def _send_checked(self, method: str, url: str, span: Optional[RequestSpan], **kwargs) -> Dict[str, Any]:
         try:
-            response = self.session.request(method, url, **kwargs)
+            response = self._send_with_retry(method, url, **kwargs)
+            if span is not None:
+                span.received(response)
+                self._emit('after_receive', span)
             
             # Handle different HTTP status codes
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed", response.status_code, response)
-            elif response.status_code == 403:
-                raise PermissionError("Permission denied", response.status_code, response)
-            elif response.status_code == 404:
-                raise NotFoundError("Resource not found", response.status_code, response)
-            elif response.status_code == 400:
-                raise ValidationError("Request validation failed", response.status_code, response)
-            elif response.status_code >= 500:
-                raise APIError("Server error", response.status_code, response)
+            _raise_for_status(response.status_code, response)
             
             response.raise_for_status()
             
@@ -63,13 +242,57 @@ class CentralStorageClient:
         except requests.RequestException as e:
             raise APIError(f"Request failed: {str(e)}")
     
-    def _get(self, endpoint: str, params: Dict = None) -> Dict[str, Any]:
+    def _send_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying transient failures according to the transport config"""
+        if self.transport.timeout is not None:
+            kwargs.setdefault('timeout', self.transport.timeout)
+        
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, url)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not self.transport.should_retry(method, attempt):
+                    raise
+                time.sleep(self.transport.backoff(attempt))
+            else:
+                if not self.transport.should_retry(method, attempt, response.status_code):
+                    return response
+                time.sleep(self.transport.backoff(attempt, response.headers.get('Retry-After')))
+                response.close()
+            attempt += 1
+    
+    def _send_tracked(self, method: str, url: str, stream: bool = False, **kwargs) -> requests.Response:
+        """_send_with_retry for raw responses, reported to hooks like _send
+        
+        There is nothing to decode, so after_decode follows after_receive directly.
+        """
+        if not self._observed:
+            return self._send_with_retry(method, url, stream=stream, **kwargs)
+        self._flush_pending_span()
+        span = RequestSpan(method, url, kwargs.get('params'), stream=stream)
+        self._emit('before_send', span)
+        try:
+            response = self._send_with_retry(method, url, stream=stream, **kwargs)
+            span.received(response)
+            self._emit('after_receive', span)
+        except Exception as e:
+            span.finish(e)
+            self._emit('on_error', span)
+            raise
+        span.finish()
+        self._emit('after_decode', span)
+        return response
+    
+    def _get(self, endpoint: str, params: Dict = None, raw: bool = False) -> Dict[str, Any]:
         """Make GET request"""
-        return self._request('GET', endpoint, params=params)
+        return self._request('GET', endpoint, raw, params=params)
     
-    def _post(self, endpoint: str, data: Dict = None, json_data: Dict = None) -> Dict[str, Any]:
+    def _post(self, endpoint: str, data: Dict = None, json_data: Dict = None, raw: bool = False) -> Dict[str, Any]:
         """Make POST request"""
-        return self._request('POST', endpoint, data=data, json=json_data)
+        return self._request('POST', endpoint, raw, data=data, json=json_data)
     
     def _put(self, endpoint: str, data: Dict = None, json_data: Dict = None) -> Dict[str, Any]:
         """Make PUT request"""
@@ -77,13 +300,215 @@ class CentralStorageClient:
     
     def _delete(self, endpoint: str) -> Dict[str, Any]:
         """Make DELETE request"""
-        return self._request('DELETE', endpoint)
+        return self._request('DELETE', endpoint, raw=True)
+    
+    def _decode(self, cls, data: Optional[Dict[str, Any]]):
+        """Decode a server JSON object into a model, ignoring unknown fields"""
+        return self._decoded(decode_model(cls, data, self.parse_dates))
+    
+    def _decode_list(self, cls, rows: Optional[List[Dict[str, Any]]]) -> List[Any]:
+        """Decode a list of server JSON objects into models, sharing repeated nested records"""
+        return self._decoded(decode_models(cls, rows, self.parse_dates))
+    
+    def _decoded(self, result):
+        """Finish this thread's pending span now that its response is decoded"""
+        if self._observed:
+            span = getattr(self._local, 'span', None)
+            if span is not None:
+                self._local.span = None
+                span.finish(decoded=True)
+                self._emit('after_decode', span)
+        return result
+    
+    def _cached_get(self, key: tuple, endpoint: str) -> Dict[str, Any]:
+        """GET through the hierarchy cache when it is enabled
+        
+        Cached responses are shared between callers, so nested data of models
+        built from them should be treated as read-only.
+        """
+        if self.cache is None:
+            return self._get(endpoint)
+        
+        response = self.cache.get(key)
+        if response is None:
+            # A write that invalidates while this request is in flight bumps the
+            # generation, and the possibly stale response is then not stored
+            generation = self.cache.generation
+            response = self._get(endpoint)
+            self.cache.set(key, response, generation)
+        return response
+    
+    def _invalidate_hierarchy(self):
+        """Drop cached hierarchy responses after a laboratory/storage/section write
+        
+        Laboratory, storage and section responses embed each other (e.g. a section
+        preloads its storage and laboratory), so any hierarchy write clears all of them.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters of the hierarchy cache (empty dict when disabled)"""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Requests and time spent waiting for the rate limiter per endpoint class
+        (empty dict without a limiter)"""
+        return self.rate_limiter.snapshot() if self.rate_limiter is not None else {}
+    
+    def add_hook(self, event: str, func: Callable[[RequestSpan], None]):
+        """Call func(span) at a point of every HTTP request
+        
+        Args:
+            event: One of before_send, after_receive, after_decode or on_error
+                (see central_storage_sdk.hooks)
+            func: Callable receiving the RequestSpan; it runs on the requesting
+                thread and its exceptions propagate to the caller
+        """
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook event {event!r}, expected one of {', '.join(HOOK_EVENTS)}")
+        self.hooks[event].append(func)
+        self._observed = True
+    
+    def remove_hook(self, event: str, func: Callable[[RequestSpan], None]):
+        """Unregister a hook added with add_hook (no-op if it is not registered)"""
+        if func in self.hooks.get(event, ()):
+            self.hooks[event].remove(func)
+        self._observed = any(self.hooks.values())
+    
+    def _emit(self, event: str, span: RequestSpan):
+        for func in self.hooks[event]:
+            func(span)
+    
+    def enable_metrics(self) -> ClientMetrics:
+        """Start recording request metrics (no-op if already enabled)"""
+        if self.metrics is None:
+            self.metrics = ClientMetrics()
+            self.add_hook('after_decode', self.metrics.record)
+            self.add_hook('on_error', self.metrics.record)
+        return self.metrics
+    
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Per-endpoint request metrics recorded so far (empty dict when disabled)
+        
+        Keys of "endpoints" are templates such as "GET /items/{id}"; each holds
+        count, errors by exception class, bytes_in/bytes_out and network, parse
+        and decode latency histograms.
+        """
+        return self.metrics.snapshot() if self.metrics is not None else {}
+    
+    def reset_metrics(self):
+        """Clear recorded request metrics"""
+        if self.metrics is not None:
+            self.metrics.reset()
+    
+    def iter_pages(self, fetch_page: Callable[..., PaginationResponse], params: Optional[PaginationParams] = None,
+                   prefetch: bool = True, **filters) -> Iterator[PaginationResponse]:
+        """Walk every page of a listing method, starting at params.page
+        
+        Args:
+            fetch_page: Listing method taking (params, **filters), e.g. client.get_items
+            params: Pagination parameters; defaults to the server maximum page size of 100
+            prefetch: Fetch page N+1 in a background thread while page N is consumed
+            **filters: Extra filters passed to every page request
+        """
+        base_params = replace(params) if params else PaginationParams(page_size=100)
+        
+        def fetch(page: int) -> PaginationResponse:
+            return fetch_page(replace(base_params, page=page), **filters)
+        
+        page = base_params.page
+        if not prefetch:
+            while True:
+                result = fetch(page)
+                yield result
+                if not (result.has_next and result.data):
+                    return
+                page += 1
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = submit_in_context(executor, fetch, page)
+        try:
+            while True:
+                result = future.result()
+                has_more = result.has_next and result.data
+                if has_more:
+                    future = submit_in_context(executor, fetch, page + 1)
+                yield result
+                if not has_more:
+                    return
+                page += 1
+        finally:
+            future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _listing_method(self, endpoint: str) -> Callable[..., PaginationResponse]:
+        """Resolve a paginated endpoint path to the listing method that parses it"""
+        listing_methods = {
+            "laboratories": self.get_laboratories,
+            "storages": self.get_storages,
+            "sections": self.get_sections,
+            "items": self.get_items,
+            "movements": self.get_movements,
+            "admin/users": self.get_users,
+        }
+        try:
+            return listing_methods[endpoint.strip('/')]
+        except KeyError:
+            raise ValueError(f"Unsupported paginated endpoint: {endpoint}")
+    
+    def fetch_all(self, endpoint: Union[str, Callable[..., PaginationResponse]],
+                  params: Optional[PaginationParams] = None, concurrency: int = 8, **filters) -> List[Any]:
+        """Read every page of a listing endpoint, fetching pages after the first concurrently
+        
+        The first page is fetched to learn total_pages, the remaining pages are
+        requested in parallel and reassembled in page order. Rows that shift
+        between pages while the read is in progress (offset pagination) are
+        deduplicated by id, keeping the first occurrence.
+        
+        Args:
+            endpoint: Endpoint path such as "/items" or "/movements", or a listing method
+            params: Pagination/sort parameters; defaults to the server maximum page size of 100
+            concurrency: Maximum number of pages requested at once
+            **filters: Extra filters passed to every page request
+        """
+        fetch_page = self._listing_method(endpoint) if isinstance(endpoint, str) else endpoint
+        base_params = replace(params) if params else PaginationParams(page_size=100)
+        
+        first = fetch_page(base_params, **filters)
+        pages = [first]
+        remaining = range(base_params.page + 1, first.total_pages + 1)
+        
+        if remaining:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(remaining)))) as executor:
+                futures = [submit_in_context(executor, fetch_page, replace(base_params, page=page), **filters)
+                           for page in remaining]
+                pages.extend(future.result() for future in futures)
+        
+        rows = []
+        seen_ids = set()
+        for page in pages:
+            for row in page.data:
+                row_id = getattr(row, "id", None)
+                if row_id is not None:
+                    if row_id in seen_ids:
+                        continue
+                    seen_ids.add(row_id)
+                rows.append(row)
+        
+        return rows
+    
+    def _iter_models(self, fetch_page: Callable[..., PaginationResponse], params: Optional[PaginationParams],
+                     prefetch: bool, filters: Dict[str, Any]) -> Iterator[Any]:
+        """Yield the model objects of every page one at a time"""
+        for page in self.iter_pages(fetch_page, params, prefetch, **filters):
+            yield from page.data
     
     # Authentication methods
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """Login and get authentication token"""
         data = {"username": username, "password": password}
-        response = self._post("/login", json_data=data)
+        response = self._post("/login", json_data=data, raw=True)
         
         if "token" in response:
             self.set_token(response["token"])
@@ -93,318 +518,274 @@ class CentralStorageClient:
     def get_profile(self) -> User:
         """Get current user profile"""
         response = self._get("/profile")
-        return User(**response.get("user", {}))
+        return self._decode(User, response.get("user"))
     
     def update_profile(self, user_data: Dict[str, Any]) -> User:
         """Update user profile"""
         response = self._put("/profile", json_data=user_data)
-        return User(**response.get("user", {}))
+        return self._decode(User, response.get("user"))
     
     # Laboratory methods
     def get_laboratories(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get laboratories with optional filtering and pagination"""
-        query_params = {}
-        
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        # Add additional filters
-        query_params.update(filters)
-        
-        # Remove empty parameters
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/laboratories", params=query_params)
         
         # Parse response data into Laboratory objects
-        labs = [Laboratory(**lab) for lab in response.get("data", [])]
-        
-        return PaginationResponse(
-            data=labs,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        labs = self._decode_list(Laboratory, response.get("data", []))
+        
+        return _pagination_response(response, labs)
+    
+    def iter_laboratories(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                          **filters) -> Iterator[Laboratory]:
+        """Iterate over all laboratories, fetching pages lazily"""
+        return self._iter_models(self.get_laboratories, params, prefetch, filters)
     
     def get_laboratory(self, lab_id: int) -> Laboratory:
         """Get laboratory by ID"""
-        response = self._get(f"/laboratories/{lab_id}")
-        return Laboratory(**response.get("laboratory", {}))
+        response = self._cached_get(("laboratory", lab_id), f"/laboratories/{lab_id}")
+        return self._decode(Laboratory, response.get("laboratory"))
     
     def create_laboratory(self, lab_data: Union[Laboratory, Dict[str, Any]]) -> Laboratory:
         """Create new laboratory"""
         if isinstance(lab_data, Laboratory):
-            # Convert dataclass to dict, excluding None values
-            data = {k: v for k, v in lab_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'storages']}
+            data = _model_payload(lab_data, ['id', 'created_at', 'updated_at', 'storages'])
         else:
             data = lab_data
         
         response = self._post("/admin/laboratories", json_data=data)
-        return Laboratory(**response.get("laboratory", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Laboratory, response.get("laboratory"))
     
     def update_laboratory(self, lab_id: int, lab_data: Union[Laboratory, Dict[str, Any]]) -> Laboratory:
         """Update laboratory"""
         if isinstance(lab_data, Laboratory):
-            data = {k: v for k, v in lab_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'storages']}
+            data = _model_payload(lab_data, ['id', 'created_at', 'updated_at', 'storages'])
         else:
             data = lab_data
         
         response = self._put(f"/admin/laboratories/{lab_id}", json_data=data)
-        return Laboratory(**response.get("laboratory", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Laboratory, response.get("laboratory"))
     
     def delete_laboratory(self, lab_id: int) -> bool:
         """Delete laboratory"""
         self._delete(f"/admin/laboratories/{lab_id}")
+        self._invalidate_hierarchy()
         return True
     
     # Storage methods
     def get_storages(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get storage devices with optional filtering and pagination"""
-        query_params = {}
-        
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params.update(filters)
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/storages", params=query_params)
         
-        storages = [Storage(**storage) for storage in response.get("data", [])]
+        storages = self._decode_list(Storage, response.get("data", []))
         
-        return PaginationResponse(
-            data=storages,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, storages)
+    
+    def iter_storages(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                      **filters) -> Iterator[Storage]:
+        """Iterate over all storage devices, fetching pages lazily"""
+        return self._iter_models(self.get_storages, params, prefetch, filters)
     
     def get_storage(self, storage_id: int) -> Storage:
         """Get storage device by ID"""
-        response = self._get(f"/storages/{storage_id}")
-        return Storage(**response.get("storage", {}))
+        response = self._cached_get(("storage", storage_id), f"/storages/{storage_id}")
+        return self._decode(Storage, response.get("storage"))
     
     def create_storage(self, storage_data: Union[Storage, Dict[str, Any]]) -> Storage:
         """Create new storage device"""
         if isinstance(storage_data, Storage):
-            data = {k: v for k, v in storage_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'laboratory', 'sections']}
+            data = _model_payload(storage_data, ['id', 'created_at', 'updated_at', 'laboratory', 'sections'])
         else:
             data = storage_data
         
         response = self._post("/admin/storages", json_data=data)
-        return Storage(**response.get("storage", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Storage, response.get("storage"))
     
     def update_storage(self, storage_id: int, storage_data: Union[Storage, Dict[str, Any]]) -> Storage:
         """Update storage device"""
         if isinstance(storage_data, Storage):
-            data = {k: v for k, v in storage_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'laboratory', 'sections']}
+            data = _model_payload(storage_data, ['id', 'created_at', 'updated_at', 'laboratory', 'sections'])
         else:
             data = storage_data
         
         response = self._put(f"/admin/storages/{storage_id}", json_data=data)
-        return Storage(**response.get("storage", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Storage, response.get("storage"))
     
     def delete_storage(self, storage_id: int) -> bool:
         """Delete storage device"""
         self._delete(f"/admin/storages/{storage_id}")
+        self._invalidate_hierarchy()
         return True
     
     def get_storages_by_lab(self, lab_id: int, params: Optional[PaginationParams] = None) -> PaginationResponse:
         """Get storage devices by laboratory ID"""
-        query_params = {}
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params)
         
         response = self._get(f"/labs/{lab_id}/storages", params=query_params)
         
-        storages = [Storage(**storage) for storage in response.get("data", [])]
+        storages = self._decode_list(Storage, response.get("data", []))
         
-        return PaginationResponse(
-            data=storages,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, storages)
+    
+    def iter_storages_by_lab(self, lab_id: int, params: Optional[PaginationParams] = None,
+                             prefetch: bool = True) -> Iterator[Storage]:
+        """Iterate over all storage devices of a laboratory, fetching pages lazily"""
+        return self._iter_models(lambda page_params: self.get_storages_by_lab(lab_id, page_params),
+                                 params, prefetch, {})
     
     # Section methods
     def get_sections(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get sections with optional filtering and pagination"""
-        query_params = {}
-        
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params.update(filters)
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/sections", params=query_params)
         
-        sections = [Section(**section) for section in response.get("data", [])]
+        sections = self._decode_list(Section, response.get("data", []))
         
-        return PaginationResponse(
-            data=sections,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, sections)
+    
+    def iter_sections(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                      **filters) -> Iterator[Section]:
+        """Iterate over all sections, fetching pages lazily"""
+        return self._iter_models(self.get_sections, params, prefetch, filters)
     
     def get_section(self, section_id: int) -> Section:
         """Get section by ID"""
-        response = self._get(f"/sections/{section_id}")
-        return Section(**response.get("section", {}))
+        response = self._cached_get(("section", section_id), f"/sections/{section_id}")
+        return self._decode(Section, response.get("section"))
     
     def create_section(self, section_data: Union[Section, Dict[str, Any]]) -> Section:
         """Create new section"""
         if isinstance(section_data, Section):
-            data = {k: v for k, v in section_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'storage', 'items']}
+            data = _model_payload(section_data, ['id', 'created_at', 'updated_at', 'storage', 'items'])
         else:
             data = section_data
         
         response = self._post("/admin/sections", json_data=data)
-        return Section(**response.get("section", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Section, response.get("section"))
+    
+    def create_sections_bulk(self, sections: List[Union[Section, Dict[str, Any]]]) -> BulkResult:
+        """Create many sections in one request (admin only, at most 5000 rows)
+        
+        Rows are committed in chunked transactions on the server; rows that fail
+        are None in the result and listed in result.errors by request index.
+        """
+        data = [_model_payload(section, ['id', 'created_at', 'updated_at', 'storage', 'items'])
+                if isinstance(section, Section) else section for section in sections]
+        
+        response = self._post("/admin/sections/bulk", json_data={"sections": data})
+        self._invalidate_hierarchy()
+        return _bulk_result(response, "sections", data, lambda rows: self._decode_list(Section, rows))
     
     def update_section(self, section_id: int, section_data: Union[Section, Dict[str, Any]]) -> Section:
         """Update section"""
         if isinstance(section_data, Section):
-            data = {k: v for k, v in section_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'storage', 'items']}
+            data = _model_payload(section_data, ['id', 'created_at', 'updated_at', 'storage', 'items'])
         else:
             data = section_data
         
         response = self._put(f"/admin/sections/{section_id}", json_data=data)
-        return Section(**response.get("section", {}))
+        self._invalidate_hierarchy()
+        return self._decode(Section, response.get("section"))
     
     def delete_section(self, section_id: int) -> bool:
         """Delete section"""
         self._delete(f"/admin/sections/{section_id}")
+        self._invalidate_hierarchy()
         return True
     
     def get_sections_by_storage(self, storage_id: int, params: Optional[PaginationParams] = None) -> PaginationResponse:
         """Get sections by storage ID"""
-        query_params = {}
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params)
         
         response = self._get(f"/stores/{storage_id}/sections", params=query_params)
         
-        sections = [Section(**section) for section in response.get("sections", [])]
+        sections = self._decode_list(Section, response.get("sections", []))
         
-        return PaginationResponse(
-            data=sections,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, sections)
     
     # Item methods
     def get_items(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get items with optional filtering and pagination"""
-        query_params = {}
+        query_params = _build_query_params(params, filters)
         
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
+        response = self._get("/items", params=query_params)
+        items = self._decode_list(Item, [row["item"] for row in response.get("data", [])])
         
-        query_params.update(filters)
-        query_params = {k: v for k, v in query_params.items() if v}
+        return _pagination_response(response, items)
+    
+    def iter_items(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                   **filters) -> Iterator[Item]:
+        """Iterate over all items, fetching pages lazily"""
+        return self._iter_models(self.get_items, params, prefetch, filters)
+    
+    def get_items_with_location(self, params: Optional[PaginationParams] = None,
+                                **filters) -> PaginationResponse:
+        """Get items together with the section and location path the server preloads
+        
+        Same query as get_items, but each entry is an ItemWithLocation, so
+        listings can show where items live without get_section/get_storage calls.
+        """
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/items", params=query_params)
-        items = [Item(**item["item"]) for item in response["data"]]
-        
-        return PaginationResponse(
-            data=items,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        rows = self._decoded(decode_items_with_location(response.get("data", []), self.parse_dates))
+        
+        return _pagination_response(response, rows)
+    
+    def iter_items_with_location(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                                 **filters) -> Iterator[ItemWithLocation]:
+        """Iterate over all items with their location, fetching pages lazily"""
+        return self._iter_models(self.get_items_with_location, params, prefetch, filters)
+    
+    def get_items_columns(self, params: Optional[PaginationParams] = None, **filters) -> ItemColumns:
+        """Fetch all matching items into NumPy columns (requires numpy)"""
+        return ItemColumns.from_items(self.iter_items(params, **filters))
     
     def get_item(self, item_id: int) -> Item:
         """Get item by ID"""
         response = self._get(f"/items/{item_id}")
-        return Item(**response.get("item", {}))
+        return self._decode(Item, response.get("item"))
     
     def create_item(self, item_data: Union[Item, Dict[str, Any]]) -> Item:
         """Create new item"""
         if isinstance(item_data, Item):
-            data = {k: v for k, v in item_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'section']}
+            data = _model_payload(item_data, ['id', 'created_at', 'updated_at', 'section'])
         else:
             data = item_data
         
         response = self._post("/items", json_data=data)
-        return Item(**response.get("item", {}))
+        return self._decode(Item, response.get("item"))
+    
+    def create_items_bulk(self, items: List[Union[Item, Dict[str, Any]]]) -> BulkResult:
+        """Create many items in one request (at most 5000 rows)
+        
+        Rows are committed in chunked transactions on the server; rows that fail
+        are None in the result and listed in result.errors by request index.
+        """
+        data = [_model_payload(item, ['id', 'created_at', 'updated_at', 'section'])
+                if isinstance(item, Item) else item for item in items]
+        
+        response = self._post("/items/bulk", json_data={"items": data})
+        return _bulk_result(response, "items", data, lambda rows: self._decode_list(Item, rows))
     
     def update_item(self, item_id: int, item_data: Union[Item, Dict[str, Any]]) -> Item:
         """Update item"""
         if isinstance(item_data, Item):
-            data = {k: v for k, v in item_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'section']}
+            data = _model_payload(item_data, ['id', 'created_at', 'updated_at', 'section'])
         else:
             data = item_data
         
         response = self._put(f"/items/{item_id}", json_data=data)
-        return Item(**response.get("item", {}))
+        return self._decode(Item, response.get("item"))
     
     def delete_item(self, item_id: int) -> bool:
         """Delete item"""
@@ -415,68 +796,51 @@ class CentralStorageClient:
         """Update item quantity"""
         data = {"quantity": quantity}
         response = self._put(f"/items/{item_id}/quantity", json_data=data)
-        return Item(**response.get("item", {}))
+        return self._decode(Item, response.get("item"))
+    
+    def update_item_quantities(self, updates: List[Dict[str, int]]) -> BulkResult:
+        """Set the quantity of many items in one request (at most 5000 rows)
+        
+        Args:
+            updates: List of {"item_id": int, "quantity": int}
+        """
+        response = self._put("/items/quantities", json_data={"updates": updates})
+        return _bulk_result(response, "items", updates, lambda rows: self._decode_list(Item, rows))
     
     def get_categories(self) -> List[str]:
         """Get all item categories"""
-        response = self._get("/items/categories")
+        response = self._get("/items/categories", raw=True)
         return response.get("categories", [])
     
     def get_low_stock_items(self, params: Optional[PaginationParams] = None) -> PaginationResponse:
         """Get low stock items"""
-        query_params = {}
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params)
         
         response = self._get("/items/low-stock", params=query_params)
         
-        items = [Item(**item) for item in response.get("data", [])]
+        items = self._decode_list(Item, response.get("data", []))
         
-        return PaginationResponse(
-            data=items,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, items)
     
     def get_expiring_items(self, params: Optional[PaginationParams] = None) -> PaginationResponse:
         """Get expiring items"""
-        query_params = {}
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params)
         
         response = self._get("/items/expiring", params=query_params)
         
-        items = [Item(**item) for item in response.get("data", [])]
+        items = self._decode_list(Item, response.get("data", []))
         
-        return PaginationResponse(
-            data=items,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, items)
+    
+    def iter_low_stock_items(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                             **filters) -> Iterator[Item]:
+        """Iterate over all items with quantity <= min_quantity (paginated /items?low_stock=true)"""
+        return self.iter_items(params, prefetch, low_stock="true", **filters)
+    
+    def iter_expiring_items(self, days: int = 30, params: Optional[PaginationParams] = None,
+                            prefetch: bool = True, **filters) -> Iterator[Item]:
+        """Iterate over all items expiring within the given number of days (paginated /items?expiring=true)"""
+        return self.iter_items(params, prefetch, expiring="true", expiring_days=days, **filters)
     
     def check_item_code_exists(self, code: str, exclude_id: int = None) -> bool:
         """Check if item code already exists"""
@@ -484,50 +848,38 @@ class CentralStorageClient:
         if exclude_id:
             params["exclude_id"] = exclude_id
         
-        response = self._get("/items/check-code", params=params)
+        response = self._get("/items/check-code", params=params, raw=True)
         return response.get("exists", False)
     
     # Movement methods
     def get_movements(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get movement records with optional filtering and pagination"""
-        query_params = {}
-        
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params.update(filters)
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/movements", params=query_params)
         
-        movements = [Movement(**movement) for movement in response.get("data", [])]
+        movements = self._decode_list(Movement, response.get("data", []))
         
-        return PaginationResponse(
-            data=movements,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, movements)
+    
+    def iter_movements(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                       **filters) -> Iterator[Movement]:
+        """Iterate over all movement records, fetching pages lazily"""
+        return self._iter_models(self.get_movements, params, prefetch, filters)
+    
+    def get_movements_columns(self, params: Optional[PaginationParams] = None, **filters) -> MovementColumns:
+        """Fetch all matching movement records into NumPy columns (requires numpy)"""
+        return MovementColumns.from_movements(self.iter_movements(params, **filters))
     
     def create_movement(self, movement_data: Union[Movement, Dict[str, Any]]) -> Movement:
         """Create new movement record (admin only)"""
         if isinstance(movement_data, Movement):
-            data = {k: v for k, v in movement_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'item', 'user']}
+            data = _model_payload(movement_data, ['id', 'created_at', 'updated_at', 'item', 'user'])
         else:
             data = movement_data
         
         response = self._post("/admin/movements", json_data=data)
-        return Movement(**response.get("movement", {}))
+        return self._decode(Movement, response.get("movement"))
     
     def delete_movement(self, movement_id: int) -> bool:
         """Delete movement record (admin only)"""
@@ -538,70 +890,126 @@ class CentralStorageClient:
         """Export movements to CSV"""
         query_params = {k: v for k, v in filters.items() if v}
         
-        response = self.session.get(
+        response = self._send_tracked(
+            'GET',
             f"{self.api_base}/movements/export",
             params=query_params
         )
         response.raise_for_status()
         return response.content
     
+    def _open_movements_export(self, filters: Dict[str, Any]) -> requests.Response:
+        """Start a streamed /movements/export download"""
+        query_params = {k: v for k, v in filters.items() if v}
+        
+        try:
+            response = self._send_tracked(
+                'GET',
+                f"{self.api_base}/movements/export",
+                params=query_params,
+                stream=True
+            )
+        except requests.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+        
+        try:
+            _raise_for_status(response.status_code, response)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            response.close()
+            raise APIError(f"Request failed: {str(e)}", response.status_code, response)
+        except APIError:
+            response.close()
+            raise
+        return response
+    
+    def export_movements_csv_to(self, file_obj: BinaryIO, chunk_size: int = 64 * 1024, **filters) -> int:
+        """Stream the movements CSV export into a binary file object in constant memory
+        
+        Args:
+            file_obj: Writable binary file object (e.g. open(path, "wb"))
+            chunk_size: Size of the chunks read from the socket
+            **filters: Same filters as export_movements_csv
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with self._open_movements_export(filters) as response:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    file_obj.write(chunk)
+                    written += len(chunk)
+        return written
+    
+    def iter_movement_rows(self, **filters) -> Iterator[MovementExportRow]:
+        """Parse the movements CSV export incrementally while it downloads
+        
+        Rows are yielded as soon as they arrive, so processing can start before
+        the export finishes and memory use does not grow with the export size.
+        """
+        with self._open_movements_export(filters) as response:
+            # utf-8-sig strips the BOM the server writes for Excel
+            chunks = codecs.iterdecode(response.iter_content(chunk_size=64 * 1024), 'utf-8-sig')
+            reader = csv.reader(_iter_lines(chunks))
+            next(reader, None)  # header row
+            
+            for record in reader:
+                if len(record) < 10:
+                    continue
+                yield MovementExportRow(
+                    id=int(record[0]) if record[0] else 0,
+                    item_name=record[1],
+                    movement_type=record[2],
+                    from_location=record[3],
+                    to_location=record[4],
+                    quantity=int(record[5]) if record[5] else 0,
+                    reason=record[6],
+                    notes=record[7],
+                    operator=record[8],
+                    created_at=datetime.strptime(record[9], "%Y-%m-%d %H:%M:%S") if record[9] else None
+                )
+    
     # User management methods (admin only)
     def register_user(self, user_data: Union[User, Dict[str, Any]]) -> User:
         """Register new user (admin only)"""
         if isinstance(user_data, User):
-            data = {k: v for k, v in user_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'last_login']}
+            data = _model_payload(user_data, ['id', 'created_at', 'updated_at', 'last_login'])
         else:
             data = user_data
         
         response = self._post("/admin/register", json_data=data)
-        return User(**response.get("user", {}))
+        return self._decode(User, response.get("user"))
     
     def get_users(self, params: Optional[PaginationParams] = None, **filters) -> PaginationResponse:
         """Get users (admin only)"""
-        query_params = {}
-        
-        if params:
-            query_params.update({
-                'page': params.page,
-                'page_size': params.page_size,
-                'search': params.search,
-                'sort_by': params.sort_by,
-                'sort_desc': params.sort_desc
-            })
-        
-        query_params.update(filters)
-        query_params = {k: v for k, v in query_params.items() if v}
+        query_params = _build_query_params(params, filters)
         
         response = self._get("/admin/users", params=query_params)
         
-        users = [User(**user) for user in response.get("data", [])]
+        users = self._decode_list(User, response.get("data", []))
         
-        return PaginationResponse(
-            data=users,
-            total=response.get("total", 0),
-            page=response.get("page", 1),
-            page_size=response.get("page_size", 20),
-            total_pages=response.get("total_pages", 0),
-            has_next=response.get("has_next", False),
-            has_prev=response.get("has_prev", False)
-        )
+        return _pagination_response(response, users)
+    
+    def iter_users(self, params: Optional[PaginationParams] = None, prefetch: bool = True,
+                   **filters) -> Iterator[User]:
+        """Iterate over all users (admin only), fetching pages lazily"""
+        return self._iter_models(self.get_users, params, prefetch, filters)
     
     def get_user(self, user_id: int) -> User:
         """Get user by ID (admin only)"""
         response = self._get(f"/admin/users/{user_id}")
-        return User(**response.get("user", {}))
+        return self._decode(User, response.get("user"))
     
     def update_user(self, user_id: int, user_data: Union[User, Dict[str, Any]]) -> User:
         """Update user (admin only)"""
         if isinstance(user_data, User):
-            data = {k: v for k, v in user_data.__dict__.items() 
-                   if v is not None and k not in ['id', 'created_at', 'updated_at', 'last_login']}
+            data = _model_payload(user_data, ['id', 'created_at', 'updated_at', 'last_login'])
         else:
             data = user_data
         
         response = self._put(f"/admin/users/{user_id}", json_data=data)
-        return User(**response.get("user", {}))
+        return self._decode(User, response.get("user"))
     
     def delete_user(self, user_id: int) -> bool:
         """Delete user (admin only)"""
@@ -611,13 +1019,13 @@ class CentralStorageClient:
     # Statistics methods
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get dashboard statistics"""
-        return self._get("/stats/dashboard")
+        return self._get("/stats/dashboard", raw=True)
     
     def get_user_stats(self) -> Dict[str, Any]:
         """Get user statistics"""
-        return self._get("/stats/user")
+        return self._get("/stats/user", raw=True)
     
     # Health check
     def health_check(self) -> Dict[str, str]:
         """Check API health"""
-        return self._get("/health")
+        return self._get("/health", raw=True)
@@ -0,0 +1,218 @@
+"""
+Columnar (NumPy) result sets for analytics over items and movements
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .models import Item, Movement, parse_datetime
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Columnar result sets require numpy. "
+            "Install it with: pip install central-storage-sdk[numpy]"
+        )
+
+
+class CategoricalColumn:
+    """A string column stored as integer codes into a list of distinct values"""
+
+    def __init__(self, codes, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[str]]) -> "CategoricalColumn":
+        """Encode values in order of first appearance (None and "" become code -1)"""
+        _require_numpy()
+        lookup: Dict[str, int] = {}
+        codes = np.fromiter(
+            (-1 if not value else lookup.setdefault(value, len(lookup)) for value in values),
+            dtype=np.int32
+        )
+        return cls(codes, list(lookup))
+
+    def code_of(self, value: str) -> int:
+        """Code of a category, or -1 when it does not occur"""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+    def mask(self, value: str):
+        """Boolean mask of rows equal to value"""
+        return self.codes == self.code_of(value)
+
+    def to_list(self) -> List[Optional[str]]:
+        """Decode back into a list of strings"""
+        return [self.categories[code] if code >= 0 else None for code in self.codes.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def _date_column(values: Iterable[Optional[str]]):
+    """YYYY-MM-DD strings to datetime64[D] (missing values become NaT)"""
+    return np.array([value or "NaT" for value in values], dtype="datetime64[D]")
+
+
+def _timestamp_column(values: Iterable[Any]):
+    """RFC 3339 strings or datetimes to UTC datetime64[us] (missing values become NaT)"""
+    converted = []
+    for value in values:
+        value = parse_datetime(value)
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            converted.append(value)
+        else:
+            converted.append("NaT")
+    return np.array(converted, dtype="datetime64[us]")
+
+
+def _sum_by_code(column: CategoricalColumn, weights) -> Dict[str, float]:
+    valid = column.codes >= 0
+    sums = np.bincount(column.codes[valid], weights=weights[valid], minlength=len(column.categories))
+    return dict(zip(column.categories, sums.tolist()))
+
+
+class ItemColumns:
+    """Items stored column-wise as NumPy arrays
+
+    Numeric fields are int64/float64 arrays, dates are datetime64, and
+    low-cardinality strings (category, unit, supplier) are CategoricalColumns.
+    Missing ids (section_id) are stored as -1.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.id = columns["id"]
+        self.code = columns["code"]
+        self.name = columns["name"]
+        self.section_id = columns["section_id"]
+        self.quantity = columns["quantity"]
+        self.min_quantity = columns["min_quantity"]
+        self.price = columns["price"]
+        self.category = columns["category"]
+        self.unit = columns["unit"]
+        self.supplier = columns["supplier"]
+        self.purchase_date = columns["purchase_date"]
+        self.expiry_date = columns["expiry_date"]
+        self.created_at = columns["created_at"]
+        self.updated_at = columns["updated_at"]
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "ItemColumns":
+        """Build columns from Item models (e.g. client.iter_items())"""
+        _require_numpy()
+        rows: Tuple[list, ...] = tuple([] for _ in range(14))
+        (ids, codes, names, section_ids, quantities, min_quantities, prices, categories,
+         units, suppliers, purchase_dates, expiry_dates, created, updated) = rows
+
+        for item in items:
+            ids.append(item.id or 0)
+            codes.append(item.code)
+            names.append(item.name)
+            section_ids.append(item.section_id if item.section_id is not None else -1)
+            quantities.append(item.quantity or 0)
+            min_quantities.append(item.min_quantity or 0)
+            prices.append(item.price or 0.0)
+            categories.append(item.category)
+            units.append(item.unit)
+            suppliers.append(item.supplier)
+            purchase_dates.append(item.purchase_date)
+            expiry_dates.append(item.expiry_date)
+            created.append(item.created_at)
+            updated.append(item.updated_at)
+
+        return cls({
+            "id": np.array(ids, dtype=np.int64),
+            "code": np.array(codes, dtype=object),
+            "name": np.array(names, dtype=object),
+            "section_id": np.array(section_ids, dtype=np.int64),
+            "quantity": np.array(quantities, dtype=np.int64),
+            "min_quantity": np.array(min_quantities, dtype=np.int64),
+            "price": np.array(prices, dtype=np.float64),
+            "category": CategoricalColumn.from_values(categories),
+            "unit": CategoricalColumn.from_values(units),
+            "supplier": CategoricalColumn.from_values(suppliers),
+            "purchase_date": _date_column(purchase_dates),
+            "expiry_date": _date_column(expiry_dates),
+            "created_at": _timestamp_column(created),
+            "updated_at": _timestamp_column(updated),
+        })
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def value(self):
+        """Stock value per item (price * quantity)"""
+        return self.price * self.quantity
+
+    def total_value(self) -> float:
+        """Total stock value"""
+        return float(self.value().sum())
+
+    def low_stock_mask(self):
+        """Rows with quantity <= min_quantity (same rule as the server's low_stock filter)"""
+        return self.quantity <= self.min_quantity
+
+    def expiring_mask(self, days: int = 30, today: Optional[Any] = None):
+        """Rows with an expiry date within the given number of days"""
+        today = np.datetime64(today or datetime.now().date(), "D")
+        return ~np.isnat(self.expiry_date) & (self.expiry_date <= today + np.timedelta64(days, "D"))
+
+    def value_by_category(self) -> Dict[str, float]:
+        """Total stock value per category"""
+        return _sum_by_code(self.category, self.value())
+
+    def quantity_by_category(self) -> Dict[str, float]:
+        """Total quantity per category"""
+        return _sum_by_code(self.category, self.quantity.astype(np.float64))
+
+
+class MovementColumns:
+    """Movement records stored column-wise as NumPy arrays"""
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.id = columns["id"]
+        self.item_id = columns["item_id"]
+        self.user_id = columns["user_id"]
+        self.quantity = columns["quantity"]
+        self.movement_type = columns["movement_type"]
+        self.created_at = columns["created_at"]
+
+    @classmethod
+    def from_movements(cls, movements: Iterable[Movement]) -> "MovementColumns":
+        """Build columns from Movement models (e.g. client.iter_movements())"""
+        _require_numpy()
+        ids, item_ids, user_ids, quantities, movement_types, created = [], [], [], [], [], []
+        for movement in movements:
+            ids.append(movement.id or 0)
+            item_ids.append(movement.item_id or 0)
+            user_ids.append(movement.user_id or 0)
+            quantities.append(movement.quantity or 0)
+            movement_types.append(movement.movement_type)
+            created.append(movement.created_at)
+
+        return cls({
+            "id": np.array(ids, dtype=np.int64),
+            "item_id": np.array(item_ids, dtype=np.int64),
+            "user_id": np.array(user_ids, dtype=np.int64),
+            "quantity": np.array(quantities, dtype=np.int64),
+            "movement_type": CategoricalColumn.from_values(movement_types),
+            "created_at": _timestamp_column(created),
+        })
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def quantity_by_type(self) -> Dict[str, float]:
+        """Total moved quantity per movement type"""
+        return _sum_by_code(self.movement_type, self.quantity.astype(np.float64))
@@ -0,0 +1,171 @@
+"""
+Adaptive concurrency limiting for batch workloads
+"""
+
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from .exceptions import APIError
+
+
+def is_overload(error: Exception) -> bool:
+    """Whether a failed request points at an overloaded server
+
+    5xx responses, 429s, timeouts and connection errors do; client errors
+    such as validation failures or 404s do not.
+    """
+    if isinstance(error, APIError):
+        # Transport failures and unmapped statuses (429) arrive without a status code
+        return error.status_code is None or error.status_code >= 500 or error.status_code == 429
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class AdaptiveLimiter:
+    """AIMD limit on the number of requests in flight
+
+    Every healthy completion raises the limit by 1/limit, i.e. by about one
+    per round of requests. An overloaded completion (see is_overload) or a
+    latency spike multiplies it by `backoff`, at most once per round: only
+    requests started after the previous decrease can trigger another one.
+    Latency is compared per unit (a bulk request of n rows counts as n units)
+    as a short-term average against a slowly moving long-term average.
+
+    Callers block in acquire() while the limit is reached. Thread safe.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 64, backoff: float = 0.5,
+                 latency_tolerance: float = 2.0, throughput_window: float = 10.0):
+        """
+        Initialize the limiter
+
+        Args:
+            initial: Starting limit
+            minimum: Lowest limit backoff can reach
+            maximum: Highest limit; size worker pools to this
+            backoff: Factor applied to the limit on overload
+            latency_tolerance: Back off when recent latency per unit exceeds the
+                long-term average by this factor
+            throughput_window: Seconds of completions the throughput is computed over
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.throughput_window = throughput_window
+        self._limit = float(max(minimum, min(maximum, initial)))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._last_decrease = 0.0
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
+        self._completions = deque()  # (finished_at, units)
+        self.completed = 0
+        self.overloads = 0
+        self.decreases = 0
+        self.peak_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Wait for a free slot; returns the start time to pass to release()"""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            if self._in_flight > self.peak_in_flight:
+                self.peak_in_flight = self._in_flight
+        return time.perf_counter()
+
+    def release(self, started: float, units: int = 1, error: Optional[Exception] = None):
+        """Free a slot and adapt the limit to the request's outcome
+
+        Args:
+            started: Value returned by acquire()
+            units: Rows the request carried
+            error: Exception the request failed with, if any
+        """
+        now = time.perf_counter()
+        overloaded = error is not None and is_overload(error)
+        with self._condition:
+            self._in_flight -= 1
+            if error is None:
+                self.completed += 1
+                self._completions.append((now, units))
+                slow = self._observe((now - started) / max(1, units))
+            else:
+                slow = False
+            if overloaded:
+                self.overloads += 1
+            if (overloaded or slow) and started > self._last_decrease:
+                self._limit = max(self.minimum, self._limit * self.backoff)
+                self._last_decrease = now
+                self.decreases += 1
+            elif error is None and not slow:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _observe(self, seconds: float) -> bool:
+        """Update the latency averages; True when the short-term one spiked"""
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = seconds
+            return False
+        self._short_latency += 0.2 * (seconds - self._short_latency)
+        self._long_latency += 0.02 * (seconds - self._long_latency)
+        return self._short_latency > self.latency_tolerance * self._long_latency
+
+    def throughput(self) -> float:
+        """Units completed per second over the last throughput_window seconds"""
+        with self._condition:
+            now = time.perf_counter()
+            while self._completions and self._completions[0][0] < now - self.throughput_window:
+                self._completions.popleft()
+            if not self._completions:
+                return 0.0
+            span = max(now - self._completions[0][0], 1e-3)
+            return sum(units for _, units in self._completions) / span
+
+    def wrap(self, func: Callable, units: Optional[Callable[[Any], int]] = None) -> Callable:
+        """func(arg) run under the limiter; units(arg) gives the rows it carries"""
+        @wraps(func)
+        def limited(arg, *args, **kwargs):
+            started = self.acquire()
+            try:
+                result = func(arg, *args, **kwargs)
+            except Exception as e:
+                self.release(started, units(arg) if units else 1, e)
+                raise
+            self.release(started, units(arg) if units else 1)
+            return result
+        return limited
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit, in-flight requests, throughput and counters"""
+        throughput = self.throughput()
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "throughput": round(throughput, 1),
+                "completed": self.completed,
+                "overloads": self.overloads,
+                "decreases": self.decreases,
+                "latency_ms": round((self._short_latency or 0.0) * 1000, 3),
+            }
+
+    def summary(self) -> str:
+        stats = self.snapshot()
+        return (f"Concurrency limit {stats['limit']} (peak {stats['peak_in_flight']} in flight, "
+                f"{stats['decreases']} backoffs after {stats['overloads']} overload errors), "
+                f"{stats['throughput']:.1f} rows/s")
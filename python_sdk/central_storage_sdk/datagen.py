@@ -0,0 +1,254 @@
+"""
+Streaming, seeded test data generation
+
+TestDataGenerator produces the same rows as the generate_test_* helpers in
+utils, but lazily and reproducibly: every row comes from one seeded RNG, dates
+are relative to a fixed day and codes are sequential per prefix, so a seed
+fully determines a data set and millions of rows never sit in memory at once.
+"""
+
+import random
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .codes import CodeAllocator, base36
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+LAB_TYPES = ["化学", "生物", "物理", "材料", "电子"]
+BUILDINGS = ["A楼", "B楼", "C楼", "D楼", "实验楼"]
+STORAGE_TYPES = ["试剂柜", "器材柜", "样品柜", "工具柜", "文件柜"]
+STORAGE_STATUSES = ["运行中", "维护中", "停用"]
+SECTION_STATUSES = ["可用", "已满", "维护中", "停用"]
+CATEGORIES = ["化学试剂", "电子元件", "实验器材", "耗材", "标准样品"]
+UNITS = ["个", "瓶", "包", "盒", "套", "ml", "g", "kg"]
+SUPPLIERS = ["科学仪器公司", "化学试剂供应商", "实验设备厂", "标准物质中心"]
+STORAGE_CONDITIONS = ["常温", "冷藏", "冷冻", "避光"]
+HAZARD_LEVELS = ["无害", "低毒", "中毒", "高毒"]
+
+
+class TestDataGenerator:
+    """Seeded, lazy generator of laboratories, storages, sections and items
+
+    Codes look like ``ITM`` + a 7-character base36 run tag holding the seed +
+    a base36 sequence number, so they are unique within a generator and two
+    runs only share codes when they share a seed (the tag covers seeds below
+    36**7, which includes every default 32-bit seed). With a CodeAllocator,
+    sequence numbers already in use on the server are skipped.
+    """
+
+    def __init__(self, seed: Optional[int] = None, today: Optional[date] = None,
+                 allocator: Optional[CodeAllocator] = None):
+        """
+        Initialize the generator
+
+        Args:
+            seed: RNG seed (default: random; the chosen seed is kept in self.seed)
+            today: Day purchase and expiry dates are relative to (default: date.today())
+            allocator: Allocator that codes are drawn from
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.today = today or date.today()
+        self.rng = random.Random(self.seed)
+        self.run_tag = base36(self.seed, 7)
+        self.allocator = allocator
+        self._sequences: Dict[str, int] = {}
+        self._dates: Dict[int, str] = {}
+
+    def fork(self, key: str, first_codes: Optional[Dict[str, int]] = None) -> "TestDataGenerator":
+        """Generator for one part of the data set, e.g. one parent's children
+
+        Its RNG is seeded from (seed, key), so its rows do not depend on the
+        order in which parts are generated. Codes keep the run tag; give each
+        fork a disjoint range through first_codes (prefix -> first sequence
+        number). With an allocator, codes are still drawn from it in call order.
+
+        Args:
+            key: Name of the part, unique within the data set
+            first_codes: First sequence number per code prefix (default: 0)
+        """
+        child = TestDataGenerator(self.seed, self.today, self.allocator)
+        child.rng = random.Random(f"{self.seed}/{key}")
+        child._sequences = dict(first_codes or {})
+        child._dates = self._dates
+        return child
+
+    def code(self, prefix: str) -> str:
+        """Next code for a prefix"""
+        return self.codes(prefix, 1)[0]
+
+    def codes(self, prefix: str, count: int) -> List[str]:
+        """Next count codes for a prefix"""
+        if self.allocator is not None:
+            return [self.allocator.sequential(prefix + self.run_tag) for _ in range(count)]
+        start = self._sequences.get(prefix, 0)
+        self._sequences[prefix] = start + count
+        head = prefix + self.run_tag
+        return [head + base36(n, 6) for n in range(start, start + count)]
+
+    def _date(self, days_from_today: int) -> str:
+        # Only a few thousand distinct days occur, so format each once
+        text = self._dates.get(days_from_today)
+        if text is None:
+            text = date.fromordinal(self.today.toordinal() + days_from_today).isoformat()
+            self._dates[days_from_today] = text
+        return text
+
+    # Row streams
+    def laboratories(self, count: int) -> Iterator[Dict[str, Any]]:
+        """Laboratory rows"""
+        rng = self.rng
+        for i in range(count):
+            lab_type = rng.choice(LAB_TYPES)
+            yield {
+                "code": self.code("LAB"),
+                "name": f"{lab_type}实验室{i+1:02d}",
+                "location": f"{rng.choice(BUILDINGS)}{rng.randint(1, 5)}F-{rng.randint(101, 599)}",
+                "description": f"专业的{lab_type}实验室，配备先进的实验设备和安全防护设施",
+                "security_level": rng.randint(1, 4)
+            }
+
+    def storages(self, lab_ids: Iterable[int], count_per_lab: int = 3) -> Iterator[Dict[str, Any]]:
+        """Storage device rows, count_per_lab for every laboratory ID"""
+        rng = self.rng
+        for lab_id in lab_ids:
+            for i in range(count_per_lab):
+                storage_type = rng.choice(STORAGE_TYPES)
+                yield {
+                    "code": self.code("STG"),
+                    "name": f"{storage_type}-{i+1:03d}",
+                    "type": storage_type,
+                    "location": f"位置{chr(65 + i % 26)}{rng.randint(1, 10)}",
+                    "description": f"标准{storage_type}，用于存放实验相关物品",
+                    "status": rng.choices(STORAGE_STATUSES, weights=[80, 15, 5])[0],
+                    "capacity": rng.randint(50, 500),
+                    "security_level": rng.randint(1, 3),
+                    "lab_id": lab_id,
+                    "properties": {
+                        "material": rng.choice(["不锈钢", "塑料", "木质", "金属"]),
+                        "ventilation": rng.choice(["有", "无"]),
+                        "lock_type": rng.choice(["机械锁", "电子锁", "密码锁"])
+                    }
+                }
+
+    def sections(self, storage_ids: Iterable[int], count_per_storage: int = 5) -> Iterator[Dict[str, Any]]:
+        """Section rows, count_per_storage for every storage ID"""
+        rng = self.rng
+        for storage_id in storage_ids:
+            for i in range(count_per_storage):
+                yield {
+                    "code": self.code("SEC"),
+                    "name": f"分区{chr(65 + i % 26)}{i+1:02d}",
+                    "position": f"第{rng.randint(1, 5)}行第{rng.randint(1, 8)}列",
+                    "description": f"标准存储分区，编号{i+1:02d}",
+                    "status": rng.choices(SECTION_STATUSES, weights=[70, 15, 10, 5])[0],
+                    "security_level": rng.randint(1, 3),
+                    "capacity": rng.randint(20, 100),
+                    "used_capacity": 0,
+                    "storage_id": storage_id,
+                    "properties": {
+                        "size": rng.choice(["小", "中", "大"]),
+                        "temperature_control": rng.choice(["常温", "低温", "恒温"]),
+                        "humidity_control": rng.choice(["有", "无"])
+                    }
+                }
+
+    def items(self, section_ids: Iterable[int], count_per_section: int = 3) -> Iterator[Dict[str, Any]]:
+        """Item rows, count_per_section for every section ID"""
+        rng = self.rng
+        for section_id in section_ids:
+            for i in range(count_per_section):
+                category = rng.choice(CATEGORIES)
+                quantity = rng.randint(1, 50)
+                purchase = -rng.randint(1, 365)
+                yield {
+                    "code": self.code("ITM"),
+                    "name": f"{category}样品{i+1:03d}",
+                    "description": f"标准{category}，用于实验研究",
+                    "category": category,
+                    "price": round(rng.uniform(10, 1000), 2),
+                    "quantity": quantity,
+                    "min_quantity": max(1, quantity // 4),
+                    "unit": rng.choice(UNITS),
+                    "supplier": rng.choice(SUPPLIERS),
+                    "purchase_date": self._date(purchase),
+                    "expiry_date": self._date(purchase + rng.randint(365, 1095)),
+                    "section_id": section_id,
+                    "properties": {
+                        "batch_number": self.code("BATCH"),
+                        "purity": f"{rng.randint(95, 99)}.{rng.randint(0, 9)}%",
+                        "storage_condition": rng.choice(STORAGE_CONDITIONS),
+                        "hazard_level": rng.choice(HAZARD_LEVELS)
+                    }
+                }
+
+    def item_chunks(self, section_ids: Iterable[int], count_per_section: int = 3,
+                    chunk_size: int = 10000) -> Iterator[List[Dict[str, Any]]]:
+        """Item rows in lists of up to chunk_size, with the random fields drawn
+        as NumPy arrays per chunk (requires numpy)
+
+        Reproducible for a given seed, but a different stream than items().
+        Section IDs are consumed lazily, a chunk's worth at a time.
+        """
+        if np is None:
+            raise ImportError(
+                "Vectorized data generation requires numpy. "
+                "Install it with: pip install central-storage-sdk[numpy]"
+            )
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        sections_per_chunk = max(1, chunk_size // max(1, count_per_section))
+        section_ids = iter(section_ids)
+
+        while True:
+            chunk_sections = list(islice(section_ids, sections_per_chunk))
+            if not chunk_sections:
+                return
+            n = len(chunk_sections) * count_per_section
+            categories = rng.integers(0, len(CATEGORIES), n).tolist()
+            units = rng.integers(0, len(UNITS), n).tolist()
+            suppliers = rng.integers(0, len(SUPPLIERS), n).tolist()
+            conditions = rng.integers(0, len(STORAGE_CONDITIONS), n).tolist()
+            hazards = rng.integers(0, len(HAZARD_LEVELS), n).tolist()
+            quantities = rng.integers(1, 51, n)
+            min_quantities = np.maximum(1, quantities // 4).tolist()
+            quantities = quantities.tolist()
+            prices = np.round(rng.uniform(10, 1000, n), 2).tolist()
+            purchases = -rng.integers(1, 366, n)
+            expiries = (purchases + rng.integers(365, 1096, n)).tolist()
+            purchases = purchases.tolist()
+            purities = rng.integers(950, 1000, n).tolist()
+            codes = self.codes("ITM", n)
+            batches = self.codes("BATCH", n)
+
+            rows = []
+            row = 0
+            for section_id in chunk_sections:
+                for i in range(count_per_section):
+                    category = CATEGORIES[categories[row]]
+                    rows.append({
+                        "code": codes[row],
+                        "name": f"{category}样品{i+1:03d}",
+                        "description": f"标准{category}，用于实验研究",
+                        "category": category,
+                        "price": prices[row],
+                        "quantity": quantities[row],
+                        "min_quantity": min_quantities[row],
+                        "unit": UNITS[units[row]],
+                        "supplier": SUPPLIERS[suppliers[row]],
+                        "purchase_date": self._date(purchases[row]),
+                        "expiry_date": self._date(expiries[row]),
+                        "section_id": section_id,
+                        "properties": {
+                            "batch_number": batches[row],
+                            "purity": f"{purities[row] // 10}.{purities[row] % 10}%",
+                            "storage_condition": STORAGE_CONDITIONS[conditions[row]],
+                            "hazard_level": HAZARD_LEVELS[hazards[row]]
+                        }
+                    })
+                    row += 1
+            yield rows
@@ -0,0 +1,192 @@
+"""
+In-memory index of the laboratory > storage > section hierarchy
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+from .models import Laboratory, Storage, Section, Item, LocationPath, PaginationParams, timestamp_key
+from .utils import submit_in_context
+
+
+def _build_path(lab: Optional[Laboratory], storage: Optional[Storage], section: Section) -> Optional[LocationPath]:
+    # Same rule as GetItems: no path unless the whole chain exists
+    if lab is None or storage is None:
+        return None
+    return LocationPath(
+        lab_code=lab.code,
+        lab_name=lab.name,
+        storage_code=storage.code,
+        storage_name=storage.name,
+        section_code=section.code,
+        section_name=section.name,
+        full_path=f"{lab.name} > {storage.name} > {section.name}"
+    )
+
+
+class HierarchyIndex:
+    """Laboratories, storages and sections loaded once, with parent/child maps
+    and a precomputed LocationPath per section
+
+    Paths are resolved from memory, so showing where thousands of items live
+    costs no requests. refresh() pulls only records updated since the last
+    load (newest first by updated_at) and recomputes the affected paths;
+    deletions need load() or remove_*().
+    """
+
+    def __init__(self, client, load: bool = True):
+        """
+        Initialize the index
+
+        Args:
+            client: CentralStorageClient used for loading
+            load: Load the hierarchy immediately
+        """
+        self.client = client
+        self._lock = threading.RLock()
+        self._clear()
+        if load:
+            self.load()
+
+    def _clear(self):
+        self.laboratories: Dict[int, Laboratory] = {}
+        self.storages: Dict[int, Storage] = {}
+        self.sections: Dict[int, Section] = {}
+        self._storages_by_lab: Dict[int, Set[int]] = {}
+        self._sections_by_storage: Dict[int, Set[int]] = {}
+        self._paths: Dict[int, Optional[LocationPath]] = {}
+        self._watermarks: Dict[str, str] = {}
+
+    # Loading
+    def load(self):
+        """(Re)load the whole hierarchy, fetching the three listings in parallel"""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            labs = submit_in_context(executor, self.client.fetch_all, "laboratories")
+            storages = submit_in_context(executor, self.client.fetch_all, "storages")
+            sections = submit_in_context(executor, self.client.fetch_all, "sections")
+            labs, storages, sections = labs.result(), storages.result(), sections.result()
+
+        with self._lock:
+            self._clear()
+            self._apply(labs, storages, sections)
+            self._paths = {section_id: self._compute_path(section_id) for section_id in self.sections}
+
+    def refresh(self) -> Dict[str, int]:
+        """Apply records created or updated since the last load/refresh
+
+        Returns:
+            Number of changed records per kind
+        """
+        labs = list(self._iter_changed(self.client.iter_laboratories, "laboratories"))
+        storages = list(self._iter_changed(self.client.iter_storages, "storages"))
+        sections = list(self._iter_changed(self.client.iter_sections, "sections"))
+
+        with self._lock:
+            self._apply(labs, storages, sections)
+            affected: Set[int] = {section.id for section in sections}
+            for storage_id in {storage.id for storage in storages} | {
+                    storage_id for lab in labs for storage_id in self._storages_by_lab.get(lab.id, ())}:
+                affected.update(self._sections_by_storage.get(storage_id, ()))
+            for section_id in affected:
+                self._paths[section_id] = self._compute_path(section_id)
+        return {"laboratories": len(labs), "storages": len(storages), "sections": len(sections)}
+
+    def _iter_changed(self, iter_models, kind: str) -> Iterator[Union[Laboratory, Storage, Section]]:
+        watermark = self._watermarks.get(kind)
+        params = PaginationParams(page_size=100, sort_by="updated_at", sort_desc=True)
+        for model in iter_models(params, prefetch=False):
+            if watermark is not None and timestamp_key(model.updated_at) < watermark:
+                return
+            yield model
+
+    def _apply(self, labs: List[Laboratory], storages: List[Storage], sections: List[Section]):
+        """Insert or replace records, dropping preloaded relations to keep the index small"""
+        for lab in labs:
+            self.laboratories[lab.id] = replace(lab, storages=[])
+        for storage in storages:
+            previous = self.storages.get(storage.id)
+            if previous is not None and previous.lab_id != storage.lab_id:
+                self._storages_by_lab.get(previous.lab_id, set()).discard(storage.id)
+            self.storages[storage.id] = replace(storage, laboratory=None, sections=[])
+            self._storages_by_lab.setdefault(storage.lab_id, set()).add(storage.id)
+        for section in sections:
+            previous = self.sections.get(section.id)
+            if previous is not None and previous.storage_id != section.storage_id:
+                self._sections_by_storage.get(previous.storage_id, set()).discard(section.id)
+            self.sections[section.id] = replace(section, storage=None, items=[])
+            self._sections_by_storage.setdefault(section.storage_id, set()).add(section.id)
+
+        for kind, records in (("laboratories", labs), ("storages", storages), ("sections", sections)):
+            for record in records:
+                key = timestamp_key(record.updated_at)
+                if key > self._watermarks.get(kind, ""):
+                    self._watermarks[kind] = key
+
+    def _compute_path(self, section_id: int) -> Optional[LocationPath]:
+        section = self.sections[section_id]
+        storage = self.storages.get(section.storage_id)
+        lab = self.laboratories.get(storage.lab_id) if storage else None
+        return _build_path(lab, storage, section)
+
+    def remove_laboratory(self, lab_id: int):
+        """Forget a deleted laboratory; paths below it become None"""
+        with self._lock:
+            self.laboratories.pop(lab_id, None)
+            for storage_id in self._storages_by_lab.get(lab_id, ()):
+                for section_id in self._sections_by_storage.get(storage_id, ()):
+                    self._paths[section_id] = None
+
+    def remove_storage(self, storage_id: int):
+        """Forget a deleted storage device; paths below it become None"""
+        with self._lock:
+            storage = self.storages.pop(storage_id, None)
+            if storage is not None:
+                self._storages_by_lab.get(storage.lab_id, set()).discard(storage_id)
+            for section_id in self._sections_by_storage.get(storage_id, ()):
+                self._paths[section_id] = None
+
+    def remove_section(self, section_id: int):
+        """Forget a deleted section"""
+        with self._lock:
+            section = self.sections.pop(section_id, None)
+            if section is not None:
+                self._sections_by_storage.get(section.storage_id, set()).discard(section_id)
+            self._paths.pop(section_id, None)
+
+    # Lookups
+    def location_path(self, obj: Union[Item, Section, int]) -> Optional[LocationPath]:
+        """LocationPath of an item, a section or a section ID (None if unknown)"""
+        if isinstance(obj, Item):
+            section_id = obj.section_id
+        elif isinstance(obj, Section):
+            section_id = obj.id
+        else:
+            section_id = obj
+        return self._paths.get(section_id)
+
+    def full_path(self, obj: Union[Item, Section, int]) -> str:
+        """"lab > storage > section" for an item, a section or a section ID ("" if unknown)"""
+        path = self.location_path(obj)
+        return path.full_path if path else ""
+
+    def storage_of(self, section: Union[Section, int]) -> Optional[Storage]:
+        """Storage device containing a section"""
+        section = self.sections.get(section) if isinstance(section, int) else section
+        return self.storages.get(section.storage_id) if section else None
+
+    def laboratory_of(self, storage: Union[Storage, int]) -> Optional[Laboratory]:
+        """Laboratory containing a storage device"""
+        storage = self.storages.get(storage) if isinstance(storage, int) else storage
+        return self.laboratories.get(storage.lab_id) if storage else None
+
+    def storages_of(self, lab_id: int) -> List[Storage]:
+        """Storage devices of a laboratory, by ID"""
+        return [self.storages[storage_id] for storage_id in sorted(self._storages_by_lab.get(lab_id, ()))
+                if storage_id in self.storages]
+
+    def sections_of(self, storage_id: int) -> List[Section]:
+        """Sections of a storage device, by ID"""
+        return [self.sections[section_id] for section_id in sorted(self._sections_by_storage.get(storage_id, ()))
+                if section_id in self.sections]
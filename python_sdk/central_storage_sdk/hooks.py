@@ -0,0 +1,108 @@
+"""
+Request hook points for the Central Storage System SDK
+
+CentralStorageClient.add_hook(event, func) calls func(span) with a RequestSpan
+at each of these points of every HTTP request:
+
+- before_send: the span holds method, URL, endpoint template and params
+- after_receive: the response arrived (status, response, network time)
+- after_decode: the request succeeded and the response was decoded into models
+  (right after JSON parsing for methods returning plain dicts or raw bytes)
+- on_error: the request failed; span.error holds the exception
+
+Exceptions raised by hooks propagate to the caller.
+"""
+
+import re
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+HOOK_EVENTS = ("before_send", "after_receive", "after_decode", "on_error")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """"GET /items/{id}" for GET http://host/api/items/42?x=1"""
+    path = urlsplit(url).path
+    if path.startswith("/api/"):
+        path = path[4:]
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class RequestSpan:
+    """One HTTP request, from send to decoded response or error"""
+
+    __slots__ = ("method", "url", "endpoint", "params", "stream", "start", "received_at", "parsed_at",
+                 "end", "decoded", "response", "status", "error")
+
+    def __init__(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, stream: bool = False):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_template(method, url)
+        self.params = params
+        self.stream = stream
+        self.start = time.perf_counter()
+        self.received_at: Optional[float] = None
+        self.parsed_at: Optional[float] = None
+        self.end: Optional[float] = None
+        self.decoded = False
+        self.response = None
+        self.status: Optional[int] = None
+        self.error: Optional[Exception] = None
+
+    def received(self, response):
+        self.received_at = time.perf_counter()
+        self.response = response
+        self.status = response.status_code
+
+    def parsed(self):
+        self.parsed_at = time.perf_counter()
+
+    def finish(self, error: Optional[Exception] = None, decoded: bool = False):
+        """Mark the span complete; decoded means model decoding ran since parsed()"""
+        self.end = time.perf_counter()
+        self.error = error
+        self.decoded = decoded
+
+    @property
+    def network_seconds(self) -> float:
+        """Send (including retries) until the response arrived"""
+        return (self.received_at or self.end or time.perf_counter()) - self.start
+
+    @property
+    def parse_seconds(self) -> float:
+        """Status checks and JSON parsing after the response arrived"""
+        if self.received_at is None or self.parsed_at is None:
+            return 0.0
+        return self.parsed_at - self.received_at
+
+    @property
+    def decode_seconds(self) -> float:
+        """Conversion of the parsed JSON into models"""
+        if not self.decoded or self.parsed_at is None or self.end is None:
+            return 0.0
+        return self.end - self.parsed_at
+
+    @property
+    def total_seconds(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def params_bytes(self) -> int:
+        return len(urlencode(self.params, doseq=True)) if self.params else 0
+
+    @property
+    def request_bytes(self) -> int:
+        request = self.response.request if self.response is not None else None
+        body = request.body if request is not None else None
+        return len(body) if body else 0
+
+    @property
+    def response_bytes(self) -> int:
+        if self.response is None:
+            return 0
+        if self.stream:
+            return int(self.response.headers.get("Content-Length") or 0)
+        return len(self.response.content)
@@ -0,0 +1,150 @@
+"""
+Per-endpoint request metrics for the Central Storage System SDK
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+from .hooks import RequestSpan
+
+# Upper bounds (milliseconds) of the histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, sum and max"""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples (max for the last one)"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.buckets_ms[index], self.max) if index < len(self.buckets_ms) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"<={bound:g}ms": count for bound, count in zip(self.buckets_ms, self.counts)}
+        buckets[f">{self.buckets_ms[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class EndpointStats:
+    """Counters and histograms of one endpoint template"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.network = LatencyHistogram()
+        self.parse = LatencyHistogram()
+        self.decode = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": dict(self.errors),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "network": self.network.snapshot(),
+            "parse": self.parse.snapshot(),
+            "decode": self.decode.snapshot(),
+        }
+
+
+class ClientMetrics:
+    """Per-endpoint request counts, errors, bytes and latency histograms
+
+    Network time runs from sending the request (including retries) until the
+    response has arrived, parse time covers JSON parsing and decode time the
+    conversion into models. Recorded from request spans (see hooks), so
+    callers sharing a coalesced request only count once. Thread safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self.started_at = time.time()
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints.setdefault(endpoint, EndpointStats())
+        return stats
+
+    def record(self, span: RequestSpan):
+        """Account a finished request (registered as after_decode and on_error hook)"""
+        bytes_in = span.response_bytes
+        bytes_out = span.request_bytes
+        with self._lock:
+            stats = self._stats(span.endpoint)
+            stats.count += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.network.add(span.network_seconds)
+            if span.parsed_at is not None and span.error is None:
+                stats.parse.add(span.parse_seconds)
+            if span.decoded and span.error is None:
+                stats.decode.add(span.decode_seconds)
+            if span.error is not None:
+                name = type(span.error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All endpoint statistics plus totals, as plain dicts"""
+        with self._lock:
+            endpoints = {name: stats.snapshot() for name, stats in sorted(self._endpoints.items())}
+        errors: Dict[str, int] = {}
+        for stats in endpoints.values():
+            for name, count in stats["errors"].items():
+                errors[name] = errors.get(name, 0) + count
+        return {
+            "since": self.started_at,
+            "requests": sum(stats["count"] for stats in endpoints.values()),
+            "errors": errors,
+            "bytes_in": sum(stats["bytes_in"] for stats in endpoints.values()),
+            "bytes_out": sum(stats["bytes_out"] for stats in endpoints.values()),
+            "endpoints": endpoints,
+        }
+
+    def top(self, n: int = 10, by: str = "network") -> List[Dict[str, Any]]:
+        """Endpoints with the most total time in one phase (network, parse or decode)"""
+        endpoints = self.snapshot()["endpoints"]
+        ranked = sorted(endpoints.items(), key=lambda entry: entry[1][by]["total_ms"], reverse=True)
+        return [dict(endpoint=name, **stats) for name, stats in ranked[:n]]
+
+    def reset(self):
+        """Drop all statistics"""
+        with self._lock:
+            self._endpoints = {}
+            self.started_at = time.time()
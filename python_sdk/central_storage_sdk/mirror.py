@@ -0,0 +1,271 @@
+"""
+Local SQLite mirror of the inventory for read-heavy consumers
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from .models import Laboratory, Storage, Section, Item, Movement, decode_model, decode_models, timestamp_key
+
+
+# table -> (endpoint, model, watermark field, indexed columns, server-side sort)
+# Movements have no sort_by support; the server always returns them newest first.
+_TABLES = {
+    "laboratories": ("/laboratories", Laboratory, "updated_at", ("code",), True),
+    "storages": ("/storages", Storage, "updated_at", ("code", "lab_id"), True),
+    "sections": ("/sections", Section, "updated_at", ("code", "storage_id"), True),
+    "items": ("/items", Item, "updated_at",
+              ("code", "name", "category", "section_id", "quantity", "min_quantity", "expiry_date"), True),
+    "movements": ("/movements", Movement, "created_at", ("item_id", "user_id", "movement_type"), False),
+}
+
+_COLUMN_TYPES = {
+    "lab_id": "INTEGER", "storage_id": "INTEGER", "section_id": "INTEGER", "item_id": "INTEGER",
+    "user_id": "INTEGER", "quantity": "INTEGER", "min_quantity": "INTEGER",
+}
+
+
+# Preloaded relations embedded in server records; JSON fields such as properties are kept
+_RELATIONS = frozenset(("storages", "laboratory", "sections", "storage", "items", "section", "item", "user"))
+
+
+def _flatten(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop preloaded relations; the mirror stores each record in its own table"""
+    return {key: value for key, value in record.items() if key not in _RELATIONS}
+
+
+class InventoryMirror:
+    """Local SQLite copy of laboratories, storages, sections, items and movements
+
+    The first sync() pulls every table. Later calls page through each listing
+    newest-first (sort_by=updated_at, movements by created_at) and stop at the
+    first record older than the stored watermark, so the cost of a sync is
+    proportional to the number of changed rows. Records shifted by concurrent
+    writes are seen twice rather than skipped, and upserts make that harmless.
+
+    Deletions are not visible through updated_at; call sync(full=True) now and
+    then (or after purges) to rebuild the tables and drop deleted rows.
+
+    Reads never touch the network and return the same models as the client.
+    """
+
+    def __init__(self, client, path: str = ":memory:", page_size: int = 100,
+                 tables: Optional[List[str]] = None):
+        """
+        Initialize the mirror
+
+        Args:
+            client: CentralStorageClient used for syncing
+            path: SQLite database file (":memory:" for a process-local mirror)
+            page_size: Page size used while syncing (the server caps it at 100)
+            tables: Subset of tables to mirror (default: all)
+        """
+        unknown = set(tables or ()) - set(_TABLES)
+        if unknown:
+            raise ValueError(f"Unknown mirror tables: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.path = path
+        self.page_size = page_size
+        self.tables = list(tables or _TABLES)
+        self.parse_dates = getattr(client, "parse_dates", False)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "name TEXT PRIMARY KEY, watermark TEXT NOT NULL, synced_at REAL NOT NULL)"
+            )
+            for table, (_, _, _, columns, _) in _TABLES.items():
+                column_defs = ", ".join(f"{column} {_COLUMN_TYPES.get(column, 'TEXT')}" for column in columns)
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    f"id INTEGER PRIMARY KEY, {column_defs}, sort_key TEXT NOT NULL, data TEXT NOT NULL)"
+                )
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_sort_key ON {table} (sort_key)")
+                for column in columns:
+                    self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Sync
+    def sync(self, full: bool = False) -> Dict[str, int]:
+        """Bring the mirror up to date
+
+        Args:
+            full: Re-pull every table from scratch instead of syncing incrementally
+
+        Returns:
+            Number of records written per table
+        """
+        return {table: self._sync_table(table, full) for table in self.tables}
+
+    def watermarks(self) -> Dict[str, Optional[str]]:
+        """Newest updated_at (created_at for movements) seen per table, as UTC"""
+        with self._lock:
+            rows = dict(self._conn.execute("SELECT name, watermark FROM sync_state").fetchall())
+        return {table: rows.get(table) for table in self.tables}
+
+    def _sync_table(self, table: str, full: bool) -> int:
+        endpoint, _, watermark_field, columns, sortable = _TABLES[table]
+        with self._lock:
+            row = self._conn.execute("SELECT watermark FROM sync_state WHERE name = ?", (table,)).fetchone()
+        watermark = None if full or row is None else row[0]
+
+        # Fetch before writing so readers keep the previous snapshot until the swap
+        changed = []
+        newest = watermark or ""
+        for record in self._iter_newest_first(endpoint, sortable):
+            key = timestamp_key(record.get(watermark_field))
+            if watermark is not None and key < watermark:
+                break
+            changed.append((record, key))
+            newest = max(newest, key)
+
+        placeholders = ", ".join("?" for _ in range(len(columns) + 3))
+        statement = (f"INSERT OR REPLACE INTO {table} (id, {', '.join(columns)}, sort_key, data) "
+                     f"VALUES ({placeholders})")
+        with self._lock, self._conn:
+            if watermark is None:
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.executemany(statement, (
+                (record["id"], *(record.get(column) for column in columns), key,
+                 json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                for record, key in changed
+            ))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (name, watermark, synced_at) VALUES (?, ?, ?)",
+                (table, newest, time.time())
+            )
+        return len(changed)
+
+    def _iter_newest_first(self, endpoint: str, sortable: bool) -> Iterator[Dict[str, Any]]:
+        page = 1
+        while True:
+            params = {"page": page, "page_size": self.page_size}
+            if sortable:
+                params.update(sort_by="updated_at", sort_desc="true")
+            response = self.client._get(endpoint, params=params)
+            for row in response.get("data") or []:
+                # /items wraps each record together with its location
+                yield _flatten(row["item"] if endpoint == "/items" else row)
+            if not response.get("has_next"):
+                return
+            page += 1
+
+    # Reads
+    def _decode_rows(self, model, rows) -> List[Any]:
+        return decode_models(model, [json.loads(data) for (data,) in rows], self.parse_dates)
+
+    def _get(self, table: str, record_id: int) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT data FROM {table} WHERE id = ?", (record_id,)).fetchone()
+        return decode_model(_TABLES[table][1], json.loads(row[0]), self.parse_dates) if row else None
+
+    def _select(self, table: str, where: str = "", args: tuple = (), order_by: str = "sort_key DESC",
+                limit: Optional[int] = None) -> List[Any]:
+        sql = f"SELECT data FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = (*args, limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return self._decode_rows(_TABLES[table][1], rows)
+
+    def count(self, table: str) -> int:
+        """Number of mirrored records in a table"""
+        if table not in _TABLES:
+            raise ValueError(f"Unknown mirror table: {table}")
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def get_laboratory(self, lab_id: int) -> Optional[Laboratory]:
+        """Mirrored laboratory by ID"""
+        return self._get("laboratories", lab_id)
+
+    def get_storage(self, storage_id: int) -> Optional[Storage]:
+        """Mirrored storage device by ID"""
+        return self._get("storages", storage_id)
+
+    def get_section(self, section_id: int) -> Optional[Section]:
+        """Mirrored section by ID"""
+        return self._get("sections", section_id)
+
+    def get_item(self, item_id: int) -> Optional[Item]:
+        """Mirrored item by ID"""
+        return self._get("items", item_id)
+
+    def get_item_by_code(self, code: str) -> Optional[Item]:
+        """Mirrored item by its unique code"""
+        items = self._select("items", "code = ?", (code,), limit=1)
+        return items[0] if items else None
+
+    def get_laboratories(self) -> List[Laboratory]:
+        """All mirrored laboratories"""
+        return self._select("laboratories", order_by="id")
+
+    def get_storages(self, lab_id: Optional[int] = None) -> List[Storage]:
+        """Mirrored storage devices, optionally of one laboratory"""
+        if lab_id is None:
+            return self._select("storages", order_by="id")
+        return self._select("storages", "lab_id = ?", (lab_id,), order_by="id")
+
+    def get_sections(self, storage_id: Optional[int] = None) -> List[Section]:
+        """Mirrored sections, optionally of one storage device"""
+        if storage_id is None:
+            return self._select("sections", order_by="id")
+        return self._select("sections", "storage_id = ?", (storage_id,), order_by="id")
+
+    def find_items(self, search: str = "", category: str = "", section_id: Optional[int] = None,
+                   low_stock: bool = False, limit: Optional[int] = None) -> List[Item]:
+        """Query mirrored items, most recently updated first
+
+        Args:
+            search: Substring matched against name and code
+            category: Exact category
+            section_id: Items in one section
+            low_stock: Only items with quantity <= min_quantity
+            limit: Maximum number of items
+        """
+        conditions, args = [], []
+        if search:
+            conditions.append("(name LIKE ? OR code LIKE ?)")
+            args += [f"%{search}%", f"%{search}%"]
+        if category:
+            conditions.append("category = ?")
+            args.append(category)
+        if section_id is not None:
+            conditions.append("section_id = ?")
+            args.append(section_id)
+        if low_stock:
+            conditions.append("quantity <= min_quantity")
+        return self._select("items", " AND ".join(conditions), tuple(args), limit=limit)
+
+    def get_movements(self, item_id: Optional[int] = None, movement_type: str = "",
+                      limit: Optional[int] = None) -> List[Movement]:
+        """Mirrored movement records, newest first"""
+        conditions, args = [], []
+        if item_id is not None:
+            conditions.append("item_id = ?")
+            args.append(item_id)
+        if movement_type:
+            conditions.append("movement_type = ?")
+            args.append(movement_type)
+        return self._select("movements", " AND ".join(conditions), tuple(args), limit=limit)
@@ -2,10 +2,39 @@
 Data models for the Central Storage System SDK
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import re
+import sys
+from dataclasses import dataclass, field, fields, MISSING
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable
+from datetime import datetime, timedelta, timezone
 
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__ so instances carry no per-instance __dict__
+    
+    Equivalent to dataclass(slots=True) on Python 3.10+, kept as a decorator for
+    older interpreters. Apply it below @dataclass; bases must be slotted as well.
+    """
+    base_fields = set()
+    for base in cls.__mro__[1:]:
+        base_fields.update(getattr(base, "__dataclass_fields__", {}))
+    own_fields = tuple(f.name for f in fields(cls) if f.name not in base_fields)
+    
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = own_fields
+    # Defaults live in the generated __init__; class attributes would clash with the slots
+    for name in own_fields:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+@slotted
 @dataclass
 class BaseModel:
     """Base model with common fields"""
@@ -13,6 +42,7 @@ class BaseModel:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+@slotted
 @dataclass
 class User(BaseModel):
     """User model"""
@@ -26,6 +56,7 @@ class User(BaseModel):
     bio: str = ""
     last_login: Optional[datetime] = None
 
+@slotted
 @dataclass
 class Laboratory(BaseModel):
     """Laboratory model"""
@@ -36,6 +67,7 @@ class Laboratory(BaseModel):
     security_level: int = 1  # 1-5
     storages: List['Storage'] = field(default_factory=list)
 
+@slotted
 @dataclass
 class Storage(BaseModel):
     """Storage device model"""
@@ -52,6 +84,7 @@ class Storage(BaseModel):
     laboratory: Optional[Laboratory] = None
     sections: List['Section'] = field(default_factory=list)
 
+@slotted
 @dataclass
 class Section(BaseModel):
     """Section model"""
@@ -68,6 +101,7 @@ class Section(BaseModel):
     storage: Optional[Storage] = None
     items: List['Item'] = field(default_factory=list)
 
+@slotted
 @dataclass
 class Item(BaseModel):
     """Item model"""
@@ -86,6 +120,7 @@ class Item(BaseModel):
     section_id: Optional[int] = None
     section: Optional[Section] = None
 
+@slotted
 @dataclass
 class Movement(BaseModel):
     """Movement record model"""
@@ -100,6 +135,66 @@ class Movement(BaseModel):
     user_id: int = 0
     user: Optional[User] = None
 
+@slotted
+@dataclass
+class MovementExportRow:
+    """One row of the /movements/export CSV"""
+    id: int = 0
+    item_name: str = ""
+    movement_type: str = ""
+    from_location: str = ""
+    to_location: str = ""
+    quantity: int = 0
+    reason: str = ""
+    notes: str = ""
+    operator: str = ""  # Real name, falling back to username
+    created_at: Optional[datetime] = None
+
+@slotted
+@dataclass
+class LocationPath:
+    """Location of a section (and its items): laboratory > storage > section"""
+    lab_code: str = ""
+    lab_name: str = ""
+    storage_code: str = ""
+    storage_name: str = ""
+    section_code: str = ""
+    section_name: str = ""
+    full_path: str = ""  # "lab name > storage name > section name"
+
+@slotted
+@dataclass
+class ItemWithLocation:
+    """One /items listing row: the item with the section and location the server preloaded"""
+    item: Item = field(default_factory=Item)
+    section: Optional[Section] = None        # With section.storage.laboratory when preloaded
+    location: Optional[LocationPath] = None  # None when the section chain is incomplete
+    
+    @property
+    def full_path(self) -> str:
+        """"lab > storage > section", or "" when the location is unknown"""
+        return self.location.full_path if self.location else ""
+
+@slotted
+@dataclass
+class BulkRowError:
+    """Failure of one row of a bulk request"""
+    index: int = 0   # Position of the row in the request
+    error: str = ""
+
+@slotted
+@dataclass
+class BulkResult:
+    """Result of a bulk endpoint"""
+    data: List[Any] = field(default_factory=list)  # One entry per request row, None where the row failed
+    errors: List[BulkRowError] = field(default_factory=list)
+    
+    @property
+    def succeeded(self) -> List[Any]:
+        """Models of the rows that succeeded"""
+        return [model for model in self.data if model is not None]
+
+@slotted
 @dataclass
 class PaginationParams:
     """Pagination parameters"""
@@ -109,6 +204,7 @@ class PaginationParams:
     sort_by: str = ""
     sort_desc: bool = False
 
+@slotted
 @dataclass
 class PaginationResponse:
     """Pagination response"""
@@ -119,3 +215,285 @@ class PaginationResponse:
     total_pages: int = 0
     has_next: bool = False
     has_prev: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Model decoding
+# ---------------------------------------------------------------------------
+
+# Nested relations the server preloads: field -> (model, is_list)
+_NESTED_FIELDS = {
+    Laboratory: {"storages": (Storage, True)},
+    Storage: {"laboratory": (Laboratory, False), "sections": (Section, True)},
+    Section: {"storage": (Storage, False), "items": (Item, True)},
+    Item: {"section": (Section, False)},
+    Movement: {"item": (Item, False), "user": (User, False)},
+}
+
+# Low-cardinality strings repeated across many rows; interned so rows share one copy
+_INTERNED_FIELDS = {
+    User: {"role", "department"},
+    Storage: {"type", "status"},
+    Section: {"status"},
+    Item: {"category", "unit", "supplier", "purchase_date", "expiry_date"},
+    Movement: {"movement_type", "from_location", "to_location", "reason"},
+}
+
+# Timestamps serialised by Go as RFC 3339 (purchase/expiry dates stay "YYYY-MM-DD" strings)
+_DATETIME_FIELDS = {"created_at", "updated_at", "last_login"}
+
+_RFC3339_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+_decoders: Dict[tuple, Callable[..., Any]] = {}
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse a Go RFC 3339 timestamp (nanosecond precision allowed)
+    
+    Go's zero time ("0001-01-01T00:00:00Z") and empty values become None;
+    unparseable strings are returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+    return _parse_datetime_str(value)
+
+
+def timestamp_key(value: Any) -> str:
+    """Normalise a timestamp (string or datetime) to a UTC string that sorts chronologically
+    
+    Missing and unparseable values map to "", which sorts first.
+    """
+    value = parse_datetime(value)
+    if not isinstance(value, datetime):
+        return ""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="microseconds")
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(value: str) -> Optional[datetime]:
+    # Cached because listings repeat the same timestamps (nested relations, bulk inserts)
+    match = _RFC3339_RE.match(value)
+    if not match:
+        return value or None
+    year, month, day, hour, minute, second, fraction, tz = match.groups()
+    if year == "0001":
+        return None
+    
+    tzinfo = None
+    if tz == "Z":
+        tzinfo = timezone.utc
+    elif tz:
+        sign = -1 if tz[0] == "-" else 1
+        tz = tz[1:].replace(":", "")
+        tzinfo = timezone(sign * timedelta(hours=int(tz[:2]), minutes=int(tz[2:])))
+    
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    microsecond, tzinfo)
+
+
+class _RawTimestamp(str):
+    """Timestamp string a parse_dates decoder left for _LazyTimestamp to parse"""
+    __slots__ = ()
+
+
+class _LazyTimestamp:
+    """Data descriptor over a timestamp slot that parses _RawTimestamp values on first access
+    
+    Decoding with parse_dates then only tags the strings; rows whose dates are
+    never read (most of a listing) never pay for datetime construction.
+    """
+    __slots__ = ("slot",)
+    
+    def __init__(self, slot):
+        self.slot = slot
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value.__class__ is _RawTimestamp:
+            value = _parse_datetime_str(value)
+            if isinstance(value, str):
+                value = str(value)
+            self.slot.__set__(obj, value)
+        return value
+    
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+    
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def _lazy_timestamp_field(cls, name: str):
+    # Wrap the slot descriptor of the class that defines the field, once
+    for owner in cls.__mro__:
+        attr = owner.__dict__.get(name)
+        if attr is None:
+            continue
+        if not isinstance(attr, _LazyTimestamp):
+            setattr(owner, name, _LazyTimestamp(attr))
+        return
+
+
+def _decode_nested(decoder: Callable[..., Any], value: Any, memo: Optional[Dict[tuple, Any]]) -> Any:
+    # Relations that were not preloaded are serialised by Go as zero structs (id 0)
+    if not isinstance(value, dict):
+        return None
+    record_id = value.get("id")
+    if not record_id:
+        return None
+    if memo is None:
+        return decoder(value, None)
+    
+    # Rows of one page usually share the same section/storage/laboratory,
+    # so decode each distinct record once and reuse the model
+    key = (decoder, record_id, value.get("updated_at"))
+    model = memo.get(key)
+    if model is None:
+        model = memo[key] = decoder(value, memo)
+    return model
+
+
+def _decode_nested_list(decoder: Callable[..., Any], value: Any, memo: Optional[Dict[tuple, Any]]) -> List[Any]:
+    if not value:
+        return []
+    return [decoder(row, memo) for row in value]
+
+
+def _compile_decoder(cls, parse_dates: bool) -> Callable[..., Any]:
+    """Generate a decoder function for a model dataclass
+    
+    The generated function constructs the model with cls(**data), which is the
+    fastest path while the server sends only known fields, and falls back to
+    dropping unknown keys instead of raising TypeError. It then decodes nested
+    relations into models, interns low-cardinality strings, replaces JSON nulls
+    in dict/list fields and optionally marks timestamps to be parsed into
+    datetime objects on first access.
+    """
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "_field_names": frozenset(f.name for f in fields(cls)),
+        "_decode_nested": _decode_nested,
+        "_decode_nested_list": _decode_nested_list,
+        "_RawTimestamp": _RawTimestamp,
+        "_sys_intern": sys.intern,
+    }
+    nested = _NESTED_FIELDS.get(cls, {})
+    interned = _INTERNED_FIELDS.get(cls, set())
+    # Once the server has sent an unknown field, filter every row instead of
+    # paying for a TypeError per row
+    namespace["_filter_keys"] = [False]
+    lines = [
+        "def decode(data, memo=None):",
+        "    if _filter_keys[0]:",
+        "        obj = cls(**{k: v for k, v in data.items() if k in _field_names})",
+        "    else:",
+        "        try:",
+        "            obj = cls(**data)",
+        "        except TypeError:",
+        "            _filter_keys[0] = True",
+        "            obj = cls(**{k: v for k, v in data.items() if k in _field_names})",
+    ]
+    
+    for f in fields(cls):
+        name = f.name
+        if name in nested:
+            nested_cls, is_list = nested[name]
+            # Resolved on first call, since relations are mutually recursive
+            namespace[f"_dec_{name}"] = _LazyDecoder(nested_cls, parse_dates)
+            if is_list:
+                lines.append(f"    obj.{name} = _decode_nested_list(_dec_{name}, obj.{name}, memo)")
+            else:
+                lines.append(f"    if obj.{name} is not None:")
+                lines.append(f"        obj.{name} = _decode_nested(_dec_{name}, obj.{name}, memo)")
+        elif name in _DATETIME_FIELDS and parse_dates:
+            _lazy_timestamp_field(cls, name)
+            lines.append(f"    value = obj.{name}")
+            lines.append("    if value.__class__ is str:")
+            lines.append(f"        obj.{name} = _RawTimestamp(value)")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            lines.append(f"    if obj.{name} is None:")
+            lines.append(f"        obj.{name} = _factory_{name}()")
+        elif name in interned:
+            lines.append(f"    value = obj.{name}")
+            lines.append("    if value.__class__ is str:")
+            lines.append(f"        obj.{name} = _sys_intern(value)")
+    
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)
+    decode = namespace["decode"]
+    decode.__qualname__ = f"decode_{cls.__name__}"
+    return decode
+
+
+class _LazyDecoder:
+    """Forward reference to another model's decoder, resolved on first use"""
+    __slots__ = ("cls", "parse_dates", "decoder")
+    
+    def __init__(self, cls, parse_dates: bool):
+        self.cls = cls
+        self.parse_dates = parse_dates
+        self.decoder = None
+    
+    def __call__(self, data: Dict[str, Any], memo: Optional[Dict[tuple, Any]] = None) -> Any:
+        if self.decoder is None:
+            self.decoder = get_decoder(self.cls, self.parse_dates)
+        return self.decoder(data, memo)
+
+
+def get_decoder(cls, parse_dates: bool = False) -> Callable[..., Any]:
+    """Return the compiled decoder turning a server JSON object into a model
+    
+    The decoder is called as decoder(data, memo=None). Passing the same memo dict
+    for every row of a page decodes shared nested records only once.
+    
+    Args:
+        cls: Model dataclass (Item, Section, ...)
+        parse_dates: Convert created_at/updated_at/last_login into datetime objects
+            (parsed on first access); by default they are kept as the server's strings
+    """
+    key = (cls, parse_dates)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        decoder = _decoders[key] = _compile_decoder(cls, parse_dates)
+    return decoder
+
+
+def decode_model(cls, data: Optional[Dict[str, Any]], parse_dates: bool = False) -> Any:
+    """Decode one server JSON object into a model"""
+    return get_decoder(cls, parse_dates)(data or {})
+
+
+def decode_models(cls, rows: Optional[List[Dict[str, Any]]], parse_dates: bool = False) -> List[Any]:
+    """Decode a list of server JSON objects into models, sharing repeated nested records"""
+    decoder = get_decoder(cls, parse_dates)
+    memo: Dict[tuple, Any] = {}
+    return [decoder(row, memo) for row in rows or []]
+
+
+def decode_items_with_location(rows: Optional[List[Dict[str, Any]]],
+                               parse_dates: bool = False) -> List[ItemWithLocation]:
+    """Decode /items listing rows ({"item", "section", "location"}) keeping the preloaded data"""
+    item_decoder = get_decoder(Item, parse_dates)
+    section_decoder = get_decoder(Section, parse_dates)
+    location_decoder = get_decoder(LocationPath)
+    memo: Dict[tuple, Any] = {}
+    results = []
+    for row in rows or []:
+        item = item_decoder(row.get("item") or {}, memo)
+        # The item carries the same preloaded section; decode the copy only if it does not
+        section = item.section or _decode_nested(section_decoder, row.get("section"), memo)
+        location = row.get("location")
+        results.append(ItemWithLocation(
+            item=item,
+            section=section,
+            location=location_decoder(location) if location and location.get("full_path") else None
+        ))
+    return results
@@ -0,0 +1,269 @@
+"""
+In-process item queries with the semantics of the server's GET /items
+"""
+
+import bisect
+import re
+import threading
+from datetime import date, timedelta
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
+
+from .models import Item, PaginationParams, PaginationResponse, timestamp_key
+
+
+# Sort fields accepted by GetItems (GO/handlers/item.go); anything else falls back to created_at DESC
+_SORT_FIELDS: Dict[str, Callable[[Item], Any]] = {
+    "name": lambda item: item.name or "",
+    "code": lambda item: item.code or "",
+    "category": lambda item: item.category or "",
+    "quantity": lambda item: item.quantity or 0,
+    "price": lambda item: item.price or 0.0,
+    "created_at": lambda item: timestamp_key(item.created_at),
+    "updated_at": lambda item: timestamp_key(item.updated_at),
+}
+
+# SQLite's LIKE folds case for ASCII letters only
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _is_true(value: Any) -> bool:
+    return value is True or value == "true"
+
+
+def _like_regex(term: str):
+    """Regex for a LIKE term where % and _ are wildcards that stay within one field"""
+    return re.compile("".join(
+        "[^\x00\x01]*" if char == "%" else "[^\x00\x01]" if char == "_" else re.escape(char) for char in term
+    ))
+
+
+class ItemQueryEngine:
+    """Answers get_items()-style queries from a locally loaded item set
+
+    Filters, search, sorting and pagination follow GetItems: search matches
+    name, code, description or category (ASCII case-insensitive, like SQLite
+    LIKE), low_stock means quantity <= min_quantity, expiring keeps items with
+    an expiry date within expiring_days (default 30), the default order is
+    created_at DESC and page_size is capped at 100. Ties are broken by id.
+
+    Category, section_id and expiry_date are indexed, low-stock rows are kept
+    as a set, and one ordering per sort field is built on first use, so a
+    query only touches the rows that pass its most selective index.
+    The engine is a snapshot: call load() again to refresh it.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._lock = threading.Lock()
+        self.load(items)
+
+    @classmethod
+    def from_client(cls, client, concurrency: int = 8, **filters) -> "ItemQueryEngine":
+        """Load every item (optionally pre-filtered server-side) from the API"""
+        return cls(client.fetch_all("items", concurrency=concurrency, **filters))
+
+    def load(self, items: Iterable[Item]):
+        """Replace the item set and rebuild the indexes"""
+        items = sorted(items, key=lambda item: item.id or 0)
+        by_category: Dict[str, List[int]] = {}
+        by_section: Dict[int, List[int]] = {}
+        expiry = []
+        low_stock = set()
+        haystacks = []
+        offsets = []
+        offset = 0
+
+        for position, item in enumerate(items):
+            by_category.setdefault(item.category or "", []).append(position)
+            if item.section_id is not None:
+                by_section.setdefault(item.section_id, []).append(position)
+            if item.expiry_date:
+                expiry.append((item.expiry_date, position))
+            if (item.quantity or 0) <= (item.min_quantity or 0):
+                low_stock.add(position)
+            haystack = "\x00".join(
+                (item.name or "", item.code or "", item.description or "", item.category or "")
+            ).translate(_ASCII_LOWER)
+            haystacks.append(haystack)
+            offsets.append(offset)
+            offset += len(haystack) + 1
+
+        expiry.sort()
+        with self._lock:
+            self._items = items
+            self._by_category = by_category
+            self._by_section = by_section
+            self._expiry_dates = [expiry_date for expiry_date, _ in expiry]
+            self._expiry_positions = [position for _, position in expiry]
+            self._low_stock = low_stock
+            self._haystacks = haystacks
+            # All haystacks in one string so a search is a C-level scan instead of a Python loop
+            self._corpus = "\x01".join(haystacks)
+            self._offsets = offsets
+            self._keys: Dict[str, List[Any]] = {}
+            self._orders: Dict[tuple, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _sort_keys(self, sort_by: str) -> List[Any]:
+        """Sort key of every item for one field (computed once per field)"""
+        keys = self._keys.get(sort_by)
+        if keys is None:
+            key = _SORT_FIELDS[sort_by]
+            keys = [key(item) for item in self._items]
+            with self._lock:
+                self._keys[sort_by] = keys
+        return keys
+
+    def _order(self, sort_by: str, sort_desc: bool) -> List[int]:
+        """Positions ordered by a sort field, built once per field and direction"""
+        order = self._orders.get((sort_by, sort_desc))
+        if order is None:
+            # Items are stored by id and sorted() is stable (also with reverse=True),
+            # so equal keys stay in id order
+            order = sorted(range(len(self._items)), key=self._sort_keys(sort_by).__getitem__, reverse=sort_desc)
+            with self._lock:
+                self._orders[(sort_by, sort_desc)] = order
+        return order
+
+    def _search(self, search: str, within: Optional[Iterable[int]] = None) -> List[int]:
+        """Positions whose name, code, description or category match the search term"""
+        term = search.translate(_ASCII_LOWER)
+        wildcard = "%" in term or "_" in term
+        if within is not None:
+            haystacks = self._haystacks
+            if wildcard:
+                regex = _like_regex(term)
+                return [position for position in within if regex.search(haystacks[position])]
+            return [position for position in within if term in haystacks[position]]
+
+        corpus, offsets = self._corpus, self._offsets
+        if wildcard:
+            regex = _like_regex(term)
+
+            def find(start: int) -> int:
+                match = regex.search(corpus, start)
+                return match.start() if match else -1
+        else:
+            def find(start: int) -> int:
+                return corpus.find(term, start)
+        found = []
+        start = find(0)
+        while start != -1:
+            position = bisect.bisect_right(offsets, start) - 1
+            found.append(position)
+            if position + 1 >= len(offsets):
+                break
+            start = find(offsets[position + 1])
+        return found
+
+    def _candidates(self, search: str, filters: Dict[str, Any], today: Optional[date]) -> Optional[Collection[int]]:
+        """Positions matching the filters, or None when no filter applies"""
+        candidate_sets = []
+
+        section_id = filters.get("section_id")
+        if section_id not in (None, ""):
+            try:
+                candidate_sets.append(self._by_section.get(int(section_id), []))
+            except (TypeError, ValueError):
+                return []
+
+        category = filters.get("category")
+        if category:
+            candidate_sets.append(self._by_category.get(category, []))
+
+        if _is_true(filters.get("expiring")):
+            days = 30
+            try:
+                requested = int(filters.get("expiring_days") or 0)
+                if requested > 0:
+                    days = requested
+            except (TypeError, ValueError):
+                pass
+            cutoff = ((today or date.today()) + timedelta(days=days)).isoformat()
+            end = bisect.bisect_right(self._expiry_dates, cutoff)
+            candidate_sets.append(self._expiry_positions[:end])
+
+        if _is_true(filters.get("low_stock")):
+            candidate_sets.append(self._low_stock)
+
+        if not candidate_sets and not search:
+            return None
+
+        candidate_sets.sort(key=len)
+        result = None
+        if candidate_sets:
+            result = set(candidate_sets[0])
+            for other in candidate_sets[1:]:
+                result.intersection_update(other)
+        if search:
+            if result is not None and len(result) < 2000:
+                return self._search(search, result)
+            matches = self._search(search)
+            return matches if result is None else [position for position in matches if position in result]
+        return result
+
+    def query(self, search: str = "", sort_by: str = "", sort_desc: bool = False,
+              today: Optional[date] = None, **filters) -> List[Item]:
+        """All items matching the filters, in server order (no pagination)
+
+        Args:
+            search: Substring of name, code, description or category
+            sort_by: name, code, category, quantity, price, created_at or updated_at
+            sort_desc: Sort descending
+            today: Reference date for the expiring filter (default: today)
+            **filters: section_id, category, low_stock, expiring, expiring_days
+        """
+        _, selected = self._select(search, sort_by, sort_desc, today, filters)
+        return [self._items[position] for position in selected]
+
+    def _select(self, search: str, sort_by: str, sort_desc: bool, today: Optional[date],
+                filters: Dict[str, Any], stop: Optional[int] = None) -> Tuple[int, List[int]]:
+        """Total number of matches and the matching positions in order
+
+        With stop, only the first stop positions are guaranteed to be returned.
+        """
+        if sort_by not in _SORT_FIELDS:
+            sort_by, sort_desc = "created_at", True
+
+        candidates = self._candidates(search, filters, today)
+        if candidates is None:
+            order = self._order(sort_by, sort_desc)
+            return len(order), order
+        if len(candidates) * 8 < len(self._items):
+            # Few matches: sorting them is cheaper than scanning the prebuilt order
+            return len(candidates), sorted(sorted(candidates), key=self._sort_keys(sort_by).__getitem__,
+                                           reverse=sort_desc)
+        wanted = candidates if isinstance(candidates, set) else set(candidates)
+        selected = []
+        for position in self._order(sort_by, sort_desc):
+            if position in wanted:
+                selected.append(position)
+                if len(selected) == stop:
+                    break
+        return len(wanted), selected
+
+    def get_items(self, params: Optional[PaginationParams] = None, today: Optional[date] = None,
+                  **filters) -> PaginationResponse:
+        """Drop-in local replacement for CentralStorageClient.get_items"""
+        params = params or PaginationParams()
+        page = params.page if params.page > 0 else 1
+        page_size = params.page_size if params.page_size > 0 else 20
+        page_size = min(page_size, 100)
+        offset = (page - 1) * page_size
+
+        # Like the client, explicit filters override the pagination parameters
+        search = filters.pop("search", params.search)
+        sort_by = filters.pop("sort_by", params.sort_by)
+        sort_desc = _is_true(filters.pop("sort_desc", params.sort_desc))
+        total, selected = self._select(search, sort_by, sort_desc, today, filters, stop=offset + page_size)
+        total_pages = (total + page_size - 1) // page_size
+        return PaginationResponse(
+            data=[self._items[position] for position in selected[offset:offset + page_size]],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1
+        )
@@ -0,0 +1,144 @@
+"""
+Client-side rate limiting for the Central Storage System SDK
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+ENDPOINT_CLASSES = ("reads", "writes", "admin")
+
+
+def endpoint_class(method: str, url: str) -> str:
+    """"admin" for /api/admin routes, "reads" for GET/HEAD and "writes" otherwise"""
+    if urlsplit(url).path.startswith("/api/admin/"):
+        return "admin"
+    return "reads" if method.upper() in ("GET", "HEAD") else "writes"
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `burst` tokens
+
+    reserve() takes a token immediately, letting the balance go negative, and
+    returns how long the caller has to wait before its turn. Callers therefore
+    never wait while holding the lock and are served in arrival order. Thread safe.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens; returns the seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.tokens -= tokens
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class _WaitStats:
+    __slots__ = ("requests", "waited", "wait_seconds", "max_wait")
+
+    def __init__(self):
+        self.requests = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "waited": self.waited,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "mean_wait_ms": round(self.wait_seconds / self.waited * 1000, 3) if self.waited else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class RateLimiter:
+    """Token-bucket limits on requests per second, overall and per endpoint class
+
+    Endpoint classes are reads (GET/HEAD), writes (other methods) and admin
+    (/api/admin routes). A request takes a token from the overall bucket and
+    from its class bucket and waits until both allow it; nothing is rejected.
+    One limiter can be shared by several clients, threads and asyncio tasks
+    (pass the same instance to each client) and records the time spent waiting.
+    """
+
+    def __init__(self, total: Optional[float] = None, reads: Optional[float] = None,
+                 writes: Optional[float] = None, admin: Optional[float] = None, burst: float = 1.0):
+        """
+        Initialize the limiter
+
+        Args:
+            total: Requests per second across all endpoints (None: unlimited)
+            reads: Requests per second for reads
+            writes: Requests per second for writes
+            admin: Requests per second for admin routes
+            burst: Seconds worth of requests that may be sent at once after an idle period
+        """
+        self.total = TokenBucket(total, total * burst) if total else None
+        self.classes: Dict[str, Optional[TokenBucket]] = {
+            name: TokenBucket(rate, rate * burst) if rate else None
+            for name, rate in (("reads", reads), ("writes", writes), ("admin", admin))
+        }
+        self._lock = threading.Lock()
+        self._stats = {name: _WaitStats() for name in ENDPOINT_CLASSES}
+
+    def reserve(self, method: str, url: str) -> Tuple[str, float]:
+        """Take the tokens of one request; returns its endpoint class and the seconds to wait"""
+        name = endpoint_class(method, url)
+        delay = 0.0
+        for bucket in (self.total, self.classes[name]):
+            if bucket is not None:
+                delay = max(delay, bucket.reserve())
+        return name, delay
+
+    def _record(self, name: str, delay: float):
+        with self._lock:
+            stats = self._stats[name]
+            stats.requests += 1
+            if delay > 0:
+                stats.waited += 1
+                stats.wait_seconds += delay
+                stats.max_wait = max(stats.max_wait, delay)
+
+    def acquire(self, method: str, url: str) -> float:
+        """Block until the request may be sent; returns the seconds waited"""
+        name, delay = self.reserve(method, url)
+        if delay > 0:
+            time.sleep(delay)
+        self._record(name, delay)
+        return delay
+
+    async def acquire_async(self, method: str, url: str) -> float:
+        """Like acquire, but awaits instead of blocking the event loop"""
+        name, delay = self.reserve(method, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._record(name, delay)
+        return delay
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Requests, requests that had to wait and wait time per endpoint class, plus totals"""
+        with self._lock:
+            classes = {name: stats.snapshot() for name, stats in self._stats.items()}
+        return {
+            "requests": sum(stats["requests"] for stats in classes.values()),
+            "waited": sum(stats["waited"] for stats in classes.values()),
+            "wait_seconds": round(sum(stats["wait_seconds"] for stats in classes.values()), 3),
+            "classes": classes,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {name: _WaitStats() for name in ENDPOINT_CLASSES}
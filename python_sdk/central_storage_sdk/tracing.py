@@ -0,0 +1,278 @@
+"""
+Request tracing and batch profiling for the Central Storage System SDK
+
+JSONLTracer writes one JSON line per HTTP request through the client hooks.
+BatchProfiler (and the profiled() wrapper for BatchOperations) runs a block
+under cProfile, following worker threads, plus optional tracemalloc, and
+writes a report when the block ends.
+"""
+
+import contextvars
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .hooks import RequestSpan
+
+# Python 3.12+ runs cProfile on sys.monitoring, which allows one active profiler
+# per process; enabling another one in a worker thread raises ValueError
+_PER_THREAD_PROFILERS = sys.version_info < (3, 12)
+
+
+class JSONLTracer:
+    """Appends a span record per request to a JSONL file
+
+    Each line holds ts, method, endpoint, path, params_bytes, request_bytes,
+    response_bytes, status, network_ms, parse_ms, decode_ms, total_ms, error
+    and thread, plus the tracer's tags (e.g. a batch or job id). Tags given to
+    the constructor go on every record; tags from tag() only on requests made
+    in that block's context, i.e. by the same thread or by SDK worker threads
+    it started (BatchOperations, fetch_all, prefetching), which run in a copy
+    of the submitting thread's context. Thread safe.
+    """
+
+    def __init__(self, path: Union[str, Path], **tags):
+        """
+        Initialize the tracer
+
+        Args:
+            path: JSONL file to append to
+            **tags: Fields added to every record
+        """
+        self.path = Path(path)
+        self.tags: Dict[str, Any] = dict(tags)
+        self._context_tags: contextvars.ContextVar = contextvars.ContextVar(f"tracer_tags_{id(self)}", default={})
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._clients: List[Any] = []
+
+    def attach(self, client) -> "JSONLTracer":
+        """Trace every request of a CentralStorageClient"""
+        client.add_hook("after_decode", self.record)
+        client.add_hook("on_error", self.record)
+        self._clients.append(client)
+        return self
+
+    def detach(self, client):
+        """Stop tracing a client"""
+        client.remove_hook("after_decode", self.record)
+        client.remove_hook("on_error", self.record)
+        if client in self._clients:
+            self._clients.remove(client)
+
+    @contextmanager
+    def tag(self, **tags):
+        """Add fields to the records of requests made inside the block (by this thread
+        and the SDK worker threads it starts)"""
+        token = self._context_tags.set({**self._context_tags.get(), **tags})
+        try:
+            yield self
+        finally:
+            self._context_tags.reset(token)
+
+    def record(self, span: RequestSpan):
+        """Write one span (registered as after_decode and on_error hook)"""
+        line = {
+            "ts": round(time.time(), 6),
+            "method": span.method,
+            "endpoint": span.endpoint,
+            "path": span.url.split("?", 1)[0],
+            "params_bytes": span.params_bytes,
+            "request_bytes": span.request_bytes,
+            "response_bytes": span.response_bytes,
+            "status": span.status,
+            "network_ms": round(span.network_seconds * 1000, 3),
+            "parse_ms": round(span.parse_seconds * 1000, 3),
+            "decode_ms": round(span.decode_seconds * 1000, 3),
+            "total_ms": round(span.total_seconds * 1000, 3),
+            "error": f"{type(span.error).__name__}: {span.error}" if span.error is not None else None,
+            "thread": threading.current_thread().name,
+        }
+        line.update(self.tags)
+        line.update(self._context_tags.get())
+        text = json.dumps(line, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(text)
+            self.count += 1
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Detach from all clients and close the file"""
+        for client in list(self._clients):
+            self.detach(client)
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BatchProfiler:
+    """cProfile and tracemalloc around a block, reported when it ends
+
+    The calling thread and every thread started inside the block (such as
+    BatchOperations workers) get their own profiler; the statistics are merged
+    into one report. On Python 3.12+ cProfile allows only one active profiler
+    per process, so worker threads are not followed there: the single profiler
+    of the calling thread still counts their calls, but mixes them into its own
+    call stack, so their cumulative times are unreliable. Profiling slows Python
+    code down noticeably, so compare runs made with the same settings rather
+    than absolute times.
+    """
+
+    def __init__(self, report_path: Optional[Union[str, Path]] = None, memory: bool = True,
+                 top: int = 30, sort: str = "cumulative", dump_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the profiler
+
+        Args:
+            report_path: Text report file (default: print the report)
+            memory: Also trace allocations with tracemalloc
+            top: Number of functions and allocation sites to list
+            sort: pstats sort key of the function listing
+            dump_path: Also write the merged statistics here (for snakeviz, pstats, ...)
+        """
+        self.report_path = Path(report_path) if report_path else None
+        self.dump_path = Path(dump_path) if dump_path else None
+        self.memory = memory
+        self.top = top
+        self.sort = sort
+        self.report: Optional[str] = None
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+        self._started_tracemalloc = False
+
+    def _profile_thread(self, frame, event, arg):
+        # Installed with threading.setprofile: runs once on each new thread and
+        # replaces itself with that thread's own profiler
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def __enter__(self):
+        self._profiles = []
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.memory and hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        if _PER_THREAD_PROFILERS:
+            threading.setprofile(self._profile_thread)
+        main = cProfile.Profile()
+        self._profiles.append(main)
+        self._start = time.perf_counter()
+        main.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiles[0].disable()
+        self.seconds = time.perf_counter() - self._start
+        if _PER_THREAD_PROFILERS:
+            threading.setprofile(None)
+
+        snapshot = peak = None
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles[1:]:
+            # Worker threads have normally finished; a still running one is read as is
+            profile.disable()
+
+        self.report = self._build_report(profiles, snapshot, peak)
+        if self.dump_path is not None:
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(str(self.dump_path))
+        if self.report_path is not None:
+            self.report_path.write_text(self.report, encoding="utf-8")
+            print(f"Profile report written to {self.report_path}")
+        else:
+            print(self.report)
+
+    def _build_report(self, profiles, snapshot, peak) -> str:
+        out = io.StringIO()
+        out.write(f"Profiled {self.seconds:.3f} s across {len(profiles)} thread(s)\n\n")
+        stats = pstats.Stats(profiles[0], stream=out)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.sort_stats(self.sort).print_stats(self.top)
+
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            out.write(f"Peak traced memory: {peak / 1e6:.1f} MB\n")
+            out.write(f"Top {self.top} allocation sites still held at the end:\n")
+            for stat in snapshot.statistics("lineno")[:self.top]:
+                frame = stat.traceback[0]
+                out.write(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  "
+                          f"{frame.filename}:{frame.lineno}\n")
+        return out.getvalue()
+
+
+class ProfiledBatch:
+    """Proxy for BatchOperations that runs each method call under a BatchProfiler
+
+    Reports go to report_dir as <method>-<timestamp>.txt; attributes that are
+    not methods pass through unchanged.
+    """
+
+    def __init__(self, batch, report_dir: Union[str, Path] = ".", **profiler_options):
+        self._batch = batch
+        self._report_dir = Path(report_dir)
+        self._options = profiler_options
+        self.last_profiler: Optional[BatchProfiler] = None
+
+    def __getattr__(self, name):
+        attr = getattr(self._batch, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+
+        def run(*args, **kwargs):
+            self._report_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            profiler = BatchProfiler(self._report_dir / f"{name}-{stamp}.txt", **self._options)
+            self.last_profiler = profiler
+            with profiler:
+                return attr(*args, **kwargs)
+
+        run.__name__ = name
+        run.__doc__ = attr.__doc__
+        return run
+
+
+def profiled(batch, report_dir: Union[str, Path] = ".", **profiler_options) -> ProfiledBatch:
+    """Wrap a BatchOperations so every method call writes a profile report
+
+    Args:
+        batch: BatchOperations instance
+        report_dir: Directory the reports are written to
+        **profiler_options: memory, top, sort (see BatchProfiler)
+    """
+    return ProfiledBatch(batch, report_dir, **profiler_options)
@@ -0,0 +1,81 @@
+"""
+HTTP transport configuration for the Central Storage System SDK
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Union
+
+
+@dataclass
+class TransportConfig:
+    """Connection pooling, timeout and retry settings shared by the clients
+
+    Retries use full-jitter exponential backoff: the n-th retry sleeps a random
+    time in [0, min(backoff_max, backoff_factor * 2 ** n)], or the server's
+    Retry-After value when one is sent. Connection errors and retry_statuses
+    are only retried for idempotent methods, except 429 which means the server
+    rejected the request without processing it and is retried for any method.
+    """
+    pool_connections: int = 10  # Number of host pools kept by the session
+    pool_maxsize: int = 10      # Sockets kept alive per host; raise to match worker threads
+    pool_block: bool = False    # Block when the pool is exhausted instead of opening extra sockets
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    retry_methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    respect_retry_after: bool = True
+
+    @property
+    def timeout(self) -> Union[None, Tuple[Optional[float], Optional[float]]]:
+        """Timeout argument for requests, or None when no timeout is configured"""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+    def should_retry(self, method: str, attempt: int, status_code: Optional[int] = None) -> bool:
+        """Whether a failed attempt (0-based) may be retried
+
+        Args:
+            method: HTTP method
+            attempt: Number of the attempt that just failed
+            status_code: Response status, or None for a connection error/timeout
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status_code == 429 and 429 in self.retry_statuses:
+            return True
+        if method.upper() not in self.retry_methods:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retrying the given failed attempt"""
+        if retry_after and self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
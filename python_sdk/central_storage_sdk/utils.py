@@ -2,9 +2,12 @@
 Utility functions for the Central Storage System SDK
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+import contextvars
 import random
 import string
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 def generate_code(prefix: str = "", length: int = 8) -> str:
@@ -137,25 +140,82 @@ def generate_test_items(section_ids: List[int], count_per_section: int = 3) -> L
     
     return items
 
-def batch_create_with_progress(client, create_func, data_list: List[Dict], description: str = "Creating"):
-    """Batch create items with progress indication"""
-    created_items = []
-    total = len(data_list)
+def concurrent_map(func: Callable[[Any], Any], data_iter: Iterable[Any], max_workers: int = 1,
+                   max_pending: Optional[int] = None) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Apply func to every element, yielding (data, result, error) tuples in input order
+    
+    With max_workers > 1 calls run on a thread pool, but at most max_pending
+    (default 2 * max_workers) calls are submitted ahead of the consumer, so the
+    input iterable is read lazily and memory stays bounded on huge inputs.
+    """
+    if max_workers <= 1:
+        for data in data_iter:
+            try:
+                yield data, func(data), None
+            except Exception as e:
+                yield data, None, e
+        return
     
-    print(f"{description} {total} items...")
+    max_pending = max_pending or max_workers * 2
     
-    for i, data in enumerate(data_list, 1):
+    def resolve(data, future):
         try:
-            item = create_func(data)
-            created_items.append(item)
-            
-            # Progress indication
-            if i % 10 == 0 or i == total:
-                print(f"Progress: {i}/{total} ({i/total*100:.1f}%)")
-                
+            return data, future.result(), None
         except Exception as e:
-            print(f"Failed to create item {i}: {e}")
+            return data, None, e
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for data in data_iter:
+            pending.append((data, submit_in_context(executor, func, data)))
+            if len(pending) >= max_pending:
+                yield resolve(*pending.popleft())
+        while pending:
+            yield resolve(*pending.popleft())
+
+def submit_in_context(executor: Executor, func: Callable, *args, **kwargs) -> Future:
+    """executor.submit running func in a copy of the caller's contextvars context
+    
+    Keeps context such as JSONLTracer.tag() with the task on the worker thread.
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+def batch_create_with_progress(client, create_func, data_list: Iterable[Dict], description: str = "Creating",
+                               max_workers: int = 1, failures: Optional[List[Tuple[int, Dict, Exception]]] = None):
+    """Batch create items with progress indication
+    
+    Args:
+        client: API client (kept for backwards compatibility)
+        create_func: Function creating a single row
+        data_list: Rows to create; any iterable is accepted and consumed lazily
+        description: Progress message prefix
+        max_workers: Number of concurrent create calls (1 keeps the sequential behaviour)
+        failures: Optional list receiving (row_number, data, exception) for every failed row
+    
+    Returns:
+        Successfully created objects in input order
+    """
+    created_items = []
+    total = len(data_list) if hasattr(data_list, '__len__') else None
+    
+    print(f"{description} {total if total is not None else 'streamed'} items...")
+    
+    i = 0
+    for i, (data, item, error) in enumerate(concurrent_map(create_func, data_list, max_workers), 1):
+        if error is not None:
+            print(f"Failed to create item {i}: {error}")
+            if failures is not None:
+                failures.append((i, data, error))
             continue
+        
+        created_items.append(item)
+        
+        # Progress indication
+        if i % 10 == 0 or i == total:
+            if total:
+                print(f"Progress: {i}/{total} ({i/total*100:.1f}%)")
+            else:
+                print(f"Progress: {i}")
     
-    print(f"Successfully created {len(created_items)} out of {total} items")
+    print(f"Successfully created {len(created_items)} out of {total if total is not None else i} items")
     return created_items
@@ -15,6 +15,7 @@ sys.path.insert(0, str(sdk_path.parent))
 
 from central_storage_sdk import CentralStorageClient
 from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.hierarchy import HierarchyIndex
 from central_storage_sdk.models import PaginationParams
 from central_storage_sdk.utils import generate_code
 
@@ -214,30 +215,20 @@ def view_current_sections(client):
     print("\n📊 Current Sections Overview")
     print("-" * 50)
     
-    sections = client.get_sections(params=PaginationParams(page_size=100))
+    # One paginated pass over labs/storages/sections instead of a request per storage
+    hierarchy = HierarchyIndex(client)
     
-    if not sections.data:
+    if not hierarchy.sections:
         print("❌ No sections found.")
         return
     
-    print(f"Total sections: {sections.total}")
-    
-    # Group by storage
-    storage_sections = {}
-    for section in sections.data:
-        storage_id = section.storage_id
-        if storage_id not in storage_sections:
-            storage_sections[storage_id] = []
-        storage_sections[storage_id].append(section)
+    print(f"Total sections: {len(hierarchy.sections)}")
     
     print(f"\nSections grouped by storage device:")
-    for storage_id, section_list in storage_sections.items():
-        # Get storage name
-        try:
-            storage = client.get_storage(storage_id)
-            storage_name = storage.name
-        except:
-            storage_name = f"Storage ID {storage_id}"
+    for storage_id in sorted({section.storage_id for section in hierarchy.sections.values()}):
+        section_list = hierarchy.sections_of(storage_id)
+        storage = hierarchy.storages.get(storage_id)
+        storage_name = storage.name if storage else f"Storage ID {storage_id}"
         
         print(f"\n📦 {storage_name} ({len(section_list)} sections):")
         for section in section_list[:5]:  # Show first 5
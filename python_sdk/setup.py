@@ -30,6 +30,12 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "numpy": [
+            "numpy>=1.17",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
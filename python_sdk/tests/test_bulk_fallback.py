@@ -0,0 +1,97 @@
+"""
+BatchOperations against a server without the bulk endpoints
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.datagen import TestDataGenerator as DataGenerator
+
+from stand_in import StandInAPI
+
+
+@pytest.fixture
+def legacy_api():
+    with StandInAPI(bulk=False) as api:
+        api.seed_data(labs=1, storages_per_lab=1, sections_per_storage=2, items_per_section=5,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture
+def batch(legacy_api):
+    client = CentralStorageClient(legacy_api.base_url)
+    client.login("admin", "admin123")
+    return BatchOperations(client)
+
+
+def test_quantity_updates_fall_back_to_single_requests(legacy_api, batch):
+    item_ids = list(legacy_api.tables["items"])
+    updates = [{"item_id": item_id, "quantity": 7} for item_id in item_ids]
+    failures = []
+
+    updated = batch.bulk_update_item_quantities(updates, failures=failures)
+
+    assert not batch.use_bulk
+    assert failures == []
+    assert len(updated) == len(item_ids)
+    assert all(legacy_api.tables["items"][item_id]["quantity"] == 7 for item_id in item_ids)
+
+
+def test_item_creation_falls_back_to_single_requests(legacy_api, batch):
+    section_ids = list(legacy_api.tables["sections"])
+    rows = list(DataGenerator(1).items(section_ids, 3))
+
+    created = batch.create_items_batch(rows)
+
+    assert not batch.use_bulk
+    assert len(created) == len(rows)
+
+
+def test_failed_rows_keep_their_position(legacy_api, batch):
+    batch.use_bulk = False
+    item_id = next(iter(legacy_api.tables["items"]))
+    updates = [
+        {"item_id": item_id, "quantity": 1},
+        {"item_id": 999998, "quantity": 1},
+        {"item_id": item_id, "quantity": 2},
+        {"item_id": 999999, "quantity": 1},
+    ]
+    failures = []
+
+    batch.bulk_update_item_quantities(updates, failures=failures)
+
+    assert [row_number for row_number, _, _ in failures] == [2, 4]
+
+
+def test_rejected_bulk_request_keeps_bulk_enabled():
+    with StandInAPI() as api:
+        api.seed_data(labs=1, storages_per_lab=1, sections_per_storage=1, items_per_section=3,
+                      movements_per_item=0)
+        client = CentralStorageClient(api.base_url)
+        client.login("admin", "admin123")
+        batch = BatchOperations(client)
+        item_ids = list(api.tables["items"])
+        failures = []
+
+        # A malformed row makes the server reject the whole request with 400
+        batch.bulk_update_item_quantities(
+            [{"item_id": item_ids[0], "quantity": 4}, {"item_id": item_ids[1], "quantity": "four"}],
+            failures=failures
+        )
+
+        assert batch.use_bulk
+        assert [row_number for row_number, _, _ in failures] == [1, 2]
+
+        updated = batch.bulk_update_item_quantities([{"item_id": item_id, "quantity": 5} for item_id in item_ids])
+
+        assert batch.use_bulk
+        assert len(updated) == len(item_ids)
@@ -0,0 +1,121 @@
+"""
+Hierarchy response cache of CentralStorageClient
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.cache import TTLCache
+
+from stand_in import StandInAPI
+
+
+@pytest.fixture
+def api():
+    with StandInAPI() as api:
+        api.seed_data(labs=1, storages_per_lab=1, sections_per_storage=2, items_per_section=1,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture
+def client(api):
+    client = CentralStorageClient(api.base_url, cache_ttl=60)
+    client.login("admin", "admin123")
+    return client
+
+
+def test_repeated_reads_are_served_from_the_cache(api, client):
+    section_id = next(iter(api.tables["sections"]))
+    before = api.request_count
+
+    first = client.get_section(section_id)
+    second = client.get_section(section_id)
+
+    assert second == first
+    assert api.request_count == before + 1
+    stats = client.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["ttl"] == 60
+
+
+def test_hierarchy_write_invalidates_cached_responses(api, client):
+    section_id, other_id = list(api.tables["sections"])[:2]
+    client.get_section(section_id)
+    client.get_section(other_id)
+
+    client.update_section(section_id, {"name": "Renamed"})
+
+    assert client.cache_stats()["size"] == 0
+    assert client.get_section(section_id).name == "Renamed"
+    assert client.cache_stats()["misses"] == 3
+
+
+def test_fetch_racing_an_invalidation_is_not_cached(api, client):
+    section_id = next(iter(api.tables["sections"]))
+    writer = threading.Thread(target=client.update_section, args=(section_id, {"name": "Renamed"}))
+
+    def write_while_in_flight(span):
+        # The GET's response has left the server but is not cached yet
+        if span.method == "GET" and writer.ident is None:
+            writer.start()
+            writer.join()
+
+    client.add_hook("after_receive", write_while_in_flight)
+    stale = client.get_section(section_id)
+    client.remove_hook("after_receive", write_while_in_flight)
+
+    assert stale.name != "Renamed"
+    assert client.cache_stats()["size"] == 0
+    assert client.get_section(section_id).name == "Renamed"
+    assert client.cache_stats()["size"] == 1
+
+
+def test_cache_disabled_by_default(api):
+    client = CentralStorageClient(api.base_url)
+    client.login("admin", "admin123")
+    section_id = next(iter(api.tables["sections"]))
+    before = api.request_count
+
+    client.get_section(section_id)
+    client.get_section(section_id)
+
+    assert client.cache_stats() == {}
+    assert api.request_count == before + 2
+
+
+def test_entries_expire_and_least_recently_used_is_evicted():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] = 10.5
+    assert cache.get("c") is None
+    assert cache.stats()["size"] == 1
+
+
+def test_set_skips_values_fetched_before_a_clear():
+    cache = TTLCache()
+    generation = cache.generation
+    cache.clear()
+
+    cache.set("key", "stale", generation)
+    assert cache.get("key") is None
+
+    cache.set("key", "fresh", cache.generation)
+    assert cache.get("key") == "fresh"
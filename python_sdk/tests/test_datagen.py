@@ -0,0 +1,59 @@
+"""
+Reproducibility of seeded test data
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.datagen import TestDataGenerator as DataGenerator
+
+from stand_in import StandInAPI
+
+
+def setup_rows(max_workers, latency):
+    """Items of a seeded setup_test_environment, each with the codes of its parents"""
+    with StandInAPI(latency=latency, jitter=latency, seed=max_workers) as api:
+        client = CentralStorageClient(api.base_url)
+        client.login("admin", "admin123")
+        with contextlib.redirect_stdout(io.StringIO()):
+            BatchOperations(client).setup_test_environment(3, 2, 2, 3, max_workers=max_workers, seed=7)
+        tables = api.tables
+        rows = []
+        for item in tables["items"].values():
+            section = tables["sections"][item["section_id"]]
+            storage = tables["storages"][section["storage_id"]]
+            lab = tables["laboratories"][storage["lab_id"]]
+            rows.append((lab["code"], storage["code"], section["code"], section["name"],
+                         item["code"], item["name"], item["price"], item["properties"]["batch_number"]))
+        return sorted(rows)
+
+
+def test_forks_do_not_depend_on_generation_order():
+    generator = DataGenerator(7)
+    first = list(generator.fork("items/0", {"ITM": 0, "BATCH": 0}).items([1], 3))
+    second = list(generator.fork("items/1", {"ITM": 3, "BATCH": 3}).items([2], 3))
+
+    generator = DataGenerator(7)
+    second_again = list(generator.fork("items/1", {"ITM": 3, "BATCH": 3}).items([2], 3))
+    first_again = list(generator.fork("items/0", {"ITM": 0, "BATCH": 0}).items([1], 3))
+
+    assert first == first_again
+    assert second == second_again
+    assert not {row["code"] for row in first} & {row["code"] for row in second}
+
+
+def test_seeded_setup_does_not_depend_on_completion_order():
+    sequential = setup_rows(max_workers=1, latency=0.0)
+    concurrent = setup_rows(max_workers=8, latency=0.003)
+
+    assert len(sequential) == 3 * 2 * 2 * 3
+    assert sequential == concurrent
+    assert len({row[4] for row in sequential}) == len(sequential)
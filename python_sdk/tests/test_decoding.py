@@ -0,0 +1,203 @@
+"""
+Compiled model decoders and slotted models
+"""
+
+import copy
+import dataclasses
+import pickle
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from central_storage_sdk.models import (
+    Item, Laboratory, Movement, Section, Storage, User,
+    _compile_decoder, decode_items_with_location, decode_model, decode_models, get_decoder
+)
+
+
+def lab_row(lab_id=1):
+    return {"id": lab_id, "code": f"LAB{lab_id}", "name": "Chemistry", "updated_at": "2026-01-01T00:00:00Z"}
+
+
+def storage_row(storage_id=2, lab=None):
+    return {"id": storage_id, "code": f"STG{storage_id}", "name": "Cabinet", "lab_id": 1,
+            "laboratory": lab if lab is not None else lab_row(), "updated_at": "2026-01-01T00:00:00Z"}
+
+
+def section_row(section_id=3, updated_at="2026-01-01T00:00:00Z", storage=None):
+    return {"id": section_id, "code": f"SEC{section_id}", "name": "Shelf A", "storage_id": 2,
+            "storage": storage if storage is not None else storage_row(), "updated_at": updated_at}
+
+
+def item_row(item_id, section=None, **fields):
+    row = {"id": item_id, "code": f"ITM{item_id}", "name": f"Item {item_id}", "category": "耗材",
+           "unit": "个", "quantity": 5, "section_id": 3, "properties": {"purity": "99%"},
+           "section": section if section is not None else section_row(),
+           "created_at": "2026-01-02T03:04:05.123456789+08:00", "updated_at": "2026-01-02T03:04:05Z"}
+    row.update(fields)
+    return row
+
+
+def test_nested_relations_become_models():
+    item = decode_model(Item, item_row(1))
+
+    assert isinstance(item.section, Section)
+    assert isinstance(item.section.storage, Storage)
+    assert isinstance(item.section.storage.laboratory, Laboratory)
+    assert item.section.storage.laboratory.code == "LAB1"
+    assert item.properties == {"purity": "99%"}
+
+
+def test_missing_relations_become_none_or_empty():
+    # Go serialises relations that were not preloaded as zero structs
+    zero_section = {"id": 0, "code": "", "storage": {"id": 0}}
+    item = decode_model(Item, item_row(1, section=zero_section, properties=None))
+    section = decode_model(Section, {"id": 3, "storage": None, "items": None})
+    storage = decode_model(Storage, {"id": 2})
+
+    assert item.section is None
+    assert item.properties == {}
+    assert section.storage is None
+    assert section.items == []
+    assert storage.laboratory is None and storage.sections == []
+
+
+def test_nested_lists_are_decoded():
+    lab = decode_model(Laboratory, {"id": 1, "storages": [{"id": 2, "sections": [{"id": 3}, {"id": 4}]}]})
+
+    assert [storage.id for storage in lab.storages] == [2]
+    assert [section.id for section in lab.storages[0].sections] == [3, 4]
+    assert all(isinstance(section, Section) for section in lab.storages[0].sections)
+
+
+def test_unknown_fields_are_dropped():
+    decode = _compile_decoder(Item, False)
+
+    item = decode({"id": 1, "name": "known"})
+    assert item.name == "known"
+
+    # The first unknown field switches the decoder to filtering every row
+    item = decode({"id": 2, "name": "new server", "deleted_at": None, "barcode": "123"})
+    assert (item.id, item.name) == (2, "new server")
+    assert not hasattr(item, "barcode")
+    assert decode({"id": 3, "name": "known"}).name == "known"
+
+
+def test_memo_shares_records_with_the_same_id_and_updated_at():
+    shared = section_row(3)
+    rows = [item_row(1, section=shared), item_row(2, section=dict(shared)),
+            item_row(3, section=section_row(3, updated_at="2026-02-01T00:00:00Z")),
+            item_row(4, section=section_row(4))]
+
+    items = decode_models(Item, rows)
+
+    assert items[0].section is items[1].section
+    assert items[0].section.storage is items[3].section.storage
+    # Same ID but a different updated_at is a different version of the record
+    assert items[2].section is not items[0].section
+    assert items[3].section is not items[0].section
+
+
+def test_without_memo_records_are_decoded_per_call():
+    first = decode_model(Item, item_row(1))
+    second = decode_model(Item, item_row(2))
+
+    assert first.section == second.section
+    assert first.section is not second.section
+
+
+def test_low_cardinality_strings_are_interned():
+    rows = [item_row(1, category="".join(["化学", "试剂"])), item_row(2, category="".join(["化学", "试剂"]))]
+    assert rows[0]["category"] is not rows[1]["category"]
+
+    items = decode_models(Item, rows)
+
+    assert items[0].category is items[1].category
+
+
+def test_decoders_are_compiled_once():
+    assert get_decoder(Item) is get_decoder(Item)
+    assert get_decoder(Item, parse_dates=True) is not get_decoder(Item)
+
+
+def test_dates_are_parsed_on_first_access():
+    item = decode_model(Item, item_row(1, updated_at="0001-01-01T00:00:00Z"), parse_dates=True)
+    plain = decode_model(Item, item_row(1))
+
+    assert item.created_at.microsecond == 123456
+    assert item.created_at.utcoffset().total_seconds() == 8 * 3600
+    assert item.updated_at is None
+    assert item.section.updated_at == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert plain.created_at == "2026-01-02T03:04:05.123456789+08:00"
+    user = decode_model(User, {"id": 1, "last_login": "2026-01-01T08:00:00Z"}, parse_dates=True)
+    assert user.last_login.hour == 8
+
+
+def test_movement_relations():
+    movement = decode_model(Movement, {"id": 9, "item": item_row(1), "user": {"id": 0}})
+
+    assert movement.item.section.code == "SEC3"
+    assert movement.user is None
+
+
+def test_items_with_location_reuse_the_item_section():
+    rows = [{"item": item_row(1), "section": section_row(3),
+             "location": {"lab_name": "Chemistry", "full_path": "Chemistry > Cabinet > Shelf A"}},
+            {"item": item_row(2, section={"id": 0}), "section": section_row(4), "location": {"full_path": ""}}]
+
+    first, second = decode_items_with_location(rows)
+
+    assert first.section is first.item.section
+    assert first.full_path == "Chemistry > Cabinet > Shelf A"
+    assert second.section.id == 4
+    assert second.location is None and second.full_path == ""
+
+
+def test_slotted_models_have_no_instance_dict():
+    item = decode_model(Item, item_row(1))
+
+    assert not hasattr(item, "__dict__")
+    assert "section" in Item.__slots__ and "id" not in Item.__slots__
+
+
+def test_pickle_round_trip():
+    for parse_dates in (False, True):
+        item = decode_model(Item, item_row(1), parse_dates=parse_dates)
+
+        restored = pickle.loads(pickle.dumps(item))
+
+        assert restored == item
+        assert restored.section.storage.laboratory == item.section.storage.laboratory
+
+
+def test_deepcopy_copies_nested_models():
+    item = decode_model(Item, item_row(1))
+
+    copied = copy.deepcopy(item)
+
+    assert copied == item
+    assert copied.section is not item.section
+    copied.properties["purity"] = "50%"
+    assert item.properties["purity"] == "99%"
+
+
+def test_replace_keeps_other_fields():
+    item = decode_model(Item, item_row(1), parse_dates=True)
+
+    renamed = dataclasses.replace(item, name="Renamed")
+
+    assert renamed.name == "Renamed"
+    assert renamed.section is item.section
+    assert renamed.created_at == item.created_at
+    assert isinstance(renamed.created_at, datetime)
+
+
+def test_asdict_converts_nested_models():
+    data = dataclasses.asdict(decode_model(Item, item_row(1)))
+
+    assert data["section"]["storage"]["laboratory"]["code"] == "LAB1"
+    assert data["section"]["items"] == []
+    assert data["created_at"] == "2026-01-02T03:04:05.123456789+08:00"
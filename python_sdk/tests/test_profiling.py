@@ -0,0 +1,71 @@
+"""
+BatchProfiler around threaded BatchOperations calls
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.datagen import TestDataGenerator as DataGenerator
+from central_storage_sdk.tracing import BatchProfiler, profiled
+
+from stand_in import StandInAPI
+
+
+@pytest.fixture
+def api():
+    with StandInAPI() as api:
+        api.seed_data(labs=1, storages_per_lab=1, sections_per_storage=2, items_per_section=10,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture
+def batch(api):
+    client = CentralStorageClient(api.base_url)
+    client.login("admin", "admin123")
+    return BatchOperations(client, max_workers=4)
+
+
+def run_with_timeout(func, seconds=30):
+    # A worker thread that dies while starting its profiler leaves the pool hanging
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.setdefault("result", func()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "profiled batch call did not finish"
+    return outcome["result"]
+
+
+def test_threaded_batch_call_under_batch_profiler(api, batch, tmp_path):
+    updates = [{"item_id": item_id, "quantity": 3} for item_id in api.tables["items"]]
+    profiler = BatchProfiler(tmp_path / "report.txt", memory=False)
+
+    def run():
+        with profiler:
+            return batch.bulk_update_item_quantities(updates, max_workers=4)
+
+    updated = run_with_timeout(run)
+
+    assert len(updated) == len(updates)
+    assert all(row["quantity"] == 3 for row in api.tables["items"].values())
+    assert "function calls" in (tmp_path / "report.txt").read_text(encoding="utf-8")
+
+
+def test_profiled_batch_writes_a_report(api, batch, tmp_path):
+    rows = list(DataGenerator(1).items(list(api.tables["sections"]), 4))
+    batch.use_bulk = False
+    wrapped = profiled(batch, tmp_path, memory=False)
+
+    created = run_with_timeout(lambda: wrapped.create_items_batch(rows, max_workers=4))
+
+    assert len(created) == len(rows)
+    assert wrapped.last_profiler.report_path.exists()
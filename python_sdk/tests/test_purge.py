@@ -0,0 +1,61 @@
+"""
+BatchOperations.delete_all_data against the stand-in server
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.batch import BatchOperations
+from central_storage_sdk.exceptions import NotFoundError
+
+from stand_in import StandInAPI
+
+
+@pytest.fixture
+def api():
+    with StandInAPI() as api:
+        api.seed_data(labs=2, storages_per_lab=2, sections_per_storage=2, items_per_section=3,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture
+def batch(api):
+    client = CentralStorageClient(api.base_url)
+    client.login("admin", "admin123")
+    return BatchOperations(client)
+
+
+def table_sizes(api):
+    return {name: len(api.tables[name]) for name in ("laboratories", "storages", "sections", "items")}
+
+
+@pytest.mark.parametrize("scope", [{"lab_id": 999999}, {"storage_id": 999999}])
+def test_unknown_scope_returns_failed_report(api, batch, scope):
+    before = table_sizes(api)
+
+    report = batch.delete_all_data(confirm=True, **scope)
+
+    assert not report
+    assert isinstance(report.error, NotFoundError)
+    assert report.total_deleted == 0
+    assert "Listing failed" in report.summary()
+    assert table_sizes(api) == before
+
+
+def test_laboratory_purge_deletes_only_its_subtree(api, batch):
+    lab_id = next(iter(api.tables["laboratories"]))
+
+    report = batch.delete_all_data(confirm=True, lab_id=lab_id)
+
+    assert report
+    assert report.error is None
+    assert report.deleted == {"items": 12, "sections": 4, "storages": 2, "laboratories": 1}
+    assert table_sizes(api) == {"laboratories": 1, "storages": 2, "sections": 4, "items": 12}
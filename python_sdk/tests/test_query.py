@@ -0,0 +1,103 @@
+"""
+ItemQueryEngine against the HTTP GET /items path of the stand-in server
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient, ItemQueryEngine
+from central_storage_sdk.models import PaginationParams
+
+from stand_in import StandInAPI
+
+QUERIES = [
+    pytest.param(PaginationParams(), {}, id="default-order"),
+    pytest.param(PaginationParams(page=3, page_size=7), {}, id="page-3"),
+    pytest.param(PaginationParams(page=2, page_size=500), {}, id="page-size-capped"),
+    pytest.param(PaginationParams(page=99), {}, id="past-the-end"),
+    pytest.param(PaginationParams(sort_by="name"), {}, id="name-ties"),
+    pytest.param(PaginationParams(sort_by="name", sort_desc=True, page=2), {}, id="name-desc"),
+    pytest.param(PaginationParams(sort_by="price", sort_desc=True), {}, id="price-desc"),
+    pytest.param(PaginationParams(sort_by="code", page=4, page_size=15), {}, id="code"),
+    pytest.param(PaginationParams(sort_by="category", page_size=100), {}, id="category"),
+    pytest.param(PaginationParams(sort_by="updated_at", sort_desc=True), {}, id="updated-desc"),
+    pytest.param(PaginationParams(sort_by="deleted_at"), {}, id="unknown-sort-field"),
+    pytest.param(PaginationParams(search="样品00"), {}, id="search"),
+    pytest.param(PaginationParams(search="itm"), {}, id="search-ascii-case"),
+    pytest.param(PaginationParams(search="样品0_1"), {}, id="search-underscore"),
+    pytest.param(PaginationParams(search="试剂%01"), {}, id="search-percent"),
+    pytest.param(PaginationParams(search="no such item"), {}, id="search-no-match"),
+    pytest.param(PaginationParams(sort_by="quantity"), {"low_stock": "true"}, id="low-stock"),
+    pytest.param(PaginationParams(), {"category": "耗材", "low_stock": "true"}, id="category-low-stock"),
+    pytest.param(PaginationParams(sort_by="code"), {"expiring": "true", "expiring_days": 400}, id="expiring"),
+    pytest.param(PaginationParams(), {"expiring": "true", "expiring_days": -5}, id="expiring-default-days"),
+    pytest.param(PaginationParams(search="样品", sort_by="price"), {"section": 2, "category": "化学试剂"},
+                 id="section-category-search"),
+    pytest.param(PaginationParams(page_size=100), {"section": 0}, id="section"),
+]
+
+
+@pytest.fixture(scope="module")
+def api():
+    with StandInAPI() as api:
+        api.seed_data(labs=2, storages_per_lab=2, sections_per_storage=3, items_per_section=25,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture(scope="module")
+def client(api):
+    client = CentralStorageClient(api.base_url)
+    client.login("admin", "admin123")
+    return client
+
+
+@pytest.fixture(scope="module")
+def engine(client):
+    return ItemQueryEngine.from_client(client)
+
+
+def resolve(api, filters):
+    # "section": n stands for the n-th section's ID
+    filters = dict(filters)
+    if "section" in filters:
+        filters["section_id"] = sorted(api.tables["sections"])[filters.pop("section")]
+    return filters
+
+
+@pytest.mark.parametrize("params, filters", QUERIES)
+def test_engine_matches_http(api, client, engine, params, filters):
+    filters = resolve(api, filters)
+
+    remote = client.get_items(params, **filters)
+    local = engine.get_items(params, **filters)
+
+    assert [item.id for item in local.data] == [item.id for item in remote.data]
+    assert local.data == remote.data
+    assert ((local.total, local.page, local.page_size, local.total_pages, local.has_next, local.has_prev) ==
+            (remote.total, remote.page, remote.page_size, remote.total_pages, remote.has_next, remote.has_prev))
+
+
+@pytest.mark.parametrize("params, filters", QUERIES[10:])
+def test_query_returns_every_page(api, client, engine, params, filters):
+    filters = resolve(api, filters)
+    remote = []
+    page = 1
+    while True:
+        response = client.get_items(PaginationParams(page=page, page_size=100, search=params.search,
+                                                     sort_by=params.sort_by, sort_desc=params.sort_desc),
+                                    **filters)
+        remote.extend(item.id for item in response.data)
+        if not response.has_next:
+            break
+        page += 1
+
+    local = engine.query(params.search, params.sort_by, params.sort_desc, **filters)
+
+    assert [item.id for item in local] == remote
@@ -0,0 +1,156 @@
+"""
+Coalescing of concurrent identical GET requests
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from central_storage_sdk import CentralStorageClient
+from central_storage_sdk.exceptions import NotFoundError
+from central_storage_sdk.models import PaginationParams
+
+from stand_in import StandInAPI
+
+WAITERS = 5
+
+
+@pytest.fixture
+def api():
+    with StandInAPI() as api:
+        api.seed_data(labs=1, storages_per_lab=1, sections_per_storage=1, items_per_section=30,
+                      movements_per_item=0)
+        yield api
+
+
+@pytest.fixture
+def client(api):
+    client = CentralStorageClient(api.base_url)
+    client.login("admin", "admin123")
+    return client
+
+
+def hold_first_request(client, until, timeout=5.0):
+    """Keep the first request sent in flight until until() is true"""
+    lock = threading.Lock()
+    held = threading.Event()
+
+    def hook(span):
+        with lock:
+            if held.is_set():
+                return
+            held.set()
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            time.sleep(0.002)
+
+    client.add_hook("before_send", hook)
+    return held
+
+
+def followers_waiting(client, count):
+    return lambda: client.singleflight.stats()["shared"] >= count
+
+
+def run_concurrently(funcs, timeout=10.0):
+    """Run each function on its own thread; returns ("ok", result) or ("error", exception) per function"""
+    outcomes = [None] * len(funcs)
+
+    def run(index, func):
+        try:
+            outcomes[index] = ("ok", func())
+        except Exception as e:
+            outcomes[index] = ("error", e)
+
+    threads = [threading.Thread(target=run, args=(index, func)) for index, func in enumerate(funcs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+    assert not any(thread.is_alive() for thread in threads)
+    return outcomes
+
+
+def test_concurrent_identical_gets_make_one_request(api, client):
+    hold_first_request(client, followers_waiting(client, WAITERS - 1))
+    before = api.request_count
+
+    outcomes = run_concurrently([client.get_items] * WAITERS)
+
+    assert api.request_count == before + 1
+    assert all(status == "ok" for status, _ in outcomes)
+    assert all(result.data == outcomes[0][1].data for _, result in outcomes)
+    assert client.singleflight.stats() == {"executed": 1, "shared": WAITERS - 1, "in_flight": 0}
+
+
+def test_different_params_are_not_merged(api, client):
+    second_done = threading.Event()
+    hold_first_request(client, second_done.is_set)
+    before = api.request_count
+
+    def second_page():
+        try:
+            return client.get_items(PaginationParams(page=2, page_size=10))
+        finally:
+            second_done.set()
+
+    def first_page():
+        return client.get_items(PaginationParams(page=1, page_size=10))
+
+    outcomes = run_concurrently([first_page, second_page])
+
+    assert api.request_count == before + 2
+    first, second = (result for _, result in outcomes)
+    assert (first.page, second.page) == (1, 2)
+    assert {item.id for item in first.data}.isdisjoint(item.id for item in second.data)
+    assert client.singleflight.stats()["shared"] == 0
+
+
+def test_different_tokens_are_not_merged(api, client):
+    other_done = threading.Event()
+    held = hold_first_request(client, other_done.is_set)
+    before = api.request_count
+
+    leader = threading.Thread(target=client.get_items)
+    leader.start()
+    assert held.wait(5)
+
+    # Same URL and params while the first request is in flight, but another token:
+    # this request must not wait for the held one
+    client.set_token("another-token")
+    outcomes = run_concurrently([client.get_items])
+    other_done.set()
+    leader.join(10)
+
+    assert outcomes[0][0] == "ok"
+    assert api.request_count == before + 2
+    assert client.singleflight.stats()["shared"] == 0
+
+
+def test_errors_reach_every_waiter(api, client):
+    hold_first_request(client, followers_waiting(client, WAITERS - 1))
+    before = api.request_count
+
+    outcomes = run_concurrently([lambda: client.get_item(999999)] * WAITERS)
+
+    assert api.request_count == before + 1
+    assert all(status == "error" and isinstance(error, NotFoundError) for status, error in outcomes)
+    assert client.singleflight.stats()["in_flight"] == 0
+
+
+def test_coalescing_can_be_disabled(api):
+    client = CentralStorageClient(api.base_url, coalesce_gets=False)
+    client.login("admin", "admin123")
+    before = api.request_count
+
+    run_concurrently([client.get_items] * WAITERS)
+
+    assert client.singleflight is None
+    assert api.request_count == before + WAITERS